@@ -3,13 +3,45 @@
 
 모든 Agent가 상속받는 베이스 클래스입니다.
 """
-from langchain_teddynote import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from langchain_openai import ChatOpenAI
+from typing import List, Dict, Any, Optional, Sequence, AsyncIterator, Union, Callable, Awaitable
+import asyncio
+import time
+import openai
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableLambda
+from agents.llm_backends import create_chat_model
+from agents.model_router import MODEL_PRICES, ModelRouter, ModelTier
 from config.settings import settings
+from utils.metrics import record_token_usage, span
+from utils.outbound import OutboundClient, deadline_remaining
+
+_tracing_configured = False
+
+
+def configure_tracing() -> bool:
+    """
+    LangSmith 추적 설정 (``LANGSMITH_TRACING=True`` 일 때만)
+    
+    ``langchain_teddynote`` 는 import 비용이 커서 모듈 로드 시점이 아니라
+    서버 시작 시 필요한 경우에만 불러옵니다.
+    
+    Returns:
+        추적 활성화 여부
+    """
+    global _tracing_configured
+    if not settings.LANGSMITH_TRACING:
+        return False
+    if not _tracing_configured:
+        try:
+            from langchain_teddynote import logging
+        except ImportError:
+            print("⚠️ LANGSMITH_TRACING=True 이지만 langchain_teddynote 가 설치되어 있지 않습니다.")
+            return False
+        logging.langsmith(settings.LANGSMITH_PROJECT)
+        _tracing_configured = True
+    return True
 
-logging.langsmith("everywhere-guide")
 
 class BaseAgent(ABC):
     """
@@ -18,20 +50,162 @@ class BaseAgent(ABC):
     모든 Agent는 이 클래스를 상속받아 구현합니다.
     """
     
-    def __init__(self, model_name: str = "gpt-4o-mini", temperature: float = 0.7):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        router: Optional[ModelRouter] = None,
+        outbound: Optional[OutboundClient] = None
+    ):
         """
         Agent 초기화
         
         Args:
-            model_name: 사용할 LLM 모델 이름
-            temperature: 생성 온도 (0.0 ~ 1.0)
+            model_name: 사용할 LLM 모델 이름 (지정하면 티어 라우팅 없이 이 모델만 사용)
+            temperature: 생성 온도 (기본: settings.MODEL_TEMPERATURE)
+            max_concurrency: 동시 LLM 호출 제한 (기본: settings.AGENT_MAX_CONCURRENCY)
+            router: 모델 티어 라우터 (기본: settings.MODEL_TIERS 로 생성)
+            outbound: LLM 호출 재시도/서킷 브레이커 (기본: settings.LLM_* 로 생성)
         """
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=temperature,
-            api_key=settings.OPENAI_API_KEY
-        )
+        self.router = router or self._create_router(model_name, temperature)
+        self.outbound = outbound or OutboundClient.from_settings()
         self.tools = self._initialize_tools()
+        self.max_concurrency = max_concurrency or settings.AGENT_MAX_CONCURRENCY
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+    
+    def _create_llm(self, model_name: str, temperature: float):
+        """모델 이름으로 Chat 모델 생성 (백엔드는 settings.LLM_BACKEND)"""
+        return create_chat_model(model_name, temperature)
+    
+    def _create_router(self, model_name: Optional[str], temperature: Optional[float]) -> ModelRouter:
+        """설정(MODEL_TIERS 등)으로 모델 티어 라우터 생성"""
+        temperature = settings.MODEL_TEMPERATURE if temperature is None else temperature
+        if model_name:
+            models = [model_name]
+        elif settings.MODEL_ROUTING_ENABLED:
+            models = settings.model_tiers_list
+        else:
+            models = settings.model_tiers_list[:1]
+        
+        tiers = [
+            ModelTier(model, self._create_llm(model, temperature), *MODEL_PRICES.get(model, (0.0, 0.0)))
+            for model in models
+        ]
+        return ModelRouter(
+            tiers,
+            complexity_threshold=settings.MODEL_ROUTER_COMPLEXITY_THRESHOLD,
+            long_request_chars=settings.MODEL_ROUTER_LONG_REQUEST_CHARS
+        )
+    
+    @property
+    def llm(self):
+        """현재 실행 중인 티어의 LLM (라우팅 구간 밖에서는 첫 번째 티어)"""
+        return self.router.active_llm
+    
+    @llm.setter
+    def llm(self, llm):
+        """LLM을 직접 지정하면 티어 하나짜리 라우터로 바꿉니다. (테스트/벤치마크용)"""
+        self.router = ModelRouter.single(llm)
+    
+    @property
+    def llm_semaphore(self) -> asyncio.Semaphore:
+        """
+        LLM 호출 동시성 제한용 세마포어
+        
+        이벤트 루프 안에서 처음 사용할 때 생성합니다.
+        """
+        if self._llm_semaphore is None:
+            self._llm_semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._llm_semaphore
+    
+    async def _ainvoke_llm(self, llm, messages: Sequence[BaseMessage]) -> BaseMessage:
+        """
+        LLM을 비동기로 호출합니다.
+        
+        이벤트 루프를 막지 않도록 항상 ``ainvoke``를 사용하고,
+        워커당 동시 호출 수를 세마포어로 제한합니다.
+        요청 마감 시간, 재시도, 서킷 브레이커는 ``self.outbound`` 가 적용합니다.
+        
+        Args:
+            llm: 호출할 Runnable (ChatModel 또는 바인딩된 모델)
+            messages: 입력 메시지
+        
+        Returns:
+            LLM 응답 메시지
+        """
+        semaphore = self.llm_semaphore
+        with span("llm_wait"):
+            await semaphore.acquire()
+        try:
+            with span("llm_call"):
+                response = await self.outbound.call(lambda: llm.ainvoke(messages))
+        finally:
+            semaphore.release()
+        
+        self.router.record_usage(record_token_usage(response))
+        return response
+    
+    async def _astream_llm(self, llm, messages: Sequence[BaseMessage]) -> AsyncIterator[BaseMessage]:
+        """
+        LLM 응답을 토큰 청크 단위로 스트리밍합니다.
+        
+        스트림이 끝날 때까지 동시성 슬롯 하나를 점유합니다.
+        첫 청크를 받기 전의 실패만 재시도합니다.
+        
+        Args:
+            llm: 호출할 Runnable
+            messages: 입력 메시지
+        
+        Yields:
+            응답 메시지 청크
+        """
+        async with self.llm_semaphore:
+            with span("llm_stream"):
+                async for chunk in self.outbound.stream(lambda: llm.astream(messages)):
+                    # 사용량은 스트림 마지막 청크에만 실려 옵니다.
+                    if getattr(chunk, "usage_metadata", None):
+                        self.router.record_usage(record_token_usage(chunk))
+                    yield chunk
+    
+    async def warmup(self) -> Dict[str, float]:
+        """
+        첫 요청 전에 필요한 준비 작업을 미리 수행합니다. (서버 시작 시 호출)
+        
+        기본 구현은 동시성 세마포어를 만들고 LLM API와의 HTTP 연결을 미리 열어 둡니다.
+        
+        Returns:
+            단계별 소요 시간 (ms)
+        """
+        timings: Dict[str, float] = {}
+        self.llm_semaphore
+        if settings.AGENT_WARMUP_CONNECT:
+            start = time.perf_counter()
+            await asyncio.gather(*(self._warm_connection(tier.llm) for tier in self.router.tiers))
+            timings["connectionMs"] = round((time.perf_counter() - start) * 1000, 3)
+        return timings
+    
+    async def _warm_connection(self, llm) -> bool:
+        """
+        LLM 클라이언트의 연결 풀에 연결을 하나 만들어 둡니다.
+        
+        가벼운 모델 목록 조회로 TCP/TLS 핸드셰이크를 시작 시점에 끝내 둡니다.
+        인증 오류 같은 HTTP 응답도 연결은 성립된 것이므로 성공으로 봅니다.
+        
+        Returns:
+            연결 성공 여부
+        """
+        client = getattr(llm, "root_async_client", None)
+        if client is None:
+            return False
+        try:
+            await asyncio.wait_for(client.models.list(), timeout=settings.AGENT_WARMUP_TIMEOUT)
+        except openai.APIStatusError:
+            return True
+        except Exception as e:
+            print(f"⚠️ LLM 연결 워밍업 실패: {e!r}")
+            return False
+        return True
     
     @abstractmethod
     def _initialize_tools(self) -> List:
@@ -56,6 +230,88 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def _run_routed(
+        self,
+        input_data: Dict[str, Any],
+        run_once: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        모델 티어를 골라 실행하고, 결과가 조건을 통과하지 못하면 다음 티어로 다시 실행합니다.
+        
+        시작 티어는 요청 복잡도로 정하고, ``_escalation_reason`` 이 사유를 돌려줄 때만
+        (요청 마감 시간이 남아 있으면) 한 단계씩 올립니다. 시도별 티어, 지연 시간, 토큰, 비용은 ``metadata.routing`` 에 기록됩니다.
+        
+        Args:
+            input_data: 입력 데이터
+            run_once: 현재 티어로 한 번 실행하는 함수
+        
+        Returns:
+            마지막 시도의 실행 결과
+        """
+        tier = initial_tier = self.router.select(input_data)
+        attempts = []
+        while True:
+            with self.router.activate(tier) as attempt:
+                start = time.perf_counter()
+                try:
+                    result = await run_once(input_data)
+                finally:
+                    attempts.append(self.router.record_run(attempt, time.perf_counter() - start))
+            
+            reason = self._escalation_reason(input_data, result)
+            next_tier = self.router.next_tier(tier) if reason else None
+            remaining = deadline_remaining()
+            if next_tier is None or (remaining is not None and remaining <= 0):
+                # 마감 시간이 지났으면 상향하지 않고 지금 결과를 반환
+                break
+            self.router.record_escalation(tier, next_tier, reason)
+            attempts[-1]["escalation"] = reason
+            tier = next_tier
+        
+        result.setdefault("metadata", {})["routing"] = {
+            "initialTier": self.router.tiers[initial_tier].name,
+            "tier": self.router.tiers[tier].name,
+            "complexity": self.router.complexity(input_data),
+            "attempts": attempts,
+        }
+        return result
+    
+    def _escalation_reason(self, input_data: Dict[str, Any], result: Dict[str, Any]) -> Optional[str]:
+        """
+        결과를 더 큰 모델로 다시 만들어야 하는 사유 (없으면 None)
+        
+        기본 구현은 항상 None이며, 하위 Agent가 검증/예산 조건을 정의합니다.
+        """
+        return None
+    
+    async def run_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        여러 입력을 동시성 제한 하에 일괄 실행합니다.
+        
+        LangChain Runnable의 ``abatch`` 를 사용하며, 결과는 입력 순서와 같습니다.
+        실패한 항목은 예외 객체가 그 자리에 들어갑니다.
+        
+        Args:
+            inputs: 입력 데이터 리스트
+            max_concurrency: 동시에 실행할 최대 개수 (기본: self.max_concurrency)
+        
+        Returns:
+            항목별 실행 결과 또는 예외
+        """
+        if not inputs:
+            return []
+        
+        runnable = RunnableLambda(self.run, name=f"{type(self).__name__}.run")
+        return await runnable.abatch(
+            inputs,
+            config={"max_concurrency": max_concurrency or self.max_concurrency},
+            return_exceptions=True
+        )
+    
     def _create_system_prompt(self) -> str:
         """
         시스템 프롬프트를 생성합니다.
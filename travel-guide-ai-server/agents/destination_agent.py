@@ -5,94 +5,415 @@
 LangGraph를 사용하여 구조화된 추론 과정을 거칩니다.
 """
 
-from typing import TypedDict, Annotated, Sequence, Literal, Any
+from typing import TypedDict, Annotated, Sequence, Literal, Any, AsyncIterator, Optional
 from datetime import datetime
+import asyncio
+import json
 import operator
-from langchain_core.messages import BaseMessage, HumanMessage
+import time
+from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage
 from langgraph.graph import StateGraph, END
 
 from langchain_core.output_parsers import JsonOutputParser
+from agents.base_agent import BaseAgent
 from models.schemas import DestinationInfo
-from pydantic import BaseModel, Field
+from agents.precompute import CostedCandidate, PrecomputeResult, precompute_candidates
+from agents.structured_output import FINAL_ANSWER_TOOL, extract_items, validate_destinations
+from agents.wire_schema import WIRE_LIST_KEY, WIRE_OUTPUT_FORMAT, WireDestinationList, expand_item, expand_items
+from config.settings import settings
+from tools.catalog import get_catalog
+from tools.climate import get_climate_store
+from utils.helpers import estimate_tokens
+from utils.json_stream import IncrementalArrayParser
+from utils.metrics import metrics, span, timed
+from utils.outbound import CircuitOpenError, DeadlineExceeded
+from tools.search_tool import search_destinations, get_destination_details
+from tools.price_tool import get_flight_price, get_accommodation_price, calculate_total_budget
+from tools.weather_tool import get_weather_forecast, check_seasonal_events
+from pydantic import BaseModel, Field, ValidationError
 from typing import List
 
 class DestinationList(BaseModel):
+    """추천 여행지 목록 (구조화 출력 모드에서 최종 결과 제출용 Tool 스키마)"""
     destinations: List[DestinationInfo] = Field(description="List of recommended destinations")
 
 
 
+# 추천 여행지 수, 여행지당 팁 수 (요청의 topK / maxTipsPerDestination 기본값)
+DEFAULT_TOP_N = 5
+DEFAULT_MAX_TIPS = 3
+
+# 서버 시작 시 프롬프트/사전 계산 경로를 한 번 실행해 볼 입력
+WARMUP_INPUT = {
+    "startDate": "2025-05-01",
+    "endDate": "2025-05-05",
+    "budget": 2000000,
+    "isBudgetUndecided": False,
+    "numberOfPeople": 2,
+    "travelStyle": "beach",
+    "companion": "친구",
+    "customRequest": None,
+}
+
+SYSTEM_PROMPT_TEMPLATE = """당신은 전문 여행 컨설턴트 AI입니다.
+
+**역할:**
+사용자의 선호도를 바탕으로 최적의 여행지를 추천하고, 
+구체적인 비용 breakdown과 여행 팁을 제공합니다.
+
+**추천 프로세스:**
+1. 사용자의 여행 스타일에 맞는 여행지 검색
+2. 각 여행지의 항공료, 숙박비 추정
+3. 총 예산 계산
+4. 사용자 예산과 비교하여 적합한 여행지 필터링
+5. 날씨 정보 및 시즌 이벤트 확인
+6. 요청한 개수만큼 상위 여행지 선정 및 추천
+
+**도구 사용:**
+- search_destinations, get_flight_price, get_accommodation_price, calculate_total_budget,
+  get_weather_forecast, check_seasonal_events 도구가 제공되면 반드시 도구로 조회한 값을 사용하세요
+- 여러 여행지의 가격/날씨는 한 번의 응답에서 도구를 여러 개 동시에 호출해 조회하세요
+- 도구 결과를 모두 확인한 뒤에는 도구 호출 없이 최종 JSON만 출력하세요
+
+{output_format}**중요:**
+- 반드시 사용자 예산 내에서 추천
+- 당신의 풍부한 여행 지식을 바탕으로 정확한 정보 제공
+- 추천 이유는 구체적이고 설득력 있게 작성
+"""
+
+# 전체 형식(AGENT_WIRE_FORMAT=full)의 출력 필드 설명
+OUTPUT_FIELDS_PROMPT = """**출력 형식:**
+각 추천 여행지에 대해 다음 정보를 JSON 형식으로 제공:
+- name: 여행지 이름
+- country: 국가
+- estimatedCost: 예상 총 비용
+- flightCost: 항공료
+- accommodationCost: 숙박비
+- highlights: 주요 명소 리스트
+- reason: 추천 이유 (구체적으로)
+- bestSeason: 최적 시즌
+- weather: 예상 날씨
+- tips: 여행 팁 리스트
+
+"""
+
+# 프롬프트는 정적 접두부(system)를 먼저, 요청별 값(user)을 뒤에 둡니다.
+# 접두부가 매 요청 동일해야 provider 측 prompt caching이 적용됩니다.
+STATIC_PROMPT_TEMPLATE = """{system_prompt}
+**요구사항:**
+1. 사용자 여행 스타일과 동행자 유형에 맞는 여행지를 검색하세요
+2. 각 여행지의 항공료, 숙박비를 조회하세요
+3. 총 예산을 계산하고 사용자 예산과 비교하세요 (예산이 미정인 경우 다양한 가격대를 제안하세요)
+4. 조건에 맞는 여행지 중 요청한 개수만큼 상위 여행지를 선정하세요
+5. 각 여행지의 날씨와 이벤트 정보를 확인하세요
+6. 아래 방식으로 결과를 반환하세요
+
+{output_instructions}
+"""
+
+# 출력 모드별 결과 반환 방식 (text는 JSON 스키마 또는 압축 형식 설명을 붙여 넣음)
+TEXT_OUTPUT_INSTRUCTIONS = """**JSON 스키마:**
+{format_instructions}"""
+
+COMPACT_TEXT_OUTPUT_INSTRUCTIONS = f"""{WIRE_OUTPUT_FORMAT}
+JSON 외의 텍스트는 쓰지 마세요."""
+
+STRUCTURED_OUTPUT_INSTRUCTIONS = f"""**결과 제출:**
+조회가 끝나면 텍스트로 답하지 말고 `{FINAL_ANSWER_TOOL}` 도구를 한 번 호출해 추천 여행지 목록을 제출하세요."""
+
+COMPACT_STRUCTURED_OUTPUT_INSTRUCTIONS = f"""{STRUCTURED_OUTPUT_INSTRUCTIONS}
+{WIRE_OUTPUT_FORMAT}"""
+
+REPAIR_SYSTEM_PROMPT = """당신은 JSON 교정기입니다.
+여행지 항목과 검증 오류가 주어집니다. 내용은 그대로 두고 형식만 고쳐서
+아래 스키마를 만족하는 항목들을 {{"destinations": [...]}} JSON으로만 답하세요.
+
+{schema}"""
+
+USER_PROMPT_TEMPLATE = """다음 조건에 맞는 여행지를 추천해주세요:
+
+**여행 정보:**
+- 여행 기간: {startDate} ~ {endDate} ({days}일)
+- 예산: {budget}
+- 인원: {numberOfPeople}명
+- 동행자: {companion}
+- 여행 스타일: {travelStyle}
+- 추가 요청사항: {customRequest}
+
+**추천 개수:** 여행지 {topK}곳, 여행지당 팁 {maxTips}개
+
+당신의 지식을 바탕으로 최고의 여행지를 추천해주세요!"""
+
+ENRICHMENT_SYSTEM_PROMPT = """당신은 전문 여행 컨설턴트 AI입니다.
+후보 여행지와 비용은 이미 계산되어 있습니다. 비용을 다시 계산하지 말고,
+사용자 조건에 맞춰 각 후보의 구체적인 추천 이유와 실용적인 여행 팁만 작성하세요.
+
+각 후보의 추천 이유와 요청한 개수의 팁을 작성해 JSON으로만 답하세요:
+{"items": [{"id": 1, "reason": "추천 이유", "tips": ["팁1", "팁2", "팁3"]}]}"""
+
+ITEM_ENRICHMENT_SYSTEM_PROMPT = """당신은 전문 여행 컨설턴트 AI입니다.
+여행지와 비용은 이미 정해져 있습니다. 비용을 다시 계산하지 말고,
+사용자 조건에 맞춰 이 여행지의 추천 이유, 조건에 맞는 명소 3개, 요청한 개수의 실용적인 여행 팁만 작성하세요.
+
+JSON으로만 답하세요:
+{"reason": "추천 이유", "highlights": ["명소1", "명소2", "명소3"], "tips": ["팁1", "팁2", "팁3"]}"""
+
+
 class AgentState(TypedDict):
     """Agent 상태 정의"""
     messages: Annotated[Sequence[BaseMessage], operator.add]
+    iterations: int  # 실행된 Tool 라운드 수
+    tool_timings: Annotated[list, operator.add]
 
 
 class DestinationAgent(BaseAgent):
     """
     여행지 추천 Agent (StateGraph 기반)
+    
+    agent 노드가 Tool 호출을 요청하면 tools 노드에서 실행한 뒤 다시 agent로 돌아갑니다.
+    한 턴에 여러 Tool 호출이 오면 동시에 실행하며, 라운드 수는 ``max_tool_iterations`` 로 제한합니다.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_tool_iterations: Optional[int] = None,
+        strategy: Optional[str] = None,
+        output_mode: Optional[str] = None,
+        wire_format: Optional[str] = None,
+        **kwargs
+    ):
         """Agent 초기화"""
-        super().__init__()
+        super().__init__(**kwargs)
+        self.strategy = strategy or settings.AGENT_STRATEGY
+        self.output_mode = output_mode or settings.AGENT_OUTPUT_MODE
+        self.wire_format = wire_format or settings.AGENT_WIRE_FORMAT
+        self._list_keys = (WIRE_LIST_KEY, "destinations") if self.wire_format == "compact" else ("destinations",)
+        self._enrichment_parser = JsonOutputParser()
+        self.max_tool_iterations = (
+            settings.AGENT_MAX_TOOL_ITERATIONS if max_tool_iterations is None else max_tool_iterations
+        )
+        self.tools_by_name = {tool.name: tool for tool in self.tools}
+        self._bound_llms: dict[int, tuple] = {}
+        
+        # 요청마다 같은 결과가 나오는 Parser/프롬프트는 한 번만 생성
+        self._parser = JsonOutputParser(pydantic_object=DestinationList)
+        self._format_instructions = self._parser.get_format_instructions()
+        self._system_prompt = self._create_system_prompt()
+        # 모든 요청이 글자 하나 다르지 않게 공유하는 접두부 (provider 측 prompt caching 대상)
+        if self.wire_format == "compact":
+            output_instructions = {
+                "text": COMPACT_TEXT_OUTPUT_INSTRUCTIONS,
+                "structured": COMPACT_STRUCTURED_OUTPUT_INSTRUCTIONS,
+            }
+        else:
+            output_instructions = {
+                "text": TEXT_OUTPUT_INSTRUCTIONS.format(format_instructions=self._format_instructions),
+                "structured": STRUCTURED_OUTPUT_INSTRUCTIONS,
+            }
+        self._static_prompts = {
+            mode: STATIC_PROMPT_TEMPLATE.format(system_prompt=self._system_prompt, output_instructions=text)
+            for mode, text in output_instructions.items()
+        }
+        self._repair_prompt = REPAIR_SYSTEM_PROMPT.format(
+            schema=json.dumps(DestinationInfo.model_json_schema(), ensure_ascii=False)
+        )
         
         # Graph 정의
         workflow = StateGraph(AgentState)
         
         # Node 추가
         workflow.add_node("agent", self.call_model)
+        workflow.add_node("tools", self.call_tools)
         
         # Edge 정의
         workflow.set_entry_point("agent")
-        workflow.add_edge("agent", END)
+        workflow.add_conditional_edges(
+            "agent",
+            self.should_continue,
+            {"tools": "tools", "end": END}
+        )
+        workflow.add_edge("tools", "agent")
         
         # 컴파일
         self.app = workflow.compile()
     
-
+    def _initialize_tools(self) -> List:
+        """Agent가 사용할 Tools"""
+        return [
+            search_destinations,
+            get_destination_details,
+            get_flight_price,
+            get_accommodation_price,
+            calculate_total_budget,
+            get_weather_forecast,
+            check_seasonal_events,
+        ]
     
-    def call_model(self, state: AgentState):
-        """LLM 호출 Node"""
+    def _tool_bound_llms(self, llm) -> tuple:
+        """
+        Tool이 바인딩된 LLM 쌍을 반환합니다.
+        
+        구조화 출력 모드에서는 ``DestinationList`` 스키마를 최종 결과 제출용 Tool로 함께 바인딩하고,
+        반복 한도에 도달하면 그 Tool 호출을 강제합니다. 두 LLM의 Tool 목록이 같아야
+        provider 측 prompt caching 접두부가 유지됩니다.
+        
+        Returns:
+            (Tool 호출 가능 LLM, 최종 답변용 LLM)
+            Tool 바인딩을 지원하지 않는 모델이면 둘 다 원래 LLM입니다.
+        """
+        cached = self._bound_llms.get(id(llm))
+        if cached is not None and cached[0] is llm:
+            return cached[1], cached[2]
+        
+        try:
+            if self.output_mode == "structured":
+                tools = [*self.tools, self._final_answer_tool()]
+                with_tools = llm.bind_tools(tools)
+                without_tools = llm.bind_tools(tools, tool_choice=FINAL_ANSWER_TOOL)
+            else:
+                with_tools = llm.bind_tools(self.tools)
+                # 반복 한도에 도달하면 Tool 호출 없이 최종 답변만 하도록 강제
+                without_tools = llm.bind_tools(self.tools, tool_choice="none")
+        except NotImplementedError:
+            with_tools = without_tools = llm
+        
+        self._bound_llms[id(llm)] = (llm, with_tools, without_tools)
+        return with_tools, without_tools
+    
+    def _final_answer_tool(self) -> Any:
+        """최종 결과 제출 Tool (압축 형식이면 같은 이름에 ``WireDestinationList`` 스키마)"""
+        if self.wire_format != "compact":
+            return DestinationList
+        return {
+            "type": "function",
+            "function": {
+                "name": FINAL_ANSWER_TOOL,
+                "description": "추천 여행지 목록 제출 (압축 형식)",
+                "parameters": WireDestinationList.model_json_schema(),
+            },
+        }
+    
+    async def call_model(self, state: AgentState):
+        """LLM 호출 Node (비동기)"""
         messages = state['messages']
-        response = self.llm.invoke(messages)
+        with_tools, without_tools = self._tool_bound_llms(self.llm)
+        
+        if state.get("iterations", 0) < self.max_tool_iterations:
+            llm = with_tools
+        else:
+            llm = without_tools
+        
+        response = await self._ainvoke_llm(llm, messages)
         return {"messages": [response]}
+    
+    def should_continue(self, state: AgentState) -> Literal["tools", "end"]:
+        """
+        마지막 응답에 (최종 결과 제출 외의) Tool 호출이 있고 반복 한도 이내면 tools 노드로 이동
+        """
+        last_message = state['messages'][-1]
+        tool_calls = [
+            call for call in getattr(last_message, "tool_calls", None) or []
+            if call["name"] != FINAL_ANSWER_TOOL
+        ]
+        
+        if tool_calls and state.get("iterations", 0) < self.max_tool_iterations:
+            return "tools"
+        return "end"
+    
+    async def call_tools(self, state: AgentState):
+        """
+        Tool 실행 Node
+        
+        마지막 응답의 Tool 호출을 모두 동시에 실행합니다.
+        """
+        tool_calls = state['messages'][-1].tool_calls
+        results = await asyncio.gather(*(self._run_tool_call(call) for call in tool_calls))
+        
+        return {
+            "messages": [message for message, _ in results],
+            "iterations": state.get("iterations", 0) + 1,
+            "tool_timings": [timing for _, timing in results]
+        }
+    
+    async def _run_tool_call(self, tool_call: dict) -> tuple[ToolMessage, dict]:
+        """Tool 호출 하나를 실행하고 (결과 메시지, 소요 시간 정보)를 반환"""
+        name = tool_call["name"]
+        tool = self.tools_by_name.get(name)
+        start = time.perf_counter()
+        
+        if name == FINAL_ANSWER_TOOL:
+            # 조회 Tool과 함께 호출된 최종 결과는 조회 결과를 본 뒤 다시 제출하도록 안내
+            output = {"status": "ignored", "message": "조회 결과를 확인한 뒤 최종 결과를 다시 제출하세요."}
+            status = "skipped"
+        elif tool is None:
+            output = {"error": f"알 수 없는 Tool입니다: {name}"}
+            status = "error"
+        else:
+            try:
+                # 동기 Tool은 ainvoke가 스레드 풀에서 실행하므로 서로 겹쳐 실행됩니다.
+                output = await tool.ainvoke(tool_call["args"])
+                status = "ok"
+            except Exception as e:
+                output = {"error": str(e)}
+                status = "error"
+        
+        elapsed = time.perf_counter() - start
+        message = ToolMessage(
+            content=json.dumps(output, ensure_ascii=False, default=str),
+            tool_call_id=tool_call["id"],
+            name=name
+        )
+        timing = {
+            "tool": name,
+            "args": tool_call["args"],
+            "status": status,
+            "elapsedMs": round(elapsed * 1000, 3)
+        }
+        return message, timing
 
     def _create_system_prompt(self) -> str:
-        """시스템 프롬프트"""
-        return """당신은 전문 여행 컨설턴트 AI입니다.
-
-**역할:**
-사용자의 선호도를 바탕으로 최적의 여행지를 추천하고, 
-구체적인 비용 breakdown과 여행 팁을 제공합니다.
-
-**추천 프로세스:**
-1. 사용자의 여행 스타일에 맞는 여행지 검색
-2. 각 여행지의 항공료, 숙박비 추정
-3. 총 예산 계산
-4. 사용자 예산과 비교하여 적합한 여행지 필터링
-5. 날씨 정보 및 시즌 이벤트 확인
-6. 상위 5개 여행지 선정 및 추천
-
-**출력 형식:**
-각 추천 여행지에 대해 다음 정보를 JSON 형식으로 제공:
-- name: 여행지 이름
-- country: 국가
-- estimatedCost: 예상 총 비용
-- flightCost: 항공료
-- accommodationCost: 숙박비
-- highlights: 주요 명소 리스트
-- reason: 추천 이유 (구체적으로)
-- bestSeason: 최적 시즌
-- weather: 예상 날씨
-- tips: 여행 팁 리스트
-
-**중요:**
-- 반드시 사용자 예산 내에서 추천
-- 당신의 풍부한 여행 지식을 바탕으로 정확한 정보 제공
-- 추천 이유는 구체적이고 설득력 있게 작성
-"""
+        """시스템 프롬프트 (압축 형식이면 필드 목록 대신 출력 형식 지시를 따르게 함)"""
+        if self.wire_format == "compact":
+            output_format = "**출력 형식:**\n아래 결과 반환 방식의 압축 형식을 따르세요.\n"
+        else:
+            output_format = OUTPUT_FIELDS_PROMPT
+        return SYSTEM_PROMPT_TEMPLATE.format(output_format=output_format)
     
-    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
-        """Agent 실행"""
+    @staticmethod
+    def _top_k(input_data: dict[str, Any]) -> int:
+        """요청한 추천 여행지 수 (``topK``)"""
+        return input_data.get("topK") or DEFAULT_TOP_N
+    
+    @staticmethod
+    def _max_tips(input_data: dict[str, Any]) -> int:
+        """요청한 여행지당 팁 수 (``maxTipsPerDestination``)"""
+        value = input_data.get("maxTipsPerDestination")
+        return DEFAULT_MAX_TIPS if value is None else value
+    
+    def _apply_limits(self, destinations: list[dict[str, Any]], input_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """모델이 요청보다 많이 생성한 여행지/팁을 잘라냄"""
+        max_tips = self._max_tips(input_data)
+        return [
+            {**dest, "tips": dest.get("tips", [])[:max_tips]}
+            for dest in destinations[:self._top_k(input_data)]
+        ]
+    
+    @timed("prompt_build")
+    def _build_messages(
+        self,
+        input_data: dict[str, Any],
+        output_mode: Optional[str] = None
+    ) -> tuple[list, JsonOutputParser]:
+        """
+        사용자 입력으로 프롬프트 메시지와 출력 파서를 생성합니다.
+        
+        Args:
+            input_data: 사용자 입력
+            output_mode: structured/text (기본: self.output_mode)
+        
+        Raises:
+            ValueError: 날짜 형식이 잘못된 경우
+        """
         # 날짜 파싱
         start_date = datetime.strptime(input_data["startDate"], "%Y-%m-%d")
         end_date = datetime.strptime(input_data["endDate"], "%Y-%m-%d")
@@ -103,88 +424,582 @@ class DestinationAgent(BaseAgent):
             budget_text = "미정 (가성비 좋은 곳부터 럭셔리한 곳까지 다양하게 제안)"
         else:
             budget_text = f"₩{input_data['budget']:,} (1인당)"
-
-        # 추가 요청사항 텍스트
-        custom_request = input_data.get("customRequest", "없음")
         
-        # Parser 설정
-        parser = JsonOutputParser(pydantic_object=DestinationList)
-        format_instructions = parser.get_format_instructions()
+        # 정적 접두부(시스템 프롬프트 + 출력 형식)는 그대로, 요청별 값은 user 메시지에만 넣습니다.
+        user_prompt = USER_PROMPT_TEMPLATE.format(
+            startDate=input_data["startDate"],
+            endDate=input_data["endDate"],
+            days=days,
+            budget=budget_text,
+            numberOfPeople=input_data["numberOfPeople"],
+            companion=input_data["companion"],
+            travelStyle=input_data["travelStyle"],
+            customRequest=input_data.get("customRequest") or "없음",
+            topK=self._top_k(input_data),
+            maxTips=self._max_tips(input_data),
+        )
+        
+        messages = [
+            ("system", self._static_prompts[output_mode or self.output_mode]),
+            ("user", user_prompt)
+        ]
+        return messages, self._parser
+    
+    async def warmup(self) -> dict[str, float]:
+        """
+        첫 요청 전에 카탈로그 로드, Tool 바인딩, 프롬프트/사전 계산 경로를 미리 실행합니다.
+        
+        Returns:
+            단계별 소요 시간 (ms)
+        """
+        timings = await super().warmup()
+        
+        steps = [
+            ("catalogMs", get_catalog),
+            ("climateMs", get_climate_store),
+            ("toolBindingMs", lambda: [self._tool_bound_llms(tier.llm) for tier in self.router.tiers]),
+            ("promptMs", lambda: self._build_messages(WARMUP_INPUT)),
+            ("precomputeMs", lambda: precompute_candidates(WARMUP_INPUT, top_n=DEFAULT_TOP_N)),
+        ]
+        for name, step in steps:
+            start = time.perf_counter()
+            step()
+            timings[name] = round((time.perf_counter() - start) * 1000, 3)
+        return timings
+    
+    @timed("agent_run")
+    async def run(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Agent 실행
+        
+        요청 복잡도에 맞는 모델 티어로 실행하고, 결과가 검증이나 예산 조건을 통과하지 못하면
+        더 큰 모델로 다시 실행합니다. (``_escalation_reason``)
+        """
+        return await self._run_routed(input_data, self._run_strategy)
+    
+    async def _run_strategy(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        현재 티어의 모델로 한 번 실행
+        
+        ``precompute``/``shortlist`` 전략이면 후보 선정과 비용 계산을 먼저 Python으로 처리하고,
+        조건에 맞는 후보가 없을 때만 Tool 호출 그래프로 넘어갑니다. 이때는 예산에 맞는 후보가 없었다는 것을
+        ``metadata.precompute.affordable`` (0)로 남겨 예산 초과로 티어를 올리지 않게 합니다.
+        """
+        if self.strategy not in ("precompute", "shortlist"):
+            return await self._run_graph(input_data)
+        
+        result = await self._run_precomputed(input_data)
+        if result is not None:
+            return result
+        result = await self._run_graph(input_data)
+        result.setdefault("metadata", {})["precompute"] = {"affordable": 0}
+        return result
+    
+    def _escalation_reason(self, input_data: dict[str, Any], result: dict[str, Any]) -> Optional[str]:
+        """
+        더 큰 모델로 다시 실행해야 하는 사유
+        
+        - validation: 결과가 비었거나, 파싱/보강에 실패했거나, 검증에서 버려진 항목이 있음
+        - budget: 1인 비용이 예산을 허용 범위 넘게 초과한 여행지가 있음
+          (카탈로그에 예산에 맞는 여행지가 하나도 없으면 더 큰 모델도 같은 결과를 내므로 제외)
+        """
+        destinations = result.get("destinations") or []
+        metadata = result.get("metadata") or {}
+        if result.get("error") or not destinations:
+            return "validation"
+        if (metadata.get("output") or {}).get("dropped"):
+            return "validation"
+        if (metadata.get("precompute") or {}).get("enrichmentError"):
+            return "validation"
+        
+        affordable = (metadata.get("precompute") or {}).get("affordable")
+        if not input_data.get("isBudgetUndecided") and input_data.get("budget") and affordable != 0:
+            people = max(1, input_data.get("numberOfPeople", 1))
+            limit = input_data["budget"] * (1 + settings.MODEL_ROUTER_BUDGET_TOLERANCE)
+            if any(dest.get("estimatedCost", 0) / people > limit for dest in destinations):
+                return "budget"
+        return None
+    
+    async def _run_graph(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Tool 호출 그래프로 추천 생성"""
+        messages, parser = self._build_messages(input_data)
+        
+        # 실행
+        inputs = {"messages": messages, "iterations": 0, "tool_timings": []}
+        result = await self.app.ainvoke(inputs)
+        
+        # 결과 파싱
+        parsed, output_stats = await self._parse_result(result, parser, input_data)
+        parsed["metadata"] = {
+            "strategy": "graph",
+            "toolIterations": result.get("iterations", 0),
+            "toolTimings": result.get("tool_timings", []),
+            "output": output_stats
+        }
+        return parsed
+    
+    async def _run_precomputed(self, input_data: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """
+        사전 계산된 후보로 추천 생성
+        
+        비용/예산 계산은 ``precompute_candidates`` 가 끝내고,
+        LLM은 후보별 추천 이유(reason)와 팁(tips)만 작성합니다.
+        
+        - precompute: 후보 전체를 보강 호출 한 번으로 작성
+        - shortlist: 후보마다 작은 보강 호출을 동시에 보내고 순위대로 합침
+          (출력 토큰이 여러 호출로 나뉘어 응답 시간이 가장 긴 호출 하나 수준으로 줄어듦)
         
-        # 프롬프트 생성
-        system_prompt = self._create_system_prompt()
-        user_prompt = f"""
-다음 조건에 맞는 여행지를 추천해주세요:
+        Returns:
+            추천 결과 (예산에 맞는 후보가 없으면 None)
+        """
+        precomputed = precompute_candidates(input_data, top_n=self._top_k(input_data))
+        if not precomputed.candidates:
+            return None
+        
+        # 결정적인 정보(명소, 시즌, 날씨, 이벤트)는 카탈로그와 기후 테이블에서 한 번에 조회
+        profiles = self._candidate_profiles(
+            [candidate.name for candidate in precomputed.candidates], precomputed.month
+        )
+        
+        if self.strategy == "shortlist":
+            enrichments, usage, enrichment_error = await self._enrich_each(input_data, precomputed, profiles)
+        else:
+            enrichments, usage, enrichment_error = await self._enrich_batch(input_data, precomputed, profiles)
+        
+        destinations = [
+            self._precomputed_destination(candidate, profile, enrichments.get(index, {}), input_data)
+            for index, (candidate, profile) in enumerate(zip(precomputed.candidates, profiles), 1)
+        ]
+        
+        # 토큰 절감량 (전체 생성 방식 대비 추정치)
+        baseline_messages, _ = self._build_messages(input_data)
+        prompt_tokens, completion_tokens = usage["promptTokens"], usage["completionTokens"]
+        baseline_prompt_tokens = sum(estimate_tokens(content) for _, content in baseline_messages)
+        baseline_completion_tokens = estimate_tokens(
+            json.dumps({"destinations": destinations}, ensure_ascii=False)
+        )
+        
+        metadata = {
+            "strategy": self.strategy,
+            "precompute": {
+                "candidatesConsidered": precomputed.considered,
+                "filteredOutByBudget": precomputed.filteredOut,
+                "affordable": precomputed.considered - precomputed.filteredOut,
+                "selected": len(destinations),
+                "enrichmentCalls": usage["calls"],
+                "estimatedPromptTokens": prompt_tokens,
+                "baselinePromptTokens": baseline_prompt_tokens,
+                "estimatedCompletionTokens": completion_tokens,
+                "baselineCompletionTokens": baseline_completion_tokens,
+                "estimatedTokensSaved": (
+                    baseline_prompt_tokens + baseline_completion_tokens
+                    - prompt_tokens - completion_tokens
+                )
+            }
+        }
+        if enrichment_error:
+            metadata["precompute"]["enrichmentError"] = enrichment_error
+        
+        return {
+            "destinations": destinations,
+            "totalCount": len(destinations),
+            "metadata": metadata
+        }
+    
+    def _precomputed_destination(
+        self,
+        candidate: CostedCandidate,
+        profile: dict[str, Any],
+        enrichment: dict[str, Any],
+        input_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        사전 계산 후보 + LLM 보강 내용을 ``DestinationInfo`` 로 검증한 항목
 
-**여행 정보:**
-- 여행 기간: {input_data['startDate']} ~ {input_data['endDate']} ({days}일)
-- 예산: {budget_text}
-- 인원: {input_data['numberOfPeople']}명
-- 동행자: {input_data['companion']}
-- 여행 스타일: {input_data['travelStyle']}
-- 추가 요청사항: {custom_request}
+        Agent가 돌려주는 여행지는 모두 여기(또는 ``_parse_result``/스트리밍)에서 한 번 검증되며,
+        라우터는 다시 검증하지 않고 그대로 직렬화합니다. 보강 내용의 형식이 틀리면 보강 없이 만듭니다.
+        """
+        item = {
+            "name": candidate.name,
+            "country": candidate.country,
+            "estimatedCost": candidate.totalCost,
+            "flightCost": candidate.flightCost,
+            "accommodationCost": candidate.accommodationCost,
+            "highlights": profile["highlights"],
+            "reason": f"1인 예상 비용 ₩{candidate.perPersonCost:,}로 조건에 맞는 여행지",
+            "bestSeason": profile["bestSeason"],
+            "weather": profile["weather"],
+            "tips": []
+        }
+        enriched = {
+            **item,
+            "highlights": enrichment.get("highlights") or item["highlights"],
+            "reason": enrichment.get("reason") or item["reason"],
+            "tips": (enrichment.get("tips") or [])[:self._max_tips(input_data)]
+        }
+        try:
+            return DestinationInfo.model_validate(enriched).model_dump()
+        except ValidationError as e:
+            print(f"보강 내용 검증 에러 ({candidate.name}, 보강 없이 사용): {e.error_count()}개 필드 오류")
+            return DestinationInfo.model_validate(item).model_dump()
 
-**요구사항:**
-1. 위 여행 스타일과 동행자 유형에 맞는 여행지를 검색하세요
-2. 각 여행지의 항공료, 숙박비를 조회하세요
-3. 총 예산을 계산하고 사용자 예산과 비교하세요 (예산이 미정인 경우 다양한 가격대를 제안하세요)
-4. 조건에 맞는 여행지 중 상위 5곳을 선정하세요
-5. 각 여행지의 날씨와 이벤트 정보를 확인하세요
-6. JSON 형식으로 결과를 반환하세요
+    async def _enrich_batch(
+        self,
+        input_data: dict[str, Any],
+        precomputed: PrecomputeResult,
+        profiles: list[dict[str, Any]]
+    ) -> tuple[dict[int, dict[str, Any]], dict[str, int], Optional[str]]:
+        """
+        후보 전체의 reason/tips를 보강 호출 한 번으로 작성
+        
+        Returns:
+            (후보 번호 → 보강 결과, 호출 수/추정 토큰 수, 파싱 에러)
+        """
+        messages = self._build_enrichment_messages(input_data, precomputed, profiles)
+        response = await self._ainvoke_llm(self.llm, messages)
+        content = response.content if isinstance(response.content, str) else ""
+        usage = {
+            "calls": 1,
+            "promptTokens": sum(estimate_tokens(text) for _, text in messages),
+            "completionTokens": estimate_tokens(content),
+        }
+        
+        try:
+            with span("parse"):
+                parsed = self._enrichment_parser.parse(response.content)
+            items = parsed.get("items", []) if isinstance(parsed, dict) else parsed
+            enrichments = {
+                item.get("id"): item for item in items if isinstance(item, dict)
+            }
+        except Exception as e:
+            print(f"보강 결과 파싱 에러: {e}")
+            return {}, usage, str(e)
+        return enrichments, usage, None
+    
+    async def _enrich_each(
+        self,
+        input_data: dict[str, Any],
+        precomputed: PrecomputeResult,
+        profiles: list[dict[str, Any]]
+    ) -> tuple[dict[int, dict[str, Any]], dict[str, int], Optional[str]]:
+        """
+        후보마다 작은 보강 호출(reason/highlights/tips)을 동시에 보내고 결과를 모읍니다.
+        
+        실패한 후보는 결정적인 기본값으로 채우고 에러를 함께 반환합니다.
+        모든 호출이 실패했거나 마감 시간 초과/서킷 차단이면 요청 전체의 실패이므로 그대로 올립니다.
+        
+        Returns:
+            (후보 번호 → 보강 결과, 호출 수/추정 토큰 수, 에러 요약)
+        """
+        message_sets = [
+            self._build_item_enrichment_messages(input_data, precomputed, candidate, profile)
+            for candidate, profile in zip(precomputed.candidates, profiles)
+        ]
+        with span("enrich_parallel"):
+            responses = await asyncio.gather(
+                *(self._ainvoke_llm(self.llm, messages) for messages in message_sets),
+                return_exceptions=True
+            )
+        
+        failures = [response for response in responses if isinstance(response, BaseException)]
+        if len(failures) == len(responses):
+            raise failures[0]
+        
+        enrichments: dict[int, dict[str, Any]] = {}
+        usage = {"calls": len(message_sets), "promptTokens": 0, "completionTokens": 0}
+        errors = []
+        for index, (messages, response) in enumerate(zip(message_sets, responses), 1):
+            usage["promptTokens"] += sum(estimate_tokens(text) for _, text in messages)
+            if isinstance(response, (DeadlineExceeded, CircuitOpenError)):
+                raise response
+            if isinstance(response, BaseException):
+                errors.append(f"{index}: {response}")
+                continue
+            content = response.content if isinstance(response.content, str) else ""
+            usage["completionTokens"] += estimate_tokens(content)
+            try:
+                with span("parse"):
+                    parsed = self._enrichment_parser.parse(content)
+                if not isinstance(parsed, dict):
+                    raise ValueError("보강 결과가 JSON 객체가 아닙니다.")
+                enrichments[index] = parsed
+            except Exception as e:
+                errors.append(f"{index}: {e}")
+        
+        if errors:
+            print(f"후보별 보강 에러: {errors}")
+        return enrichments, usage, "; ".join(errors) or None
+    
+    def _candidate_profiles(self, names: list[str], month: int) -> list[dict[str, Any]]:
+        """후보 여행지들의 명소/시즌/날씨/이벤트 조회 (여행지마다 Tool을 부르지 않고 일괄 조회)"""
+        catalog = get_catalog()
+        climate = get_climate_store().bulk(names, [month])
+        
+        profiles = []
+        for name in names:
+            dest = catalog.get(name)
+            weather = climate[name][month]
+            profiles.append({
+                "highlights": list(dest.highlights) if dest else [],
+                "bestSeason": dest.bestSeason if dest else "연중",
+                "weather": f"평균 {weather['avgTemperature']}°C, {weather['description']}",
+                "events": weather["events"]
+            })
+        return profiles
+    
+    def _trip_summary(self, input_data: dict[str, Any], precomputed: PrecomputeResult) -> str:
+        """보강 프롬프트에 공통으로 들어가는 여행 조건 요약"""
+        if input_data.get("isBudgetUndecided"):
+            budget_text = "미정"
+        else:
+            budget_text = f"₩{input_data['budget']:,} (1인당)"
+        
+        return f"""**여행 정보:** {precomputed.days}일, {precomputed.month}월 출발, {input_data['numberOfPeople']}명, 동행자 {input_data['companion']}, 스타일 {input_data['travelStyle']}, 예산 {budget_text}
+**추가 요청사항:** {input_data.get('customRequest') or '없음'}
+**팁 개수:** 여행지당 {self._max_tips(input_data)}개"""
+    
+    def _build_enrichment_messages(
+        self,
+        input_data: dict[str, Any],
+        precomputed: PrecomputeResult,
+        profiles: list[dict[str, Any]]
+    ) -> list:
+        """비용이 확정된 후보로 짧은 보강(reason/tips) 프롬프트 생성"""
+        candidate_lines = []
+        for index, (candidate, profile) in enumerate(zip(precomputed.candidates, profiles), 1):
+            events = ", ".join(profile["events"]) or "없음"
+            candidate_lines.append(
+                f"{index}. {candidate.name} ({candidate.country}) | 1인 ₩{candidate.perPersonCost:,} "
+                f"| 날씨: {profile['weather']} | 이벤트: {events}"
+            )
+        candidates_text = "\n".join(candidate_lines)
+        
+        user_prompt = f"""{self._trip_summary(input_data, precomputed)}
 
-**출력 형식:**
-{format_instructions}
+**후보 여행지 (비용 계산 완료):**
+{candidates_text}"""
+        
+        return [
+            ("system", ENRICHMENT_SYSTEM_PROMPT),
+            ("user", user_prompt)
+        ]
+    
+    def _build_item_enrichment_messages(
+        self,
+        input_data: dict[str, Any],
+        precomputed: PrecomputeResult,
+        candidate: CostedCandidate,
+        profile: dict[str, Any]
+    ) -> list:
+        """후보 하나의 보강(reason/highlights/tips) 프롬프트 생성 (shortlist 전략)"""
+        events = ", ".join(profile["events"]) or "없음"
+        highlights = ", ".join(profile["highlights"]) or "없음"
+        user_prompt = f"""{self._trip_summary(input_data, precomputed)}
 
-당신의 지식을 바탕으로 최고의 여행지를 추천해주세요!
-"""
+**여행지 (비용 계산 완료):** {candidate.name} ({candidate.country}) | 1인 ₩{candidate.perPersonCost:,} | 날씨: {profile['weather']} | 이벤트: {events} | 대표 명소: {highlights}"""
         
-        # 실행
-        inputs = {
-            "messages": [
-                ("system", system_prompt),
-                ("user", user_prompt)
-            ]
-        }
+        return [
+            ("system", ITEM_ENRICHMENT_SYSTEM_PROMPT),
+            ("user", user_prompt)
+        ]
+    
+    def astream_destinations(self, input_data: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """
+        추천 여행지를 스트리밍합니다.
         
-        result = await self.app.ainvoke(inputs)
+        LLM 토큰을 증분 JSON 파서에 흘려 보내고, ``DestinationInfo`` 객체 하나가
+        완성되어 검증을 통과하는 즉시 반환합니다.
         
-        # 결과 파싱
-        return self._parse_result(result, parser)
+        입력 검증(날짜 파싱)은 호출 시점에 바로 수행되므로
+        잘못된 입력은 스트림 시작 전에 ValueError로 드러납니다.
+        
+        Args:
+            input_data: 사용자 입력
+        
+        Returns:
+            검증된 여행지 딕셔너리를 내보내는 비동기 이터레이터
+        """
+        messages, _ = self._build_messages(input_data, output_mode="text")
+        # 스트리밍은 다시 실행할 수 없으므로 상향 없이 시작 티어 모델만 사용
+        llm = self.router.tiers[self.router.select(input_data)].llm
+        return self._astream_destinations(messages, llm, input_data)
+    
+    async def _astream_destinations(
+        self,
+        messages: list,
+        llm,
+        input_data: dict[str, Any]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """``astream_destinations`` 의 실제 스트리밍 루프 (압축 형식 항목은 펼친 뒤 검증)"""
+        parser = IncrementalArrayParser(self._list_keys[0])
+        days, people = self._trip_shape(input_data)
+        top_k, max_tips = self._top_k(input_data), self._max_tips(input_data)
+        emitted = 0
+        
+        async for chunk in self._astream_llm(llm, messages):
+            if not isinstance(chunk.content, str):
+                continue
+            for obj in parser.feed(chunk.content):
+                try:
+                    destination = DestinationInfo.model_validate(expand_item(obj, days, people))
+                except ValidationError as e:
+                    print(f"스트리밍 검증 에러 (항목 건너뜀): {e.error_count()}개 필드 오류")
+                    continue
+                destination.tips = destination.tips[:max_tips]
+                yield destination.model_dump()
+                emitted += 1
+                if emitted >= top_k:
+                    return
+            if parser.done:
+                break
+    
+    @staticmethod
+    def _trip_shape(input_data: dict[str, Any]) -> tuple[int, int]:
+        """서버 측 총비용 계산에 쓰는 (여행 일수, 인원)"""
+        start_date = datetime.strptime(input_data["startDate"], "%Y-%m-%d")
+        end_date = datetime.strptime(input_data["endDate"], "%Y-%m-%d")
+        return max((end_date - start_date).days, 1), input_data["numberOfPeople"]
+    
+    @timed("parse")
+    def _extract_items(self, final_message: BaseMessage, parser: JsonOutputParser) -> tuple[Optional[list], str, Optional[str]]:
+        """
+        최종 메시지에서 여행지 항목 추출
+        
+        ``DestinationList`` Tool 호출이 있으면 그 인자(이미 파싱된 dict)를 쓰고,
+        없으면 본문 텍스트를 JSON으로 파싱합니다.
+        
+        Returns:
+            (항목 리스트 또는 None, 출처(tool_call/text), 파싱 오류 메시지)
+        """
+        for call in getattr(final_message, "tool_calls", None) or []:
+            if call["name"] == FINAL_ANSWER_TOOL:
+                return extract_items(call["args"], self._list_keys), "tool_call", None
+        
+        try:
+            return extract_items(parser.parse(final_message.content), self._list_keys), "text", None
+        except Exception as e:
+            return None, "text", str(e)
     
-    def _parse_result(self, result: dict, parser: JsonOutputParser) -> dict[str, Any]:
-        """결과 파싱"""
+    async def _parse_result(
+        self,
+        result: dict,
+        parser: JsonOutputParser,
+        input_data: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        결과 파싱
+        
+        압축 형식 항목은 먼저 ``DestinationInfo`` 형식으로 펼치고(총비용은 서버에서 계산),
+        항목별로 ``DestinationInfo`` 검증 → 값 변환 → (그래도 실패한 항목만) 보정 호출 순서로 처리합니다.
+        응답 전체가 JSON이 아니면 원문을 보정 호출에 넘깁니다. 어느 경우에도 Tool 조회부터 다시 실행하지 않습니다.
+        
+        Returns:
+            (파싱 결과, 출력 처리 통계)
+        """
+        mode = self.output_mode
+        stats = {"mode": mode, "source": None, "coerced": 0, "repaired": 0, "dropped": 0, "repairCalls": 0, "repairTokens": 0}
         messages = result.get("messages", [])
         final_message = messages[-1] if messages else None
         
         if not final_message:
+            metrics.inc("output_parse_total", mode=mode, outcome="failed")
             return {
                 "destinations": [],
                 "error": "Agent가 결과를 생성하지 못했습니다."
-            }
+            }, stats
         
-        try:
-            # JSON 파싱
-            parsed_result = parser.parse(final_message.content)
-            
-            # DestinationList 모델로 변환 (검증)
-            if isinstance(parsed_result, list):
-                 # 리스트로 바로 반환된 경우
-                 destinations = parsed_result
-            elif "destinations" in parsed_result:
-                 # destinations 키로 감싸진 경우
-                 destinations = parsed_result["destinations"]
+        items, stats["source"], parse_error = self._extract_items(final_message, parser)
+        if items is not None:
+            items = expand_items(items, *self._trip_shape(input_data))
+        report = validate_destinations(items or [])
+        stats["coerced"] = report.coerced
+        
+        if settings.AGENT_OUTPUT_REPAIR and (items is None or report.invalid):
+            if items is None:
+                print(f"파싱 에러: {parse_error} (원문 보정 시도)")
+                repaired = validate_destinations(await self._repair_output(final_message.content, stats))
+                report.valid = repaired.valid
+                stats["repaired"] = len(repaired.valid)
             else:
-                 destinations = []
-                 
-            return {
-                "destinations": destinations,
-                "totalCount": len(destinations)
-            }
-            
-        except Exception as e:
-            print(f"파싱 에러: {e}")
-            print(f"원본 응답: {final_message.content}")
+                targets = [{"item": item, "errors": error} for _, item, error in report.invalid]
+                repaired = validate_destinations(await self._repair_output(targets, stats))
+                positions = [index for index, _, _ in report.invalid]
+                filled = {
+                    positions[index]: dest for index, dest in repaired.valid if index < len(positions)
+                }
+                report.valid.extend(filled.items())
+                report.invalid = [entry for entry in report.invalid if entry[0] not in filled]
+                stats["repaired"] = len(filled)
+        
+        stats["dropped"] = len(report.invalid)
+        destinations = report.destinations
+        
+        item_counts = {
+            "valid": len(destinations) - stats["coerced"] - stats["repaired"],
+            "coerced": stats["coerced"],
+            "repaired": stats["repaired"],
+            "dropped": stats["dropped"],
+        }
+        for outcome, count in item_counts.items():
+            if count:
+                metrics.inc("output_items_total", count, mode=mode, outcome=outcome)
+        
+        if not destinations and (items is None or stats["dropped"]):
+            metrics.inc("output_parse_total", mode=mode, outcome="failed")
+            error = parse_error or "추천 여행지 항목이 형식에 맞지 않습니다."
             return {
                 "destinations": [],
-                "error": f"결과 파싱 중 오류가 발생했습니다: {str(e)}"
-            }
+                "error": f"결과 파싱 중 오류가 발생했습니다: {error}"
+            }, stats
+        
+        if stats["dropped"]:
+            outcome = "partial"
+        elif stats["repaired"]:
+            outcome = "repaired"
+        elif stats["coerced"]:
+            outcome = "coerced"
+        else:
+            outcome = "ok"
+        metrics.inc("output_parse_total", mode=mode, outcome=outcome)
+        
+        destinations = self._apply_limits(destinations, input_data)
+        return {
+            "destinations": destinations,
+            "totalCount": len(destinations)
+        }, stats
+    
+    async def _repair_output(self, targets: Any, stats: dict[str, Any]) -> list:
+        """
+        검증에 실패한 부분만 작은 LLM 호출로 보정
+        
+        Args:
+            targets: 실패 항목과 오류 목록, 또는 JSON이 아닌 원문 텍스트
+            stats: 출력 처리 통계 (보정 호출 수/토큰 누적)
+        
+        Returns:
+            보정된 항목 리스트 (실패 시 빈 리스트)
+        """
+        payload = targets if isinstance(targets, str) else json.dumps(targets, ensure_ascii=False)
+        messages = [("system", self._repair_prompt), ("user", payload)]
+        stats["repairCalls"] += 1
+        metrics.inc("output_repair_calls_total", mode=self.output_mode)
+        
+        try:
+            with span("repair"):
+                response = await self._ainvoke_llm(self.llm, messages)
+        except Exception as e:
+            print(f"보정 호출 실패: {e}")
+            return []
+        
+        usage = getattr(response, "usage_metadata", None) or {}
+        tokens = usage.get("total_tokens") or (
+            estimate_tokens(self._repair_prompt) + estimate_tokens(payload) + estimate_tokens(str(response.content))
+        )
+        stats["repairTokens"] += tokens
+        metrics.inc("output_repair_tokens_total", tokens, mode=self.output_mode)
+        
+        try:
+            return extract_items(self._enrichment_parser.parse(response.content))
+        except Exception as e:
+            print(f"보정 결과 파싱 실패: {e}")
+            return []
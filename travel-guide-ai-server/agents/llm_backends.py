@@ -0,0 +1,420 @@
+"""
+LLM 백엔드
+
+``LLM_BACKEND`` 설정에 따라 Agent가 사용할 Chat 모델을 만듭니다.
+
+- openai: 실제 OpenAI API (ChatOpenAI)
+- replay: 요청/응답 쌍을 프롬프트 해시로 디스크에 기록하고, 같은 요청은 기록된 응답으로 재생
+- synthetic: 네트워크 없이 설정한 지연/토큰 속도로 스키마에 맞는 응답을 생성
+
+replay와 synthetic은 API 키나 네트워크 없이 FastAPI → Agent → Parser 경로 전체를
+실제와 비슷한 동시성으로 부하 테스트할 때 사용합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    ToolMessage,
+    message_to_dict,
+    messages_from_dict,
+)
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from agents.precompute import precompute_candidates
+from agents.structured_output import FINAL_ANSWER_TOOL
+from agents.wire_schema import WIRE_LIST_KEY, compact_item
+from config.settings import settings
+from tools.catalog import get_catalog
+from utils.helpers import estimate_tokens
+from utils.outbound import get_http_client, outbound_timeout
+
+
+BACKENDS = ("openai", "replay", "synthetic")
+
+
+def create_chat_model(model_name: str, temperature: float) -> BaseChatModel:
+    """
+    설정된 백엔드로 Chat 모델 생성
+
+    Raises:
+        ValueError: 알 수 없는 ``LLM_BACKEND``
+    """
+    backend = settings.LLM_BACKEND.lower()
+    if backend == "openai":
+        return _create_openai(model_name, temperature)
+    if backend == "replay":
+        inner = _create_openai(model_name, temperature) if settings.LLM_REPLAY_MODE != "replay" else None
+        return ReplayChatModel(
+            model_name=model_name,
+            inner=inner,
+            directory=settings.LLM_REPLAY_DIR,
+            mode=settings.LLM_REPLAY_MODE
+        )
+    if backend == "synthetic":
+        return SyntheticChatModel(
+            model_name=model_name,
+            latency=settings.LLM_SYNTHETIC_LATENCY,
+            tokens_per_second=settings.LLM_SYNTHETIC_TOKENS_PER_SECOND,
+            error_rate=settings.LLM_SYNTHETIC_ERROR_RATE
+        )
+    raise ValueError(f"알 수 없는 LLM 백엔드입니다: {settings.LLM_BACKEND} (지원: {', '.join(BACKENDS)})")
+
+
+def _create_openai(model_name: str, temperature: float) -> BaseChatModel:
+    from langchain_openai import ChatOpenAI
+
+    # 재시도는 OutboundClient가 마감 시간/서킷 상태를 보고 직접 처리하므로 SDK 재시도는 끔
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        api_key=settings.OPENAI_API_KEY,
+        base_url=settings.OPENAI_BASE_URL or None,
+        stream_usage=True,
+        max_retries=0,
+        timeout=outbound_timeout(),
+        http_async_client=get_http_client()
+    )
+
+
+def _normalize_tool_choice(tool_choice: Any) -> Any:
+    """ChatOpenAI.bind_tools와 같은 방식으로 tool_choice 정규화"""
+    if tool_choice in (None, "auto", "none", "required"):
+        return tool_choice
+    if tool_choice == "any":
+        return "required"
+    if isinstance(tool_choice, str):
+        return {"type": "function", "function": {"name": tool_choice}}
+    return tool_choice
+
+
+class _ToolBindingMixin:
+    """OpenAI 형식으로 Tool을 바인딩 (호출 시 ``tools``/``tool_choice`` kwargs로 전달됨)"""
+
+    def bind_tools(self, tools: Sequence[Any], *, tool_choice: Any = None, **kwargs: Any):
+        formatted = [convert_to_openai_tool(tool) for tool in tools]
+        if tool_choice is not None:
+            kwargs["tool_choice"] = _normalize_tool_choice(tool_choice)
+        return self.bind(tools=formatted, **kwargs)
+
+
+def _usage(input_tokens: int, output_tokens: int) -> Dict[str, int]:
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+    }
+
+
+class SyntheticChatModel(_ToolBindingMixin, BaseChatModel):
+    """
+    스키마에 맞는 응답을 만드는 합성 Chat 모델
+
+    프롬프트의 여행 조건을 읽어 카탈로그/가격 계산으로 ``DestinationInfo`` 형식의 추천을 만듭니다.
+    응답 시간은 ``latency`` (첫 토큰까지) + 출력 토큰 수 / ``tokens_per_second`` 입니다.
+
+    - Tool이 바인딩되어 있으면 첫 턴에 ``search_destinations`` 를 호출하고, 결과를 받은 뒤
+      (또는 최종 결과 Tool이 강제되면) ``DestinationList`` Tool 호출로 답합니다.
+    - 압축 형식 지시(``{"d": ...}``)가 있으면 추천을 압축 형식으로 내보냅니다.
+    - 추천 개수와 팁 개수는 프롬프트에 적힌 값을 따릅니다.
+    - 보강 프롬프트(``{"items": ...}``)에는 후보 수만큼 reason/tips를 돌려줍니다.
+    - 후보 하나의 보강 프롬프트(``{"reason": ...}``)에는 reason/highlights/tips 하나를 돌려줍니다.
+    - ``error_rate`` 비율만큼 비용을 문자열(``"₩1,800,000"``)로 내보내 값 변환 경로를 재현합니다.
+    """
+
+    model_name: str = "synthetic"
+    latency: float = 0.3
+    tokens_per_second: float = 80.0
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "synthetic-travel-llm"
+
+    def _respond(self, messages: List[BaseMessage], **kwargs: Any) -> AIMessage:
+        rng = random.Random(self.seed)
+        system = next((str(m.content) for m in messages if m.type == "system"), "")
+        user = next((str(m.content) for m in messages if m.type == "human"), "")
+        tool_names = [tool["function"]["name"] for tool in kwargs.get("tools") or []]
+        tool_choice = kwargs.get("tool_choice")
+        forced = isinstance(tool_choice, dict)
+        looked_up = any(isinstance(m, ToolMessage) for m in messages)
+
+        if '{"items"' in system:
+            content = json.dumps({"items": self._enrichments(user)}, ensure_ascii=False)
+            return self._message(messages, content)
+
+        if '{"reason"' in system:
+            content = json.dumps(self._item_enrichment(user), ensure_ascii=False)
+            return self._message(messages, content)
+
+        if "search_destinations" in tool_names and not looked_up and not forced and tool_choice != "none":
+            style = _match(r"여행 스타일:\s*(\S+)", user) or "beach"
+            call = {"name": "search_destinations", "args": {"travel_style": style}, "id": f"call_{rng.getrandbits(32):08x}"}
+            return self._message(messages, "", tool_calls=[call])
+
+        destinations = self._destinations(user, rng)
+        if '{"d"' in system:
+            answer = {WIRE_LIST_KEY: [_compact(item) for item in destinations]}
+        else:
+            answer = {"destinations": destinations}
+        if FINAL_ANSWER_TOOL in tool_names and tool_choice != "none":
+            call = {"name": FINAL_ANSWER_TOOL, "args": answer, "id": f"call_{rng.getrandbits(32):08x}"}
+            return self._message(messages, "", tool_calls=[call])
+        return self._message(messages, json.dumps(answer, ensure_ascii=False))
+
+    def _destinations(self, user: str, rng: random.Random) -> List[Dict[str, Any]]:
+        """프롬프트의 여행 조건으로 추천 목록 생성"""
+        budget_text = _match(r"예산:\s*₩([\d,]+)", user)
+        input_data = {
+            "startDate": _match(r"여행 기간:\s*(\S+)", user) or "2025-05-01",
+            "endDate": _match(r"~\s*(\d{4}-\d{2}-\d{2})", user) or "2025-05-05",
+            "budget": int(budget_text.replace(",", "")) if budget_text else None,
+            "isBudgetUndecided": budget_text is None,
+            "numberOfPeople": int(_match(r"인원:\s*(\d+)", user) or 2),
+            "travelStyle": _match(r"여행 스타일:\s*(\S+)", user) or "beach",
+        }
+        top_n = int(_match(r"여행지 (\d+)곳", user) or 5)
+        tips = _tip_count(user)
+        try:
+            precomputed = precompute_candidates(input_data, top_n=top_n)
+            if not precomputed.candidates:
+                # 예산에 맞는 곳이 없으면 실제 모델처럼 예산을 넘는 곳이라도 추천
+                precomputed = precompute_candidates({**input_data, "isBudgetUndecided": True}, top_n=top_n)
+        except ValueError:
+            return []
+
+        catalog = get_catalog()
+        destinations = []
+        for candidate in precomputed.candidates:
+            dest = catalog.get(candidate.name)
+            item = {
+                "name": candidate.name,
+                "country": candidate.country,
+                "estimatedCost": candidate.totalCost,
+                "flightCost": candidate.flightCost,
+                "accommodationCost": candidate.accommodationCost,
+                "highlights": list(dest.highlights) if dest else [],
+                "reason": f"{input_data['travelStyle']} 여행에 어울리는 {candidate.name}",
+                "bestSeason": dest.bestSeason if dest else "연중",
+                "weather": "맑음",
+                "tips": _tips(candidate.name, tips),
+            }
+            if rng.random() < self.error_rate:
+                item["estimatedCost"] = f"₩{candidate.totalCost:,}"
+            destinations.append(item)
+        return destinations
+
+    def _enrichments(self, user: str) -> List[Dict[str, Any]]:
+        """보강 프롬프트의 후보 줄(``1. 이름 (국가) | ...``)마다 reason/tips 생성"""
+        names = re.findall(r"^(\d+)\.\s*(\S+)", user, flags=re.MULTILINE)
+        tips = _tip_count(user)
+        return [
+            {"id": int(index), "reason": f"조건에 잘 맞는 {name}", "tips": _tips(name, tips)}
+            for index, name in names
+        ]
+
+    def _item_enrichment(self, user: str) -> Dict[str, Any]:
+        """후보 하나의 보강 프롬프트(``**여행지 ...:** 이름 (국가) | ...``)로 reason/highlights/tips 생성"""
+        name = _match(r"\*\*여행지[^*]*:\*\*\s*(\S+)", user) or "여행지"
+        dest = get_catalog().get(name)
+        return {
+            "reason": f"조건에 잘 맞는 {name}",
+            "highlights": list(dest.highlights) if dest else [],
+            "tips": _tips(name, _tip_count(user)),
+        }
+
+    def _message(self, messages: List[BaseMessage], content: str, tool_calls: Optional[list] = None) -> AIMessage:
+        input_tokens = sum(estimate_tokens(str(m.content)) for m in messages)
+        output_tokens = estimate_tokens(content or json.dumps(tool_calls, ensure_ascii=False))
+        return AIMessage(content=content, tool_calls=tool_calls or [], usage_metadata=_usage(input_tokens, output_tokens))
+
+    def _delay(self, message: AIMessage) -> float:
+        return self.latency + message.usage_metadata["output_tokens"] / max(self.tokens_per_second, 1e-6)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message = self._respond(messages, **kwargs)
+        time.sleep(self._delay(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message = self._respond(messages, **kwargs)
+        await asyncio.sleep(self._delay(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        message = self._respond(messages, **kwargs)
+        content = str(message.content)
+        await asyncio.sleep(self.latency)
+
+        # 토큰 속도에 맞춰 약 4글자(≈1토큰) 단위로 내보냅니다.
+        step = 16
+        delay = step / 4 / max(self.tokens_per_second, 1e-6)
+        for i in range(0, len(content), step):
+            await asyncio.sleep(delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=content[i:i + step]))
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=message.usage_metadata))
+
+
+class ReplayChatModel(_ToolBindingMixin, BaseChatModel):
+    """
+    요청/응답 기록·재생 Chat 모델
+
+    요청(모델 이름, 메시지, Tool, tool_choice)의 SHA-256 해시를 파일 이름으로
+    ``directory`` 에 응답을 JSON으로 저장합니다.
+
+    - record: 항상 ``inner`` 모델을 호출하고 응답을 기록
+    - replay: 기록된 응답만 사용 (없으면 KeyError)
+    - auto: 기록이 있으면 재생, 없으면 호출 후 기록
+    """
+
+    model_name: str = "replay"
+    inner: Optional[BaseChatModel] = None
+    directory: str = ".llm_replay"
+    mode: str = "auto"
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def request_key(self, messages: List[BaseMessage], **kwargs: Any) -> str:
+        """요청 해시 (메시지 내용과 Tool 바인딩이 같으면 같은 키)"""
+        payload = {
+            "model": self.model_name,
+            "messages": [_message_key(m) for m in messages],
+            "tools": kwargs.get("tools"),
+            "tool_choice": kwargs.get("tool_choice"),
+        }
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return Path(self.directory) / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[AIMessage]:
+        path = self._path(key)
+        if self.mode == "record" or not path.exists():
+            return None
+        with open(path, encoding="utf-8") as f:
+            return messages_from_dict([json.load(f)["response"]])[0]
+
+    def _save(self, key: str, messages: List[BaseMessage], response: BaseMessage) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "model": self.model_name,
+            "prompt": [message_to_dict(m) for m in messages],
+            "response": message_to_dict(response),
+        }
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        tmp.replace(path)
+
+    def _missing(self, key: str) -> KeyError:
+        return KeyError(f"기록된 LLM 응답이 없습니다: {key} (LLM_REPLAY_MODE=auto/record 로 먼저 기록하세요)")
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        key = self.request_key(messages, **kwargs)
+        response = self._load(key)
+        if response is None:
+            if self.inner is None or self.mode == "replay":
+                raise self._missing(key)
+            response = self.inner._generate(messages, stop=stop, **kwargs).generations[0].message
+            self._save(key, messages, response)
+        return ChatResult(generations=[ChatGeneration(message=response)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        key = self.request_key(messages, **kwargs)
+        response = await asyncio.to_thread(self._load, key)
+        if response is None:
+            if self.inner is None or self.mode == "replay":
+                raise self._missing(key)
+            result = await self.inner._agenerate(messages, stop=stop, **kwargs)
+            response = result.generations[0].message
+            await asyncio.to_thread(self._save, key, messages, response)
+        return ChatResult(generations=[ChatGeneration(message=response)])
+
+
+def _message_key(message: BaseMessage) -> Dict[str, Any]:
+    """
+    해시에 쓰는 메시지 내용
+
+    실행마다 달라지는 메시지 id(``run-...``)나 응답 메타데이터는 빼고
+    역할, 본문, Tool 호출(이름/인자/id)만 사용합니다.
+    """
+    key: Dict[str, Any] = {"type": message.type, "content": message.content}
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        key["tool_calls"] = [
+            {"name": call["name"], "args": call["args"], "id": call.get("id")} for call in tool_calls
+        ]
+    if isinstance(message, ToolMessage):
+        key["tool_call_id"] = message.tool_call_id
+    return key
+
+
+def _tip_count(user: str) -> int:
+    """프롬프트에 적힌 여행지당 팁 수 (없으면 3)"""
+    return int(_match(r"팁 (\d+)개", user) or _match(r"여행지당 (\d+)개", user) or 3)
+
+
+def _tips(name: str, count: int) -> List[str]:
+    pool = [f"{name} 현지 교통 패스 활용", "성수기 숙소 미리 예약", f"{name} 맛집 탐방", "여행자 보험 가입", "환전은 현지 ATM 활용"]
+    return pool[:count]
+
+
+def _compact(item: Dict[str, Any]) -> Dict[str, Any]:
+    """압축 형식 항목 (비용 형식 오류를 넣은 항목은 항공료를 문자열로)"""
+    compact = compact_item(item)
+    if isinstance(item["estimatedCost"], str):
+        compact["p"][0] = f"₩{item['flightCost']:,}"
+    return compact
+
+
+def _match(pattern: str, text: str) -> Optional[str]:
+    match = re.search(pattern, text)
+    return match.group(1) if match else None
@@ -0,0 +1,224 @@
+"""
+모델 티어 라우팅
+
+요청 복잡도에 따라 작은 모델(빠르고 저렴)과 큰 모델 중 하나를 고르고,
+결과가 검증/예산 조건을 통과하지 못했을 때만 다음 티어로 올려 다시 실행합니다.
+
+실행 중인 티어는 ContextVar로 전달되므로 그래프 노드처럼 Agent 내부 어디서든
+``agent.llm`` 으로 현재 티어의 모델을 얻을 수 있습니다.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.metrics import metrics
+
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력)
+MODEL_PRICES: Dict[str, tuple] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+
+
+@dataclass
+class ModelTier:
+    """라우팅 대상 모델 하나"""
+
+    name: str
+    llm: Any
+    input_price: float = 0.0  # 100만 토큰당 USD
+    output_price: float = 0.0
+
+    def cost(self, input_tokens: int, output_tokens: int) -> float:
+        """토큰 사용량에 대한 비용 (USD)"""
+        return (input_tokens * self.input_price + output_tokens * self.output_price) / 1_000_000
+
+
+@dataclass
+class TierRun:
+    """티어 하나로 실행한 한 번의 시도 (토큰 사용량 누적)"""
+
+    tier: int
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+@dataclass
+class TierStats:
+    runs: int = 0
+    escalations: int = 0
+    seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+
+
+_active_run: ContextVar[Optional[TierRun]] = ContextVar("model_tier_run", default=None)
+
+
+class ModelRouter:
+    """
+    요청 복잡도 기반 모델 선택과 단계적 상향(escalation)
+
+    복잡도 점수는 추가 요청사항 유무/길이, 인원, 여행 기간 같은 제약 개수로 계산하며,
+    ``complexity_threshold`` 점마다 한 티어씩 올라갑니다.
+
+    사용 예:
+        router = ModelRouter([ModelTier("small", small_llm), ModelTier("large", large_llm)])
+        tier = router.select(input_data)
+        with router.activate(tier):
+            result = await agent.run_once(input_data)
+    """
+
+    def __init__(
+        self,
+        tiers: List[ModelTier],
+        complexity_threshold: int = 2,
+        long_request_chars: int = 60,
+        large_group_size: int = 5,
+        long_trip_days: int = 10
+    ):
+        if not tiers:
+            raise ValueError("모델 티어가 하나 이상 필요합니다.")
+        self.tiers = tiers
+        self.complexity_threshold = max(1, complexity_threshold)
+        self.long_request_chars = long_request_chars
+        self.large_group_size = large_group_size
+        self.long_trip_days = long_trip_days
+        self._lock = threading.Lock()
+        self._stats = [TierStats() for _ in tiers]
+
+    @classmethod
+    def single(cls, llm: Any, name: str = "default") -> "ModelRouter":
+        """티어 하나짜리 라우터 (라우팅 없이 모델 하나만 사용)"""
+        model = getattr(llm, "model_name", None) or name
+        return cls([ModelTier(name, llm, *MODEL_PRICES.get(model, (0.0, 0.0)))])
+
+    def complexity(self, input_data: Dict[str, Any]) -> int:
+        """요청 복잡도 점수 (제약 조건 개수)"""
+        score = 0
+        custom_request = (input_data.get("customRequest") or "").strip()
+        if custom_request:
+            score += 1
+            if len(custom_request) >= self.long_request_chars:
+                score += 1
+        if input_data.get("numberOfPeople", 1) >= self.large_group_size:
+            score += 1
+        try:
+            days = (
+                datetime.strptime(input_data["endDate"], "%Y-%m-%d")
+                - datetime.strptime(input_data["startDate"], "%Y-%m-%d")
+            ).days
+        except (KeyError, TypeError, ValueError):
+            days = 0
+        if days >= self.long_trip_days:
+            score += 1
+        return score
+
+    def select(self, input_data: Dict[str, Any]) -> int:
+        """요청에 맞는 시작 티어 번호"""
+        return min(self.complexity(input_data) // self.complexity_threshold, len(self.tiers) - 1)
+
+    def next_tier(self, tier: int) -> Optional[int]:
+        """상향할 다음 티어 (이미 최상위면 None)"""
+        return tier + 1 if tier + 1 < len(self.tiers) else None
+
+    @property
+    def active_tier(self) -> int:
+        """현재 컨텍스트에서 실행 중인 티어 (없으면 0)"""
+        run = _active_run.get()
+        return run.tier if run is not None else 0
+
+    @property
+    def active_llm(self) -> Any:
+        """현재 컨텍스트에서 사용할 모델"""
+        return self.tiers[min(self.active_tier, len(self.tiers) - 1)].llm
+
+    @contextmanager
+    def activate(self, tier: int) -> Iterator[TierRun]:
+        """``tier`` 로 실행하는 구간 (구간 안의 LLM 호출 토큰은 이 시도에 누적)"""
+        run = TierRun(tier)
+        token = _active_run.set(run)
+        try:
+            yield run
+        finally:
+            _active_run.reset(token)
+
+    def record_usage(self, usage: Dict[str, int]) -> None:
+        """LLM 호출 한 번의 토큰 사용량을 현재 시도에 누적"""
+        run = _active_run.get()
+        if run is None:
+            return
+        run.llm_calls += 1
+        run.input_tokens += usage.get("inputTokens", 0)
+        run.output_tokens += usage.get("outputTokens", 0)
+
+    def record_run(self, run: TierRun, seconds: float) -> Dict[str, Any]:
+        """
+        시도 하나의 지연 시간, 토큰, 비용 기록
+
+        Returns:
+            응답 metadata용 요약
+        """
+        tier = self.tiers[run.tier]
+        cost = tier.cost(run.input_tokens, run.output_tokens)
+        with self._lock:
+            stats = self._stats[run.tier]
+            stats.runs += 1
+            stats.seconds += seconds
+            stats.input_tokens += run.input_tokens
+            stats.output_tokens += run.output_tokens
+            stats.cost += cost
+
+        metrics.observe("model_tier_duration_seconds", seconds, tier=tier.name)
+        metrics.inc("model_tier_runs_total", tier=tier.name)
+        if run.input_tokens:
+            metrics.inc("model_tier_tokens_total", run.input_tokens, tier=tier.name, type="input")
+        if run.output_tokens:
+            metrics.inc("model_tier_tokens_total", run.output_tokens, tier=tier.name, type="output")
+        if cost:
+            metrics.inc("model_tier_cost_usd_total", cost, tier=tier.name)
+
+        return {
+            "tier": tier.name,
+            "elapsedMs": round(seconds * 1000, 3),
+            "llmCalls": run.llm_calls,
+            "inputTokens": run.input_tokens,
+            "outputTokens": run.output_tokens,
+            "costUsd": round(cost, 6),
+        }
+
+    def record_escalation(self, from_tier: int, to_tier: int, reason: str) -> None:
+        """티어 상향 기록"""
+        with self._lock:
+            self._stats[from_tier].escalations += 1
+        metrics.inc(
+            "model_tier_escalations_total",
+            from_tier=self.tiers[from_tier].name,
+            to_tier=self.tiers[to_tier].name,
+            reason=reason
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """티어별 실행 수, 상향 비율, 평균 지연, 토큰, 비용"""
+        with self._lock:
+            return {
+                tier.name: {
+                    "runs": stats.runs,
+                    "escalations": stats.escalations,
+                    "escalationRate": stats.escalations / stats.runs if stats.runs else 0.0,
+                    "avgLatencyMs": round(stats.seconds / stats.runs * 1000, 3) if stats.runs else 0.0,
+                    "inputTokens": stats.input_tokens,
+                    "outputTokens": stats.output_tokens,
+                    "costUsd": round(stats.cost, 6),
+                }
+                for tier, stats in zip(self.tiers, self._stats)
+            }
@@ -0,0 +1,118 @@
+"""
+LLM 호출 전 사전 계산 단계
+
+여행지 후보 검색, 항공료/숙박비 산정, 총 예산 계산, 예산 필터링은
+모두 Mock DB와 가격표에 대한 순수 함수이므로 LLM 대신 Python으로 계산합니다.
+LLM에는 비용이 확정된 상위 후보만 넘겨 추천 이유와 팁만 작성하게 합니다.
+후보 비용은 ``CostEngine`` 으로 한 번에 계산합니다. (가격 변동성 없이 기본가 사용)
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from tools.catalog import Destination, get_catalog
+from tools.cost_engine import get_cost_engine
+from utils.metrics import timed
+
+
+@dataclass
+class CostedCandidate:
+    """비용 계산이 끝난 여행지 후보"""
+    
+    name: str
+    country: str
+    flightCost: int
+    accommodationCost: int
+    totalCost: int
+    perPersonCost: int
+    breakdown: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class PrecomputeResult:
+    """사전 계산 결과"""
+    
+    candidates: List[CostedCandidate]
+    considered: int
+    filteredOut: int
+    days: int
+    month: int
+
+
+@timed("precompute")
+def precompute_candidates(input_data: Dict[str, Any], top_n: int = 5) -> PrecomputeResult:
+    """
+    여행 스타일 후보를 검색하고 비용을 계산한 뒤 예산으로 걸러 상위 ``top_n`` 개를 고릅니다.
+    
+    - 예산이 있으면 1인 총비용이 예산 이하인 후보만 남기고, 예산에 가장 가까운 순으로 정렬
+    - 예산이 미정이면 가격대가 고르게 섞이도록 비용 순으로 정렬한 뒤 균등 간격으로 선택
+    
+    Args:
+        input_data: PreferencesRequest 딕셔너리
+        top_n: 선택할 후보 수
+    
+    Returns:
+        PrecomputeResult
+    
+    Raises:
+        ValueError: 날짜 형식이 잘못된 경우
+    """
+    start_date = datetime.strptime(input_data["startDate"], "%Y-%m-%d")
+    end_date = datetime.strptime(input_data["endDate"], "%Y-%m-%d")
+    days = max((end_date - start_date).days, 1)
+    people = input_data["numberOfPeople"]
+    
+    pool = get_catalog().by_style(input_data["travelStyle"])
+    costed = _cost_candidates(pool, days, people)
+    
+    budget: Optional[int] = None if input_data.get("isBudgetUndecided") else input_data.get("budget")
+    if budget is None:
+        selected = _spread_by_cost(costed, top_n)
+        filtered_out = 0
+    else:
+        affordable = [c for c in costed if c.perPersonCost <= budget]
+        filtered_out = len(costed) - len(affordable)
+        affordable.sort(key=lambda c: budget - c.perPersonCost)
+        selected = affordable[:top_n]
+    
+    return PrecomputeResult(
+        candidates=selected,
+        considered=len(costed),
+        filteredOut=filtered_out,
+        days=days,
+        month=start_date.month
+    )
+
+
+def _cost_candidates(pool: List[Destination], days: int, people: int) -> List[CostedCandidate]:
+    """후보 전체의 비용을 한 번에 계산 (가격 변동성 없이 기본가 사용)"""
+    if not pool:
+        return []
+    engine = get_cost_engine()
+    indices = engine.indices(names=[dest.name for dest in pool])
+    matrix = engine.cost_matrix(days=[days], people=[people], indices=indices)
+    
+    candidates = []
+    for i, dest in enumerate(pool):
+        budget = matrix.breakdown(i)
+        candidates.append(CostedCandidate(
+            name=dest.name,
+            country=dest.country,
+            flightCost=budget["breakdown"]["flight"],
+            accommodationCost=budget["breakdown"]["accommodation"],
+            totalCost=budget["total"],
+            perPersonCost=budget["perPerson"],
+            breakdown=budget["breakdown"]
+        ))
+    return candidates
+
+
+def _spread_by_cost(costed: List[CostedCandidate], top_n: int) -> List[CostedCandidate]:
+    """비용 순으로 정렬한 후보에서 가격대가 고르게 분포하도록 ``top_n`` 개 선택"""
+    ordered = sorted(costed, key=lambda c: c.perPersonCost)
+    if len(ordered) <= top_n:
+        return ordered
+    
+    step = (len(ordered) - 1) / (top_n - 1) if top_n > 1 else 0
+    return [ordered[round(i * step)] for i in range(top_n)]
@@ -0,0 +1,181 @@
+"""
+추천 결과 검증/보정
+
+LLM이 돌려준 여행지 항목을 ``DestinationInfo`` 로 하나씩 검증합니다.
+숫자에 통화 기호가 붙었거나 리스트가 문자열로 온 것 같은 가벼운 형식 오류는
+값 변환(coercion)으로 바로잡고, 그래도 통과하지 못한 항목만 따로 모아 보정 호출에 넘깁니다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from models.schemas import DestinationInfo
+from tools.catalog import get_catalog
+
+
+# 구조화 출력 모드에서 최종 결과를 제출하는 Tool 이름 (DestinationList 스키마)
+FINAL_ANSWER_TOOL = "DestinationList"
+
+INT_FIELDS = ("estimatedCost", "flightCost", "accommodationCost")
+LIST_FIELDS = ("highlights", "tips")
+TEXT_FIELDS = ("reason", "bestSeason", "weather")
+
+# 금액 앞뒤의 원화 표기 ("약 ₩1,800,000원" → "1,800,000")
+_WON_AFFIXES = re.compile(r"^(?:약|대략)?\s*(?:₩|KRW)?\s*(?P<body>.*?)\s*(?:원|KRW)?$", re.IGNORECASE)
+# 천 단위 구분 기호: 쉼표(소수점 허용) 또는 세 자리씩 끊은 마침표 ("1.800.000")
+_COMMA_GROUPED = re.compile(r"^\d{1,3}(?:,\d{3})+(?:\.\d+)?$")
+_DOT_GROUPED = re.compile(r"^\d{1,3}(?:\.\d{3})+$")
+_PLAIN_NUMBER = re.compile(r"^\d+(?:\.\d+)?$")
+# 단위가 붙은 금액 ("1억 2,000만", "180만", "1.8M", "700K")
+_NUMBER = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+_KOREAN_UNITS = re.compile(
+    rf"^(?:(?P<eok>{_NUMBER})\s*억)?\s*(?:(?P<man>{_NUMBER})\s*만)?\s*(?P<rest>{_NUMBER})?$"
+)
+_LATIN_UNIT = re.compile(rf"^(?P<number>{_NUMBER})\s*(?P<unit>[KkMm])$")
+_LATIN_UNITS = {"k": 1_000, "m": 1_000_000}
+_LIST_SEPARATORS = re.compile(r"\s*[,/·\n]\s*")
+
+
+@dataclass
+class ValidationReport:
+    """항목별 검증 결과"""
+
+    valid: List[Tuple[int, Dict[str, Any]]] = field(default_factory=list)  # (위치, 검증된 항목)
+    coerced: int = 0  # 값 변환 후 통과한 항목 수
+    invalid: List[Tuple[int, Any, str]] = field(default_factory=list)  # (위치, 원본 항목, 오류 메시지)
+
+    @property
+    def destinations(self) -> List[Dict[str, Any]]:
+        """통과한 항목 (입력 순서)"""
+        return [item for _, item in sorted(self.valid, key=lambda pair: pair[0])]
+
+
+def extract_items(parsed: Any, keys: Tuple[str, ...] = ("destinations",)) -> List[Any]:
+    """파싱된 응답에서 여행지 항목 리스트 추출 (리스트 또는 ``{"destinations": [...]}`` 같은 ``keys`` 중 하나)"""
+    if isinstance(parsed, list):
+        return parsed
+    if isinstance(parsed, dict):
+        for key in keys:
+            items = parsed.get(key)
+            if isinstance(items, list):
+                return items
+    return []
+
+
+def to_int(value: Any) -> Any:
+    """
+    비용 값 변환 (변환할 수 없으면 그대로 두어 검증 단계에서 걸러지고 보정 호출로 넘어가게 함)
+
+    - ``"₩1,800,000"``, ``"1.800.000원"``, ``1800000.0`` → ``1800000``
+    - ``"약 180만원"``, ``"1.8M"`` → ``1800000``
+    - ``"$1,200"``, ``"1.5"``, ``"180-200만원"`` → 그대로 (다른 통화, 원 단위 소수, 범위)
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, str):
+        amount = _parse_won(value)
+        if amount is not None:
+            return amount
+    return value
+
+
+def _parse_won(text: str) -> Optional[int]:
+    """원화 금액 문자열을 정수로 (정확히 읽을 수 없으면 None)"""
+    body = _WON_AFFIXES.match(text.strip()).group("body")
+    if not body:
+        return None
+
+    if _DOT_GROUPED.match(body):
+        amount = Decimal(body.replace(".", ""))
+    elif _COMMA_GROUPED.match(body) or _PLAIN_NUMBER.match(body):
+        amount = _decimal(body)
+    elif (match := _LATIN_UNIT.match(body)) is not None:
+        amount = _decimal(match["number"]) * _LATIN_UNITS[match["unit"].lower()]
+    elif (match := _KOREAN_UNITS.match(body)) is not None and (match["eok"] or match["man"]):
+        amount = (
+            _decimal(match["eok"] or "0") * 100_000_000
+            + _decimal(match["man"] or "0") * 10_000
+            + _decimal(match["rest"] or "0")
+        )
+    else:
+        return None
+    # 원 단위 아래가 남으면 (예: "1.5") 잘못 읽었을 가능성이 높으므로 변환하지 않음
+    return int(amount) if amount == amount.to_integral_value() else None
+
+
+def _decimal(number: str) -> Decimal:
+    return Decimal(number.replace(",", ""))
+
+
+def _to_list(value: Any) -> Any:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [part for part in _LIST_SEPARATORS.split(value.strip()) if part]
+    return value
+
+
+def coerce_destination(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    흔한 형식 오류를 값 변환으로 보정
+
+    - 비용: ``"₩1,800,000"``, ``"약 180만원"``, ``1800000.0`` → ``1800000`` (읽을 수 없는 값은 그대로)
+    - 리스트: ``"바나힐, 미케비치"`` → ``["바나힐", "미케비치"]``
+    - 텍스트: 리스트로 온 경우 이어 붙임
+    - 국가/명소/시즌 누락: 카탈로그 값으로 채움
+    """
+    item = dict(item)
+    for name in INT_FIELDS:
+        if name in item:
+            item[name] = to_int(item[name])
+    for name in LIST_FIELDS:
+        if name in item:
+            item[name] = _to_list(item[name])
+    for name in TEXT_FIELDS:
+        if isinstance(item.get(name), list):
+            item[name] = ", ".join(str(part) for part in item[name])
+
+    dest = get_catalog().get(item["name"]) if isinstance(item.get("name"), str) else None
+    if dest is not None:
+        item.setdefault("country", dest.country)
+        if not item.get("highlights"):
+            item["highlights"] = list(dest.highlights)
+        if not item.get("bestSeason"):
+            item["bestSeason"] = dest.bestSeason
+    return item
+
+
+def _error_summary(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in error.errors()
+    )
+
+
+def validate_destinations(items: List[Any]) -> ValidationReport:
+    """
+    항목별로 ``DestinationInfo`` 검증 (실패 시 값 변환 후 한 번 더)
+
+    한 항목이 틀려도 나머지 항목은 그대로 사용합니다.
+    """
+    report = ValidationReport()
+    for index, item in enumerate(items):
+        try:
+            report.valid.append((index, DestinationInfo.model_validate(item).model_dump()))
+            continue
+        except ValidationError as e:
+            error = e
+        if isinstance(item, dict):
+            try:
+                report.valid.append((index, DestinationInfo.model_validate(coerce_destination(item)).model_dump()))
+                report.coerced += 1
+                continue
+            except ValidationError as e:
+                error = e
+        report.invalid.append((index, item, _error_summary(error)))
+    return report
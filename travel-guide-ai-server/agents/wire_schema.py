@@ -0,0 +1,108 @@
+"""
+LLM 출력용 압축 스키마
+
+추천 전체를 생성하는 경로(graph, 스트리밍)에서 LLM은 ``DestinationInfo`` 의 긴 camelCase 키 대신
+짧은 키와 위치 기반 비용 배열로 답하고, 서버가 이를 ``DestinationInfo`` 형식으로 펼칩니다.
+``estimatedCost`` 는 생성하지 않고 항공료/숙박비와 여행 일수·인원으로 서버에서 계산합니다.
+
+    {"d": [{"n": "다낭", "c": "베트남", "p": [700000, 400000], "h": ["바나힐"], "r": "...", "s": "3월-8월", "w": "...", "t": ["..."]}]}
+
+- ``n``: 이름, ``c``: 국가, ``s``: 최적 시즌 (카탈로그 여행지는 ``c``/``s`` 생략 가능)
+- ``p``: [항공료, 숙박비] (인원·기간 전체, 원)
+- ``h``: 주요 명소, ``r``: 추천 이유, ``w``: 예상 날씨, ``t``: 여행 팁
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from agents.structured_output import to_int
+from tools.price_tool import budget_breakdown
+
+
+# 압축 형식의 최상위 배열 키
+WIRE_LIST_KEY = "d"
+
+# 압축 키 → DestinationInfo 필드
+WIRE_FIELDS = {
+    "n": "name",
+    "c": "country",
+    "h": "highlights",
+    "r": "reason",
+    "s": "bestSeason",
+    "w": "weather",
+    "t": "tips",
+}
+
+WIRE_OUTPUT_FORMAT = """**출력 형식 (압축 JSON):**
+{"d": [{"n": 이름, "c": 국가, "p": [항공료, 숙박비], "h": [명소], "r": 추천 이유, "s": 최적 시즌, "w": 예상 날씨, "t": [팁]}]}
+- p: 인원·기간 전체 금액(원, 정수). 총 비용은 서버가 계산하므로 쓰지 마세요
+- 카탈로그에 있는 여행지는 c, s를 생략해도 됩니다
+- 추천 개수와 팁 개수는 사용자 메시지의 지시를 따르세요"""
+
+
+class WireDestination(BaseModel):
+    """압축 형식 여행지 항목 (구조화 출력 Tool 스키마)"""
+
+    n: str = Field(description="여행지 이름")
+    c: Optional[str] = Field(None, description="국가 (카탈로그 여행지는 생략 가능)")
+    p: List[int] = Field(description="[항공료, 숙박비] 인원·기간 전체 금액 (원)")
+    h: List[str] = Field(description="주요 명소")
+    r: str = Field(description="추천 이유")
+    s: Optional[str] = Field(None, description="최적 시즌 (카탈로그 여행지는 생략 가능)")
+    w: Optional[str] = Field(None, description="예상 날씨")
+    t: List[str] = Field(default_factory=list, description="여행 팁")
+
+
+class WireDestinationList(BaseModel):
+    """압축 형식 추천 목록"""
+
+    d: List[WireDestination] = Field(description="추천 여행지 목록")
+
+
+def is_wire_item(item: Any) -> bool:
+    """압축 형식 항목인지 (``n`` 키가 있고 ``name`` 키가 없음)"""
+    return isinstance(item, dict) and "n" in item and "name" not in item
+
+
+def expand_item(item: Any, days: int, people: int) -> Any:
+    """
+    압축 형식 항목 하나를 ``DestinationInfo`` 형식으로 펼칩니다.
+
+    ``p`` 의 항공료/숙박비로 ``estimatedCost`` 를 계산합니다. ``"₩700,000"`` 같은 비용도 숫자로 읽어
+    계산하되, 항공료/숙박비 값은 그대로 옮겨 이후 값 변환/검증 단계(와 통계)에서 처리되게 합니다.
+    비용을 읽을 수 없으면(``"$500"``, 범위, 항목 수 부족) 예외 없이 ``estimatedCost`` 를 비워 두므로
+    그 항목은 검증에서 실패해 보정 호출 대상이 됩니다.
+    압축 형식이 아닌 항목은 그대로 반환합니다.
+    """
+    if not is_wire_item(item):
+        return item
+
+    expanded = {field: item[key] for key, field in WIRE_FIELDS.items() if item.get(key) is not None}
+    costs = item.get("p")
+    if isinstance(costs, list) and len(costs) >= 2:
+        expanded["flightCost"], expanded["accommodationCost"] = costs[0], costs[1]
+        parsed = _wire_costs(costs[0], costs[1])
+        if parsed is not None:
+            expanded["estimatedCost"] = budget_breakdown(*parsed, days, people)["total"]
+    return expanded
+
+
+def _wire_costs(flight: Any, accommodation: Any) -> Optional[Tuple[int, int]]:
+    """항공료/숙박비를 원 단위 정수로 (하나라도 정확히 읽을 수 없으면 None)"""
+    values = (to_int(flight), to_int(accommodation))
+    if all(isinstance(value, int) and not isinstance(value, bool) and value >= 0 for value in values):
+        return values
+    return None
+
+
+def expand_items(items: List[Any], days: int, people: int) -> List[Any]:
+    """항목 리스트 전체를 펼침 (압축 형식이 아닌 항목은 그대로)"""
+    return [expand_item(item, days, people) for item in items]
+
+
+def compact_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """``DestinationInfo`` 형식 항목을 압축 형식으로 변환 (``estimatedCost`` 는 버림)"""
+    compact = {key: item[field] for key, field in WIRE_FIELDS.items() if item.get(field) is not None}
+    compact["p"] = [item["flightCost"], item["accommodationCost"]]
+    return compact
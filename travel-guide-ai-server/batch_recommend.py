@@ -0,0 +1,96 @@
+"""
+일괄 추천 CLI
+
+JSONL 파일(한 줄에 PreferencesRequest 하나)을 읽어 DestinationAgent.run_batch로
+추천을 생성하고, 입력 순서대로 결과를 JSONL로 저장합니다.
+
+실행:
+    python batch_recommend.py profiles.jsonl results.jsonl --max-concurrency 4
+"""
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+from pydantic import ValidationError
+
+from agents.base_agent import configure_tracing
+from agents.destination_agent import DestinationAgent
+from models.schemas import PreferencesRequest
+
+
+def load_requests(path: str) -> List[Any]:
+    """
+    JSONL 입력 로드
+
+    Returns:
+        줄별 PreferencesRequest 딕셔너리 (잘못된 줄은 에러 메시지 문자열)
+    """
+    items: List[Any] = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                items.append(PreferencesRequest.model_validate_json(line).model_dump())
+            except ValidationError as e:
+                items.append(f"{line_no}번째 줄 입력 오류: {e.errors()[0]['msg']}")
+    return items
+
+
+def to_record(index: int, output: Any) -> Dict[str, Any]:
+    """실행 결과를 출력 레코드로 변환"""
+    if isinstance(output, str):
+        return {"index": index, "status": "error", "error": output}
+    if isinstance(output, Exception):
+        return {"index": index, "status": "error", "error": str(output)}
+    if output.get("error"):
+        return {"index": index, "status": "error", "error": output["error"]}
+    return {
+        "index": index,
+        "status": "ok",
+        "destinations": output.get("destinations", []),
+        "metadata": output.get("metadata"),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="여행지 일괄 추천")
+    parser.add_argument("input", help="입력 JSONL (줄마다 PreferencesRequest)")
+    parser.add_argument("output", help="출력 JSONL")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="동시 실행 수")
+    args = parser.parse_args()
+
+    items = load_requests(args.input)
+    valid = [(index, item) for index, item in enumerate(items) if isinstance(item, dict)]
+
+    print(f"🚀 {len(items)}건 일괄 추천 시작 (유효 {len(valid)}건)")
+    start_time = time.time()
+
+    configure_tracing()
+    agent = DestinationAgent()
+    outputs = await agent.run_batch([item for _, item in valid], max_concurrency=args.max_concurrency)
+
+    results: List[Any] = list(items)
+    for (index, _), output in zip(valid, outputs):
+        results[index] = output
+
+    failed = 0
+    with open(args.output, "w", encoding="utf-8") as f:
+        for index, output in enumerate(results):
+            record = to_record(index, output)
+            failed += record["status"] == "error"
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    print(f"✅ 완료: 성공 {len(results) - failed}건, 실패 {failed}건, "
+          f"{time.time() - start_time:.2f}초 → {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,5 @@
+"""
+벤치마크 스크립트 모음
+
+서버 디렉토리에서 ``python -m benchmarks.<이름>`` 형태로 실행합니다.
+"""
@@ -0,0 +1,116 @@
+"""
+DestinationAgent 동시성 벤치마크
+
+가짜 LLM(고정 지연)을 붙인 DestinationAgent를 동시 클라이언트 수를 늘려가며 실행하고,
+처리량과 이벤트 루프 지연(다른 요청이 기다리는 시간)을 측정합니다.
+
+실행:
+    python -m benchmarks.agent_load --latency 0.5 --clients 1 2 4 8 16
+    python -m benchmarks.agent_load --blocking   # 동기 invoke 방식과 비교
+"""
+
+import os
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from agents.destination_agent import DestinationAgent
+from benchmarks.fake_llm import FakeChatModel
+
+
+SAMPLE_INPUT = {
+    "startDate": "2024-08-01",
+    "endDate": "2024-08-07",
+    "budget": 2000000,
+    "isBudgetUndecided": False,
+    "numberOfPeople": 2,
+    "travelStyle": "beach",
+    "companion": "친구",
+    "customRequest": None,
+}
+
+
+def build_agent(latency: float, max_concurrency: int, blocking: bool) -> DestinationAgent:
+    """가짜 LLM을 사용하는 Agent 생성"""
+    agent = DestinationAgent(max_concurrency=max_concurrency)
+    agent.llm = FakeChatModel(latency=latency)
+
+    if blocking:
+        # 기존 동작 재현: 동기 invoke가 이벤트 루프를 막습니다.
+        async def blocking_invoke(llm, messages):
+            return llm.invoke(messages)
+        agent._ainvoke_llm = blocking_invoke
+
+    return agent
+
+
+async def probe_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> List[float]:
+    """
+    이벤트 루프 지연 측정
+
+    ``interval`` 만큼 sleep한 뒤 실제로 깨어나기까지 걸린 추가 시간을 기록합니다.
+    /health 같은 가벼운 요청이 겪는 대기 시간과 같습니다.
+    """
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+    return lags
+
+
+async def run_level(agent: DestinationAgent, clients: int, requests_per_client: int) -> Dict:
+    """동시 클라이언트 수 하나에 대한 측정"""
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe_loop_lag(stop))
+
+    async def client():
+        for _ in range(requests_per_client):
+            await agent.run(SAMPLE_INPUT)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    lags = await prober
+    total = clients * requests_per_client
+
+    return {
+        "clients": clients,
+        "requests": total,
+        "elapsed": elapsed,
+        "throughput": total / elapsed,
+        "maxLoopLag": max(lags) if lags else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="DestinationAgent 동시성 벤치마크")
+    parser.add_argument("--latency", type=float, default=0.5, help="가짜 LLM 응답 지연 (초)")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--requests-per-client", type=int, default=3)
+    parser.add_argument("--max-concurrency", type=int, default=8, help="워커당 동시 LLM 호출 제한")
+    parser.add_argument("--blocking", action="store_true", help="동기 invoke 방식으로 실행")
+    args = parser.parse_args()
+
+    agent = build_agent(args.latency, args.max_concurrency, args.blocking)
+    mode = "blocking invoke" if args.blocking else "async ainvoke"
+
+    print("=" * 60)
+    print(f"DestinationAgent 부하 테스트 ({mode}, LLM 지연 {args.latency}s, "
+          f"동시 호출 제한 {args.max_concurrency})")
+    print("=" * 60)
+    print(f"{'clients':>8} {'requests':>9} {'elapsed(s)':>11} {'req/s':>8} {'max loop lag(s)':>16}")
+
+    for clients in args.clients:
+        result = await run_level(agent, clients, args.requests_per_client)
+        print(f"{result['clients']:>8} {result['requests']:>9} {result['elapsed']:>11.2f} "
+              f"{result['throughput']:>8.2f} {result['maxLoopLag']:>16.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
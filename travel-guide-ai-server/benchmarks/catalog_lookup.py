@@ -0,0 +1,117 @@
+"""
+여행지 조회 마이크로벤치마크
+
+기존 ``get_destination_details`` 방식(스타일별 목록 전체를 돌며 매번 lower() 비교)과
+DestinationCatalog 색인 조회의 지연 시간을 비교합니다.
+카탈로그 크기를 늘려 수천 개 규모에서의 차이도 측정합니다.
+
+실행:
+    python -m benchmarks.catalog_lookup --sizes 23 1000 5000
+"""
+
+import argparse
+import random
+import timeit
+from typing import Any, Dict, List, Optional
+
+from tools.catalog import DestinationCatalog, get_catalog
+
+
+def legacy_lookup(db: Dict[str, List[Dict[str, Any]]], destination_name: str) -> Optional[Dict[str, Any]]:
+    """기존 선형 탐색 방식 (하이라이트/시즌 dict 재생성 포함)"""
+    for style, destinations in db.items():
+        for dest in destinations:
+            if dest["name"].lower() == destination_name.lower():
+                highlights_map = {
+                    "다낭": ["바나힐", "미케비치", "호이안"],
+                    "발리": ["우붓", "탄롯사원", "테갈랄랑 라이스테라스"],
+                    "교토": ["금각사", "후시미이나리", "기요미즈데라"],
+                    "제주도": ["한라산", "성산일출봉", "우도"],
+                }
+                season_map = {
+                    "다낭": "3월-8월",
+                    "발리": "4월-10월",
+                    "교토": "3월-5월, 10월-11월",
+                    "제주도": "4월-6월, 9월-11월",
+                }
+                return {
+                    **dest,
+                    "style": style,
+                    "highlights": highlights_map.get(destination_name, ["명소1", "명소2", "명소3"]),
+                    "bestSeason": season_map.get(destination_name, "연중"),
+                }
+    return None
+
+
+def catalog_lookup(catalog: DestinationCatalog, destination_name: str) -> Optional[Dict[str, Any]]:
+    """카탈로그 색인 조회 (get_destination_details와 같은 결과 형태)"""
+    dest = catalog.get(destination_name)
+    if dest is None:
+        return None
+    return {
+        **dest.summary(),
+        "style": dest.style,
+        "highlights": list(dest.highlights),
+        "bestSeason": dest.bestSeason,
+    }
+
+
+def scaled_catalog(size: int) -> DestinationCatalog:
+    """기본 카탈로그를 복제해 ``size`` 개 규모의 카탈로그 생성"""
+    base = list(get_catalog())
+    records = []
+    for i in range(size):
+        dest = base[i % len(base)]
+        suffix = "" if i < len(base) else f"-{i}"
+        records.append({
+            "name": f"{dest.name}{suffix}",
+            "country": dest.country,
+            "style": dest.style,
+            "avgCost": dest.avgCost + i,
+            "aliases": [f"{alias}{suffix}" for alias in dest.aliases],
+            "highlights": list(dest.highlights),
+            "bestSeason": dest.bestSeason,
+        })
+    return DestinationCatalog.from_records(records)
+
+
+def measure(size: int, lookups: int, seed: int) -> Dict[str, float]:
+    """카탈로그 크기 하나에 대한 조회 지연 (μs/조회)"""
+    catalog = scaled_catalog(size)
+    db = catalog.as_style_db()
+    rng = random.Random(seed)
+    names = [rng.choice(catalog.destinations).name for _ in range(lookups)]
+
+    legacy = timeit.timeit(lambda: [legacy_lookup(db, n) for n in names], number=1)
+    indexed = timeit.timeit(lambda: [catalog_lookup(catalog, n) for n in names], number=1)
+    cost_range = timeit.timeit(lambda: catalog.in_cost_range(1500000, 2500000), number=lookups)
+
+    return {
+        "size": size,
+        "legacyUs": legacy / lookups * 1e6,
+        "catalogUs": indexed / lookups * 1e6,
+        "costRangeUs": cost_range / lookups * 1e6,
+        "speedup": legacy / indexed if indexed else float("inf"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여행지 조회 마이크로벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[len(get_catalog()), 1000, 5000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("여행지 조회 지연 비교 (μs/조회)")
+    print("=" * 60)
+    print(f"{'size':>8} {'linear scan':>12} {'catalog':>10} {'cost range':>11} {'speedup':>9}")
+
+    for size in args.sizes:
+        r = measure(size, args.lookups, args.seed)
+        print(f"{r['size']:>8} {r['legacyUs']:>12.2f} {r['catalogUs']:>10.2f} "
+              f"{r['costRangeUs']:>11.2f} {r['speedup']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
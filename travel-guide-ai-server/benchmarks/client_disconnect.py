@@ -0,0 +1,188 @@
+"""
+클라이언트 연결 종료 시 작업 취소 점검
+
+느린 synthetic LLM 백엔드로 실제 uvicorn 서버를 같은 프로세스에 띄우고, 응답 전에 연결을 끊는
+클라이언트로 다음을 확인합니다.
+
+- 단독 요청: 연결이 끊기면 Agent 실행과 진행 중인 LLM 호출이 취소되는지 (outbound cancelled)
+- 병합된 요청: 같은 요청을 기다리던 한쪽만 끊기면 실행은 계속되어 남은 쪽이 200을 받는지
+- 스트리밍: SSE 스트림 도중 끊기면 Agent 스트림이 중단되는지
+- 정리: 끝난 뒤 요청 병합/실행 슬롯/asyncio Task가 남지 않는지
+
+실행:
+    python -m benchmarks.client_disconnect --llm-latency 2.0
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import sys
+import time
+from typing import Any, Dict
+
+import httpx
+import uvicorn
+
+from benchmarks.outbound_resilience import API_INPUT, Checks
+
+ENDPOINT = "/api/recommendations/destinations"
+STREAM_ENDPOINT = "/api/recommendations/destinations/stream"
+METRIC_LINE = re.compile(r"^travel_guide_(\w+)(\{[^}]*\})? (\S+)$")
+
+
+def payload(style: str) -> Dict[str, Any]:
+    return {**API_INPUT, "travelStyle": style}
+
+
+async def scrape(client: httpx.AsyncClient) -> Dict[str, float]:
+    """/metrics를 ``이름{라벨}`` → 값으로 읽음"""
+    values: Dict[str, float] = {}
+    for line in (await client.get("/metrics")).text.splitlines():
+        match = METRIC_LINE.match(line)
+        if match:
+            name, labels, value = match.groups()
+            values[name + (labels or "")] = float(value)
+    return values
+
+
+def delta(before: Dict[str, float], after: Dict[str, float], name: str) -> float:
+    """``name`` 으로 시작하는 시계열의 증가량 합"""
+    keys = {key for key in after if key == name or key.startswith(name + "{")}
+    return sum(after[key] - before.get(key, 0.0) for key in keys)
+
+
+async def disconnect_after(url: str, path: str, body: Dict[str, Any], seconds: float) -> None:
+    """``seconds`` 안에 응답이 오지 않으면 연결을 끊는 클라이언트"""
+    async with httpx.AsyncClient(base_url=url) as client:
+        try:
+            await asyncio.wait_for(client.post(path, json=body), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def settle(client: httpx.AsyncClient, timeout: float = 3.0) -> Dict[str, float]:
+    """서버가 취소를 마칠 때까지 (진행 중 실행/슬롯이 0이 될 때까지) 대기"""
+    deadline = time.monotonic() + timeout
+    while True:
+        values = await scrape(client)
+        idle = values.get("single_flight_in_flight", 0) == 0 and values.get("admission_in_flight", 0) == 0
+        if idle or time.monotonic() >= deadline:
+            return values
+        await asyncio.sleep(0.05)
+
+
+async def run_checks(url: str, args: argparse.Namespace) -> Checks:
+    checks = Checks()
+    cut = args.llm_latency / 2
+    async with httpx.AsyncClient(base_url=url, timeout=None) as client:
+        # 기준: 끝까지 실행해 실행당 평균 출력 토큰을 기록
+        print("\n[기준] 끝까지 실행")
+        start = time.perf_counter()
+        response = await client.post(ENDPOINT, json=payload("culture"))
+        elapsed = time.perf_counter() - start
+        checks.add("baseline", "완료된 요청은 200", response.status_code == 200,
+                   f"status={response.status_code}, {elapsed:.2f}s")
+        baseline_tasks = len(asyncio.all_tasks())
+
+        print(f"\n[단독] {cut:.1f}s 뒤 연결 종료")
+        before = await scrape(client)
+        start = time.perf_counter()
+        await disconnect_after(url, ENDPOINT, payload("beach"), cut)
+        after = await settle(client)
+        cancel_ms = (time.perf_counter() - start - cut) * 1000
+        checks.add("alone", "연결 종료 집계", delta(before, after, "client_disconnects_total") == 1,
+                   f"client_disconnects_total +{delta(before, after, 'client_disconnects_total'):.0f}")
+        checks.add("alone", "Agent 실행 취소", delta(before, after, "cancelled_runs_total") == 1,
+                   f"cancelled_runs_total +{delta(before, after, 'cancelled_runs_total'):.0f}, "
+                   f"정리까지 {cancel_ms:.0f} ms")
+        cancelled_calls = sum(
+            after[key] - before.get(key, 0.0) for key in after if 'outcome="cancelled"' in key
+        )
+        checks.add("alone", "LLM 호출 취소", cancelled_calls >= 1,
+                   f"outbound_attempts_total{{outcome=cancelled}} +{cancelled_calls:.0f}")
+        saved = delta(before, after, "cancelled_tokens_saved_total")
+        checks.add("alone", "절약 토큰 추정", saved > 0, f"cancelled_tokens_saved_total +{saved:.0f}")
+
+        print(f"\n[병합] 같은 요청 2건 중 1건만 {cut:.1f}s 뒤 연결 종료")
+        before = await scrape(client)
+        body = payload("nature")
+        stayed = asyncio.create_task(client.post(ENDPOINT, json=body))
+        await asyncio.sleep(0.05)
+        await disconnect_after(url, ENDPOINT, body, cut)
+        response = await stayed
+        after = await settle(client)
+        checks.add("coalesced", "남은 클라이언트는 200", response.status_code == 200,
+                   f"status={response.status_code}")
+        checks.add("coalesced", "공유 실행은 취소되지 않음", delta(before, after, "cancelled_runs_total") == 0,
+                   f"client_disconnects_total +{delta(before, after, 'client_disconnects_total'):.0f}, "
+                   f"cancelled_runs_total +{delta(before, after, 'cancelled_runs_total'):.0f}")
+
+        print(f"\n[스트리밍] {cut:.1f}s 뒤 연결 종료")
+        before = await scrape(client)
+        async with httpx.AsyncClient(base_url=url) as streamer:
+            try:
+                async with streamer.stream("POST", STREAM_ENDPOINT, json=payload("city")) as stream:
+                    await asyncio.wait_for(stream.aread(), timeout=cut)
+            except asyncio.TimeoutError:
+                pass
+        await asyncio.sleep(0.2)
+        after = await settle(client)
+        checks.add("stream", "스트림 중단", delta(before, after, "client_disconnects_total") == 1
+                   and delta(before, after, "cancelled_runs_total") == 1,
+                   f"client_disconnects_total +{delta(before, after, 'client_disconnects_total'):.0f}, "
+                   f"cancelled_runs_total +{delta(before, after, 'cancelled_runs_total'):.0f}")
+
+        print("\n[정리]")
+        checks.add("cleanup", "진행 중 실행/슬롯 없음",
+                   after.get("single_flight_in_flight", 0) == 0 and after.get("admission_in_flight", 0) == 0,
+                   f"single_flight_in_flight={after.get('single_flight_in_flight', 0):.0f}, "
+                   f"admission_in_flight={after.get('admission_in_flight', 0):.0f}")
+        await asyncio.sleep(0.2)
+        tasks = len(asyncio.all_tasks())
+        checks.add("cleanup", "남은 asyncio Task 없음", tasks <= baseline_tasks,
+                   f"기준 {baseline_tasks}개 → {tasks}개")
+    return checks
+
+
+async def run(args: argparse.Namespace) -> int:
+    import main
+
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=0, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        checks = await run_checks(f"http://127.0.0.1:{port}", args)
+    finally:
+        server.should_exit = True
+        await task
+
+    print(f"\n{len(checks.rows) - checks.failed}/{len(checks.rows)} checks passed")
+    return 1 if checks.failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="클라이언트 연결 종료 시 작업 취소 점검")
+    parser.add_argument("--llm-latency", type=float, default=2.0, help="synthetic LLM 첫 토큰 지연 (초)")
+    args = parser.parse_args()
+
+    os.environ.update({
+        "LLM_BACKEND": "synthetic",
+        "LLM_SYNTHETIC_LATENCY": str(args.llm_latency),
+        "LLM_SYNTHETIC_TOKENS_PER_SECOND": "1000",
+        "AGENT_WARMUP_CONNECT": "False",
+        "REQUEST_TIMEOUT": "0",
+        "CACHE_ENABLED": "False",
+        "CANCEL_ON_DISCONNECT": "True",
+    })
+
+    print("=" * 70)
+    print(f"클라이언트 연결 종료 시 작업 취소 점검 (LLM 지연 {args.llm_latency}s)")
+    print("=" * 70)
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+날씨/이벤트 조회 벤치마크
+
+추천 후보들의 날씨와 이벤트를 붙이는 작업을 두 가지 방식으로 비교합니다.
+
+- tools: 여행지 × 월마다 ``get_weather_forecast`` / ``check_seasonal_events`` Tool 호출
+- bulk: ``ClimateStore.bulk`` 한 번 호출
+
+실행:
+    python -m benchmarks.climate_lookup --candidates 5 23 --months 1 12 --repeat 200
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from tools.catalog import get_catalog
+from tools.climate import get_climate_store
+from tools.weather_tool import check_seasonal_events, get_weather_forecast
+
+
+def with_tools(names: List[str], months: List[int]) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    result: Dict[str, Dict[int, Dict[str, Any]]] = {}
+    for name in names:
+        for month in months:
+            weather = get_weather_forecast.invoke({"destination": name, "month": month})
+            events = check_seasonal_events.invoke({"destination": name, "month": month})
+            result.setdefault(name, {})[month] = {
+                **weather,
+                "events": events["events"] if events["hasEvents"] else []
+            }
+    return result
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    """평균 호출 시간 (µs)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="날씨/이벤트 조회 벤치마크")
+    parser.add_argument("--candidates", type=int, nargs="+", default=[5, len(get_catalog())],
+                        help="조회할 여행지 수")
+    parser.add_argument("--months", type=int, nargs="+", default=[1, 12],
+                        help="조회할 개월 수 (1이면 한 달)")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    store = get_climate_store()
+    all_names = [dest.name for dest in get_catalog()]
+
+    print("=" * 64)
+    print("날씨/이벤트 조회: Tool 반복 호출 vs ClimateStore.bulk")
+    print("=" * 64)
+    print(f"{'places':>7} {'months':>7} {'tools µs':>12} {'bulk µs':>10} {'speedup':>9} {'same':>6}")
+
+    for count in args.candidates:
+        names = all_names[:count]
+        for month_count in args.months:
+            months = list(range(1, month_count + 1))
+            same = with_tools(names, months) == store.bulk(names, months)
+            tools_us = measure(lambda: with_tools(names, months), args.repeat)
+            bulk_us = measure(lambda: store.bulk(names, months), args.repeat)
+            print(f"{count:>7} {month_count:>7} {tools_us:>12.1f} {bulk_us:>10.1f} "
+                  f"{tools_us / bulk_us:>8.1f}x {str(same):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+비용 행렬 계산 벤치마크
+
+여행지 × 여행 일수 × 인원 전체 조합의 비용 breakdown을 만들고 예산으로 걸러 순위를 매기는 작업을
+두 가지 방식으로 비교합니다.
+
+- tools loop: 조합마다 ``get_flight_price`` / ``get_accommodation_price`` / ``calculate_total_budget``
+  Tool을 호출하고 Python으로 필터링/정렬 (Agent가 Tool을 하나씩 부르는 방식)
+- CostEngine: NumPy 배열로 한 번에 계산하고 벡터화된 필터링/순위
+
+두 방식의 결과(변동성 없는 기본가 기준)가 같은지도 확인합니다.
+
+실행:
+    python -m benchmarks.cost_matrix --sizes 23 200 1000 --days 3 14 --people 1 6
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+import tools.catalog as catalog_module
+import tools.price_tool as price_tool
+from tools.catalog import DestinationCatalog, get_catalog
+from tools.cost_engine import CostEngine
+from tools.price_tool import calculate_total_budget, get_accommodation_price, get_flight_price, seed_prices
+
+
+def scaled_catalog(size: int) -> DestinationCatalog:
+    """기본 카탈로그를 복제해 가격이 조금씩 다른 ``size`` 개 규모의 카탈로그 생성"""
+    base = list(get_catalog())
+    records = []
+    for i in range(size):
+        dest = base[i % len(base)]
+        suffix = "" if i < len(base) else f"-{i}"
+        records.append({
+            "name": f"{dest.name}{suffix}",
+            "country": dest.country,
+            "style": dest.style,
+            "avgCost": dest.avgCost + i,
+            "flightPrice": dest.flightPrice and dest.flightPrice + i * 100,
+            "accommodationPerNight": dest.accommodationPerNight and dest.accommodationPerNight + i * 10,
+        })
+    return DestinationCatalog.from_records(records)
+
+
+def tools_loop(names: List[str], days: List[int], people: List[int], budget: int, top_n: int) -> Dict[str, Any]:
+    """조합마다 Tool을 호출해 비용을 계산하고 조합별 상위 여행지 선택"""
+    per_person: Dict[tuple, int] = {}
+    for name in names:
+        for d in days:
+            for p in people:
+                flight = get_flight_price.func(name, people=p)
+                accommodation = get_accommodation_price.func(name, nights=d, people=p)
+                total = calculate_total_budget.func(flight["totalPrice"], accommodation["totalPrice"], d, p)
+                per_person[(name, d, p)] = total["perPerson"]
+
+    ranking = {}
+    for d in days:
+        for p in people:
+            affordable = [(budget - per_person[(n, d, p)], i) for i, n in enumerate(names) if per_person[(n, d, p)] <= budget]
+            affordable.sort()
+            ranking[(d, p)] = [names[i] for _, i in affordable[:top_n]]
+    return {"perPerson": per_person, "ranking": ranking}
+
+
+def engine_run(engine: CostEngine, days: List[int], people: List[int], budget: int, top_n: int) -> Dict[str, Any]:
+    """CostEngine으로 전체 행렬 계산 + 조합별 상위 여행지 선택"""
+    matrix = engine.cost_matrix(days, people)
+    top = matrix.rank(budget, top_n)
+    return {"matrix": matrix, "top": top}
+
+
+def measure(size: int, days: List[int], people: List[int], budget: int, top_n: int, repeat: int) -> Dict[str, Any]:
+    catalog = scaled_catalog(size)
+    catalog_module._catalog = catalog  # Tool 함수가 같은 카탈로그를 조회하도록
+    names = [dest.name for dest in catalog]
+    engine = CostEngine.from_catalog(catalog, seed=0)
+
+    # 정확성: 변동성을 끈 기본가로 비교 (Tool은 항공료에 변동성이 있으므로 jitter=False 경로와 비교)
+    original = price_tool.flight_price_per_person
+    price_tool.flight_price_per_person = lambda destination, jitter=True: original(destination, jitter=False)
+    try:
+        start = time.perf_counter()
+        loop = tools_loop(names, days, people, budget, top_n)
+        loop_seconds = time.perf_counter() - start
+    finally:
+        price_tool.flight_price_per_person = original
+
+    engine_seconds = min(
+        _timed(lambda: engine_run(engine, days, people, budget, top_n)) for _ in range(repeat)
+    )
+    result = engine_run(engine, days, people, budget, top_n)
+    matrix, top = result["matrix"], result["top"]
+
+    mismatches = sum(
+        1
+        for i, name in enumerate(names)
+        for t, d in enumerate(days)
+        for k, p in enumerate(people)
+        if int(matrix.per_person[i, t, k]) != loop["perPerson"][(name, d, p)]
+    )
+    ranking_mismatches = sum(
+        1
+        for t, d in enumerate(days)
+        for k, p in enumerate(people)
+        if [names[i] for i in top[:, t, k] if i >= 0] != loop["ranking"][(d, p)]
+    )
+
+    return {
+        "size": size,
+        "cells": matrix.total.size,
+        "loopMs": loop_seconds * 1000,
+        "engineMs": engine_seconds * 1000,
+        "speedup": loop_seconds / engine_seconds if engine_seconds else float("inf"),
+        "mismatches": mismatches + ranking_mismatches,
+    }
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비용 행렬 계산 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[len(get_catalog()), 200, 1000])
+    parser.add_argument("--days", type=int, nargs=2, default=[3, 14], metavar=("MIN", "MAX"))
+    parser.add_argument("--people", type=int, nargs=2, default=[1, 6], metavar=("MIN", "MAX"))
+    parser.add_argument("--budget", type=int, default=2000000, help="1인 예산")
+    parser.add_argument("--top-n", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5, help="CostEngine 반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    days = list(range(args.days[0], args.days[1] + 1))
+    people = list(range(args.people[0], args.people[1] + 1))
+    seed_prices(0)
+
+    print("=" * 70)
+    print(f"비용 행렬: 여행지 × 일수 {len(days)} × 인원 {len(people)}, 예산 필터 + 상위 {args.top_n}개")
+    print("=" * 70)
+    print(f"{'size':>6} {'cells':>9} {'tools loop ms':>14} {'engine ms':>10} {'speedup':>9} {'mismatch':>9}")
+
+    for size in args.sizes:
+        r = measure(size, days, people, args.budget, args.top_n, args.repeat)
+        print(f"{r['size']:>6} {r['cells']:>9} {r['loopMs']:>14.1f} {r['engineMs']:>10.2f} "
+              f"{r['speedup']:>8.0f}x {r['mismatches']:>9}")
+
+
+if __name__ == "__main__":
+    main()
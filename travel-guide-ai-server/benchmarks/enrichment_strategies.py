@@ -0,0 +1,119 @@
+"""
+추천 생성 전략별 응답 시간 비교
+
+synthetic LLM 백엔드(첫 토큰 지연 + 출력 토큰 수 / 토큰 속도)로 같은 요청을 전략별로 실행합니다.
+
+- graph: LLM이 Tool을 호출하며 추천 5개 전체를 한 번에 생성
+- precompute: 후보/비용은 Python, LLM은 후보 5개의 reason/tips를 호출 한 번으로 작성
+- shortlist: 후보/비용은 Python, 후보마다 작은 보강 호출을 동시에 보내고 순위대로 합침
+
+출력 토큰이 지연을 좌우하므로 shortlist는 호출 수가 늘어도 가장 긴 호출 하나 수준의 시간에 끝납니다.
+예산에 맞는 후보가 있어 사전 계산 경로를 타는 요청만 비교합니다.
+
+실행:
+    python -m benchmarks.enrichment_strategies --requests 20 --llm-latency 0.3 --llm-tokens-per-second 80
+    python -m benchmarks.enrichment_strategies --strategies precompute shortlist --concurrency 4
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any, Dict, List
+
+from benchmarks.load_test import generate_requests, percentile
+
+
+async def run_strategy(strategy: str, requests: List[Dict[str, Any]], concurrency: int) -> Dict[str, Any]:
+    from agents.destination_agent import DestinationAgent
+
+    agent = DestinationAgent(strategy=strategy)
+    latencies: List[float] = []
+    calls = completion_tokens = errors = 0
+    queue = list(requests)
+
+    async def client():
+        nonlocal calls, completion_tokens, errors
+        while queue:
+            payload = queue.pop()
+            start = time.perf_counter()
+            result = await agent.run(payload)
+            latencies.append(time.perf_counter() - start)
+            precompute = (result.get("metadata") or {}).get("precompute") or {}
+            calls += precompute.get("enrichmentCalls", 0)
+            completion_tokens += precompute.get("estimatedCompletionTokens", 0)
+            if result.get("error") or not result.get("destinations"):
+                errors += 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+
+    ordered = sorted(latencies)
+    return {
+        "strategy": strategy,
+        "meanMs": sum(ordered) / len(ordered) * 1000,
+        "p50Ms": percentile(ordered, 0.5) * 1000,
+        "p95Ms": percentile(ordered, 0.95) * 1000,
+        "throughputRps": len(ordered) / wall,
+        "llmCallsPerRequest": calls / len(ordered),
+        "completionTokensPerRequest": completion_tokens / len(ordered),
+        "errors": errors,
+    }
+
+
+def servable_requests(count: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    사전 계산 후보가 있는 요청만 ``count`` 개
+
+    예산에 맞는 후보가 없으면 precompute/shortlist 모두 graph로 넘어가므로 비교에서 뺍니다.
+    """
+    from agents.precompute import precompute_candidates
+
+    requests = []
+    for payload in generate_requests(count * 4, seed, 0.0, 1):
+        if precompute_candidates(payload).candidates:
+            requests.append(payload)
+        if len(requests) == count:
+            break
+    return requests
+
+
+async def run(args: argparse.Namespace) -> None:
+    requests = servable_requests(args.requests, args.seed)
+    baseline = None
+    for strategy in args.strategies:
+        r = await run_strategy(strategy, requests, args.concurrency)
+        baseline = baseline or r["meanMs"]
+        print(f"{strategy:>11} {r['meanMs']:>9.0f} {r['p50Ms']:>9.0f} {r['p95Ms']:>9.0f} "
+              f"{baseline / r['meanMs']:>8.2f}x {r['llmCallsPerRequest']:>7.1f} "
+              f"{r['completionTokensPerRequest']:>9.0f} {r['errors']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추천 생성 전략별 응답 시간 비교")
+    parser.add_argument("--strategies", nargs="+", default=["graph", "precompute", "shortlist"],
+                        choices=["graph", "precompute", "shortlist"])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="synthetic LLM 첫 토큰 지연 (초)")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=80.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    os.environ["LLM_BACKEND"] = "synthetic"
+    os.environ["LLM_SYNTHETIC_LATENCY"] = str(args.llm_latency)
+    os.environ["LLM_SYNTHETIC_TOKENS_PER_SECOND"] = str(args.llm_tokens_per_second)
+    os.environ.setdefault("REQUEST_TIMEOUT", "0")
+
+    print("=" * 76)
+    print(f"전략별 응답 시간 (synthetic LLM: 지연 {args.llm_latency}s, {args.llm_tokens_per_second:.0f} tok/s, "
+          f"{args.requests}건, 동시 {args.concurrency})")
+    print("=" * 76)
+    print(f"{'strategy':>11} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'speedup':>9} "
+          f"{'calls':>7} {'out tok':>9} {'errors':>7}")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
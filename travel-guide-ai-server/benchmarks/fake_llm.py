@@ -0,0 +1,97 @@
+"""
+벤치마크용 가짜 LLM
+
+네트워크 없이 고정된 지연 시간 후 미리 준비된 추천 JSON을 반환합니다.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from utils.helpers import estimate_tokens
+
+
+SAMPLE_DESTINATIONS = {
+    "destinations": [
+        {
+            "name": "다낭",
+            "country": "베트남",
+            "estimatedCost": 1800000,
+            "flightCost": 700000,
+            "accommodationCost": 600000,
+            "highlights": ["바나힐", "미케비치", "호이안"],
+            "reason": "예산 내 최적, 8월 불꽃축제 개최",
+            "bestSeason": "3월-8월",
+            "weather": "평균 30°C, 맑음",
+            "tips": ["우기 시작 시기", "선크림 필수"]
+        }
+    ]
+}
+
+
+class FakeChatModel(BaseChatModel):
+    """고정 지연 후 고정 응답을 돌려주는 Chat 모델"""
+    
+    latency: float = 1.0
+    response: str = json.dumps(SAMPLE_DESTINATIONS, ensure_ascii=False)
+    chunk_size: int = 16  # 스트리밍 시 청크당 글자 수
+    
+    @property
+    def _llm_type(self) -> str:
+        return "fake-travel-llm"
+    
+    def _message(self, messages: List[BaseMessage]) -> AIMessage:
+        """고정 응답 메시지 (토큰 사용량은 글자 수로 추정)"""
+        input_tokens = sum(estimate_tokens(str(message.content)) for message in messages)
+        output_tokens = estimate_tokens(self.response)
+        return AIMessage(
+            content=self.response,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+    
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._message(messages))])
+    
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._message(messages))])
+    
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        # 전체 지연을 청크 수만큼 나눠 토큰이 일정 속도로 나오는 것처럼 흉내 냅니다.
+        chunks = [
+            self.response[i:i + self.chunk_size]
+            for i in range(0, len(self.response), self.chunk_size)
+        ]
+        delay = self.latency / max(len(chunks), 1)
+        for text in chunks:
+            await asyncio.sleep(delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=text))
@@ -0,0 +1,127 @@
+"""
+동기 추천 API vs 비동기 작업 API
+
+LLM 지연이 긴 상황(synthetic 백엔드)에서 같은 요청을 두 방식으로 보내고 비교합니다.
+
+- sync: ``POST /api/recommendations/destinations`` 가 결과가 나올 때까지 연결을 붙잡음
+- jobs: ``POST /api/recommendations/jobs`` 는 작업 ID만 받고 끊은 뒤 ``GET /jobs/{id}`` 로 폴링
+
+연결 유지 시간(요청 하나가 HTTP 연결을 붙잡는 시간)과 결과를 받기까지의 시간을 함께 보여 줍니다.
+마지막에 작업을 남겨 둔 채 종료해 drain(대기/실행 중 작업 마무리)이 걸리는 시간도 확인합니다.
+
+실행:
+    python -m benchmarks.job_api --requests 40 --llm-latency 1.0 --job-workers 8
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from benchmarks.load_test import ENDPOINT, generate_requests, percentile
+
+JOBS_ENDPOINT = "/api/recommendations/jobs"
+
+
+async def run_sync(client: httpx.AsyncClient, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    held: List[float] = []
+    errors = 0
+
+    async def send(payload):
+        nonlocal errors
+        start = time.perf_counter()
+        response = await client.post(ENDPOINT, json=payload)
+        held.append(time.perf_counter() - start)
+        errors += response.status_code != 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(payload) for payload in requests))
+    return {"held": sorted(held), "done": sorted(held), "elapsed": time.perf_counter() - start, "errors": errors}
+
+
+async def run_jobs(client: httpx.AsyncClient, requests: List[Dict[str, Any]], poll_interval: float) -> Dict[str, Any]:
+    held: List[float] = []
+    done: List[float] = []
+    errors = 0
+
+    async def send(payload):
+        nonlocal errors
+        start = time.perf_counter()
+        response = await client.post(JOBS_ENDPOINT, json=payload)
+        held.append(time.perf_counter() - start)
+        if response.status_code != 202:
+            errors += 1
+            return
+        location = response.headers["Location"]
+        while True:
+            await asyncio.sleep(poll_interval)
+            job = (await client.get(location)).json()
+            if job["status"] in ("succeeded", "failed"):
+                break
+        done.append(time.perf_counter() - start)
+        errors += job["status"] != "succeeded"
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(payload) for payload in requests))
+    return {"held": sorted(held), "done": sorted(done), "elapsed": time.perf_counter() - start, "errors": errors}
+
+
+def print_row(mode: str, result: Dict[str, Any]) -> None:
+    held, done = result["held"], result["done"]
+    print(f"{mode:>6} {percentile(held, 0.5) * 1000:>12.1f} {percentile(held, 0.95) * 1000:>12.1f} "
+          f"{percentile(done, 0.5) * 1000:>11.0f} {percentile(done, 0.95) * 1000:>11.0f} "
+          f"{result['elapsed']:>9.2f} {result['errors']:>7}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    import main
+    from routers import recommendations
+
+    requests = generate_requests(args.requests, args.seed, 0.0, 1)
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://jobs", timeout=None) as client:
+            print(f"{'mode':>6} {'hold p50 ms':>12} {'hold p95 ms':>12} {'done p50 ms':>11} {'done p95 ms':>11} "
+                  f"{'elapsed s':>9} {'errors':>7}")
+            print_row("sync", await run_sync(client, requests))
+            print_row("jobs", await run_jobs(client, requests, args.poll_interval))
+
+            # 종료 직전에 작업을 남겨 drain 확인
+            for payload in requests[:args.job_workers]:
+                await client.post(JOBS_ENDPOINT, json=payload)
+            start = time.perf_counter()
+            drained = await recommendations.drain_jobs(None)
+            print(f"\ndrain: 완료 {drained['drained']}건, 중단 {drained['abandoned']}건, "
+                  f"{time.perf_counter() - start:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기 추천 API vs 비동기 작업 API")
+    parser.add_argument("--requests", type=int, default=40, help="동시에 보낼 요청 수")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="synthetic LLM 첫 토큰 지연 (초)")
+    parser.add_argument("--job-workers", type=int, default=8, help="JOB_WORKERS")
+    parser.add_argument("--poll-interval", type=float, default=0.2, help="작업 상태 폴링 간격 (초)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    os.environ.setdefault("LLM_BACKEND", "synthetic")
+    os.environ.setdefault("LLM_SYNTHETIC_LATENCY", str(args.llm_latency))
+    os.environ.setdefault("LLM_SYNTHETIC_TOKENS_PER_SECOND", "1000")
+    os.environ.setdefault("AGENT_WARMUP_CONNECT", "False")
+    os.environ.setdefault("REQUEST_TIMEOUT", "0")
+    os.environ["CACHE_ENABLED"] = "False"
+    os.environ["JOB_WORKERS"] = str(args.job_workers)
+    os.environ["JOB_MAX_QUEUE"] = str(max(args.requests, 1))
+
+    print("=" * 76)
+    print(f"동기 API vs 비동기 작업 API ({args.requests}건 동시, LLM 지연 {args.llm_latency}s, "
+          f"작업자 {args.job_workers}개)")
+    print("=" * 76)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
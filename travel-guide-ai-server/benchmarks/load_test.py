@@ -0,0 +1,355 @@
+"""
+추천 API 부하 테스트
+
+``POST /api/recommendations/destinations`` 를 동시 클라이언트 수별로 호출하고
+처리량, 지연 시간 백분위, 오류율, 메모리 증가량을 JSON 리포트로 저장합니다.
+요청은 실제 사용 분포를 흉내 낸 PreferencesRequest로 생성하며, 일부는 인기 요청 집합에서 반복해
+캐시/요청 병합 경로도 함께 측정합니다.
+
+- 기본: 같은 프로세스에서 ASGI transport로 실행 (lifespan 포함, LLM은 synthetic 백엔드)
+- ``--url``: 실행 중인 uvicorn 서버에 요청 (``--server-pid`` 를 주면 서버 RSS도 측정)
+
+이전 리포트를 ``--baseline`` 으로 주면 처리량/p95/오류율 변화를 비교하고,
+``--tolerance`` 를 넘는 악화를 회귀로 표시합니다.
+
+실행:
+    python -m benchmarks.load_test --concurrency 1 8 32 --requests 200 --output bench.json
+    python -m benchmarks.load_test --baseline bench.json --fail-on-regression
+    python -m benchmarks.load_test --url http://localhost:8000 --server-pid 12345
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+ENDPOINT = "/api/recommendations/destinations"
+
+# 요청 분포 (가중치)
+STYLES = {"beach": 30, "culture": 25, "city": 20, "nature": 15, "adventure": 10}
+TRIP_DAYS = {3: 10, 4: 20, 5: 25, 6: 15, 7: 15, 8: 5, 10: 5, 14: 5}
+PEOPLE = {1: 15, 2: 50, 3: 10, 4: 15, 5: 5, 6: 5}
+COMPANIONS = {1: ["혼자"], 2: ["친구", "연인", "배우자", "부모님"], 3: ["가족", "친구"]}
+CUSTOM_REQUESTS = [
+    "맛있는 해산물 요리를 먹고 싶어요.",
+    "아이와 함께라 이동이 편한 곳이면 좋겠어요.",
+    "조용한 휴양지를 원해요.",
+    "야경이 예쁜 도시를 추천해주세요.",
+    "부모님을 모시고 가서 너무 많이 걷지 않는 일정이면 좋겠고, 한식당이 있으면 더 좋아요.",
+    "트레킹과 캠핑을 하고 싶어요.",
+]
+UNDECIDED_RATIO = 0.15
+CUSTOM_REQUEST_RATIO = 0.3
+
+
+def _weighted(rng: random.Random, weights: Dict[Any, int]) -> Any:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def generate_request(rng: random.Random, today: date) -> Dict[str, Any]:
+    """실제 사용 분포를 흉내 낸 PreferencesRequest 하나"""
+    start = today + timedelta(days=rng.randint(7, 180))
+    days = _weighted(rng, TRIP_DAYS)
+    people = _weighted(rng, PEOPLE)
+    undecided = rng.random() < UNDECIDED_RATIO
+    # 1인 예산: 중앙값 약 200만 원의 로그정규 분포, 10만 원 단위
+    budget = None if undecided else int(round(rng.lognormvariate(14.5, 0.45), -5))
+
+    return {
+        "startDate": start.isoformat(),
+        "endDate": (start + timedelta(days=days)).isoformat(),
+        "budget": budget,
+        "isBudgetUndecided": undecided,
+        "numberOfPeople": people,
+        "travelStyle": _weighted(rng, STYLES),
+        "companion": rng.choice(COMPANIONS[min(people, 3)]),
+        "customRequest": rng.choice(CUSTOM_REQUESTS) if rng.random() < CUSTOM_REQUEST_RATIO else None,
+    }
+
+
+def generate_requests(count: int, seed: int, hot_ratio: float, hot_set: int) -> List[Dict[str, Any]]:
+    """
+    요청 목록 생성
+
+    ``hot_ratio`` 비율은 ``hot_set`` 개의 인기 요청 중에서 뽑아 같은 요청이 반복되게 합니다.
+    """
+    rng = random.Random(seed)
+    today = date(2025, 1, 1)
+    hot = [generate_request(rng, today) for _ in range(max(hot_set, 1))]
+    return [
+        rng.choice(hot) if rng.random() < hot_ratio else generate_request(rng, today)
+        for _ in range(count)
+    ]
+
+
+def rss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """프로세스 RSS (Linux /proc 기준, 측정할 수 없으면 None)"""
+    path = Path(f"/proc/{pid or 'self'}/status")
+    try:
+        for line in path.read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if pid is None:
+        try:
+            import resource
+            # Linux는 KB, macOS는 byte 단위 최대 RSS
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return maxrss if sys.platform == "darwin" else maxrss * 1024
+        except ImportError:
+            pass
+    return None
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(int(q * len(ordered)), len(ordered) - 1)
+    return ordered[index]
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    requests: List[Dict[str, Any]],
+    concurrency: int,
+    timeout: float,
+    server_pid: Optional[int]
+) -> Dict[str, Any]:
+    """동시 클라이언트 수 하나에 대한 측정 (closed loop: 응답을 받으면 다음 요청)"""
+    queue: asyncio.Queue = asyncio.Queue()
+    for payload in requests:
+        queue.put_nowait(payload)
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    cache_statuses: Counter = Counter()
+    errors: Counter = Counter()
+
+    async def worker():
+        while True:
+            try:
+                payload = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            try:
+                response = await client.post(ENDPOINT, json=payload, timeout=timeout)
+                statuses[response.status_code] += 1
+                if response.status_code == 200:
+                    cache_statuses[response.json().get("cacheStatus") or "none"] += 1
+                else:
+                    errors[f"http_{response.status_code}"] += 1
+            except Exception as e:
+                statuses["exception"] += 1
+                errors[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - start)
+
+    rss_before = rss_bytes(server_pid)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    rss_after = rss_bytes(server_pid)
+
+    ordered = sorted(latencies)
+    total = len(latencies)
+    failed = sum(errors.values())
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "elapsedS": round(elapsed, 4),
+        "throughputRps": round(total / elapsed, 3) if elapsed else 0.0,
+        "errorRate": round(failed / total, 4) if total else 0.0,
+        "latencyMs": {
+            "mean": round(sum(ordered) / total * 1000, 3) if total else 0.0,
+            "p50": round(percentile(ordered, 0.50) * 1000, 3),
+            "p90": round(percentile(ordered, 0.90) * 1000, 3),
+            "p95": round(percentile(ordered, 0.95) * 1000, 3),
+            "p99": round(percentile(ordered, 0.99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        },
+        "statusCodes": {str(code): count for code, count in statuses.items()},
+        "cacheStatus": dict(cache_statuses),
+        "errors": dict(errors),
+        "memory": {
+            "rssBeforeBytes": rss_before,
+            "rssAfterBytes": rss_after,
+            "rssGrowthBytes": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+        },
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    같은 동시성 단계끼리 기준 리포트와 비교
+
+    처리량 감소, p95 증가, 오류율 증가가 ``tolerance`` (비율)를 넘으면 회귀로 표시합니다.
+    """
+    base_levels = {level["concurrency"]: level for level in baseline.get("levels", [])}
+    rows = []
+    for level in report["levels"]:
+        base = base_levels.get(level["concurrency"])
+        if base is None:
+            continue
+        throughput_change = _change(level["throughputRps"], base["throughputRps"])
+        p95_change = _change(level["latencyMs"]["p95"], base["latencyMs"]["p95"])
+        error_change = level["errorRate"] - base["errorRate"]
+        regressions = []
+        if throughput_change < -tolerance:
+            regressions.append("throughput")
+        if p95_change > tolerance:
+            regressions.append("p95")
+        if error_change > tolerance / 10:
+            regressions.append("errorRate")
+        rows.append({
+            "concurrency": level["concurrency"],
+            "throughputChange": round(throughput_change, 4),
+            "p95Change": round(p95_change, 4),
+            "errorRateChange": round(error_change, 4),
+            "regressions": regressions,
+        })
+    return rows
+
+
+def _change(current: float, base: float) -> float:
+    return (current - base) / base if base else 0.0
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """모든 동시성 단계를 실행하고 리포트 반환"""
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url)
+        lifespan = None
+        server_pid = args.server_pid
+    else:
+        import main
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://loadtest")
+        # ASGITransport는 lifespan 이벤트를 보내지 않으므로 직접 실행
+        lifespan = main.app.router.lifespan_context(main.app)
+        await lifespan.__aenter__()
+        server_pid = None
+
+    levels = []
+    try:
+        warmup = generate_requests(args.warmup, args.seed + 1, 0.0, 1)
+        if warmup:
+            await run_level(client, warmup, min(len(warmup), 4), args.timeout, server_pid)
+
+        for index, concurrency in enumerate(args.concurrency):
+            requests = generate_requests(args.requests, args.seed + 100 + index, args.hot_ratio, args.hot_set)
+            level = await run_level(client, requests, concurrency, args.timeout, server_pid)
+            levels.append(level)
+            latency = level["latencyMs"]
+            growth = level["memory"]["rssGrowthBytes"]
+            print(f"{concurrency:>6} {level['requests']:>9} {level['throughputRps']:>9.2f} "
+                  f"{latency['p50']:>9.1f} {latency['p95']:>9.1f} {latency['p99']:>9.1f} "
+                  f"{level['errorRate'] * 100:>7.2f}% "
+                  f"{(growth / 2**20 if growth is not None else float('nan')):>9.2f}")
+    finally:
+        await client.aclose()
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "target": args.url or "in-process",
+            "llmBackend": os.environ.get("LLM_BACKEND"),
+            "syntheticLatency": os.environ.get("LLM_SYNTHETIC_LATENCY"),
+            "requestsPerLevel": args.requests,
+            "hotRatio": args.hot_ratio,
+            "hotSet": args.hot_set,
+            "seed": args.seed,
+            "python": platform.python_version(),
+        },
+        "levels": levels,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추천 API 부하 테스트")
+    parser.add_argument("--url", help="실행 중인 서버 주소 (없으면 같은 프로세스에서 ASGI로 실행)")
+    parser.add_argument("--server-pid", type=int, help="--url 사용 시 RSS를 측정할 서버 프로세스 PID")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="단계별 요청 수")
+    parser.add_argument("--warmup", type=int, default=10, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--hot-ratio", type=float, default=0.3, help="인기 요청 집합에서 뽑는 비율 (캐시/병합 대상)")
+    parser.add_argument("--hot-set", type=int, default=20, help="인기 요청 집합 크기")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 제한 시간 (초)")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="in-process 실행 시 synthetic LLM 첫 토큰 지연 (초)")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=200.0, help="in-process 실행 시 synthetic LLM 토큰 속도")
+    parser.add_argument("--no-cache", action="store_true", help="in-process 실행 시 추천 캐시 끄기")
+    parser.add_argument("--output", help="리포트 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 리포트 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="회귀로 볼 악화 비율")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    if not args.url:
+        # 설정은 main import 전에 환경 변수로 지정해야 합니다.
+        os.environ.setdefault("LLM_BACKEND", "synthetic")
+        os.environ.setdefault("LLM_SYNTHETIC_LATENCY", str(args.llm_latency))
+        os.environ.setdefault("LLM_SYNTHETIC_TOKENS_PER_SECOND", str(args.llm_tokens_per_second))
+        os.environ.setdefault("AGENT_WARMUP_CONNECT", "False")
+        if args.no_cache:
+            os.environ["CACHE_ENABLED"] = "False"
+
+    print("=" * 78)
+    print(f"추천 API 부하 테스트 ({args.url or 'in-process ASGI'}, 단계별 {args.requests}건)")
+    print("=" * 78)
+    print(f"{'conc':>6} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'errors':>8} {'RSS +MB':>9}")
+
+    report = asyncio.run(run(args))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["comparison"] = {
+            "baselineCommit": baseline.get("meta", {}).get("commit"),
+            "tolerance": args.tolerance,
+            "levels": compare(report, baseline, args.tolerance),
+        }
+        print(f"\n기준 리포트 대비 ({report['comparison']['baselineCommit']})")
+        print(f"{'conc':>6} {'req/s':>9} {'p95':>9} {'errors':>9}  regressions")
+        for row in report["comparison"]["levels"]:
+            print(f"{row['concurrency']:>6} {row['throughputChange'] * 100:>+8.1f}% "
+                  f"{row['p95Change'] * 100:>+8.1f}% {row['errorRateChange'] * 100:>+8.2f}p  "
+                  f"{', '.join(row['regressions']) or '-'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n리포트 저장: {args.output}")
+
+    regressed = any(row["regressions"] for row in report.get("comparison", {}).get("levels", []))
+    if regressed and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+외부 호출 계층 점검 (스텁 LLM 서버)
+
+지연과 오류를 주입하는 OpenAI 호환 스텁 서버를 같은 프로세스에 띄우고,
+실제 ChatOpenAI + 공유 연결 풀 + ``OutboundClient`` 경로로 다음을 확인합니다.
+
+- keep-alive: 연속 호출이 연결 하나를 재사용하는지
+- 재시도: 503/429 뒤에 백오프 후 성공하는지 (Retry-After 반영)
+- 마감 시간: 느린 응답을 남은 시간만큼만 기다리는지
+- 서킷 브레이커: 장애 시 열리고, 열린 동안 서버를 호출하지 않고 바로 실패하며, 복구 후 닫히는지
+- API: 재시도 후에도 장애가 이어지면 추천 API가 처음부터 503/502 + Retry-After를 반환하는지
+  (제공자 응답 본문은 노출하지 않음)
+
+실행:
+    python -m benchmarks.outbound_resilience
+"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+API_INPUT = {
+    "startDate": "2025-03-01",
+    "endDate": "2025-03-06",
+    "budget": 2000000,
+    "isBudgetUndecided": False,
+    "numberOfPeople": 2,
+    "travelStyle": "beach",
+    "companion": "친구",
+}
+
+
+class StubState:
+    """스텁 서버 동작 (지연, 응답할 오류 상태 코드)"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, latency: float = 0.0, fail_with: List[int] = (), always: int = 0):
+        self.latency = latency
+        self.fail_with = list(fail_with)  # 다음 호출들에 차례로 돌려줄 상태 코드
+        self.always = always  # 0이 아니면 모든 호출에 이 상태 코드
+        self.calls = 0
+        self.client_ports = set()
+
+
+def create_stub_app(state: StubState) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        state.calls += 1
+        state.client_ports.add(request.client.port)
+        body = await request.json()
+        if state.latency:
+            await asyncio.sleep(state.latency)
+
+        status = state.fail_with.pop(0) if state.fail_with else state.always
+        if status:
+            headers = {"retry-after": "0.05"} if status == 429 else {}
+            return JSONResponse(
+                status_code=status,
+                content={"error": {"message": f"stub error {status}", "type": "server_error"}},
+                headers=headers
+            )
+
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": '{"items": []}'},
+                "finish_reason": "stop",
+                "logprobs": None,
+            }],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13},
+        }
+
+    return app
+
+
+async def start_stub(state: StubState):
+    server = uvicorn.Server(uvicorn.Config(
+        create_stub_app(state), host="127.0.0.1", port=0, log_level="warning", lifespan="off"
+    ))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, task, port
+
+
+class Checks:
+    def __init__(self):
+        self.rows: List[Dict[str, Any]] = []
+
+    def add(self, scenario: str, name: str, passed: bool, detail: str):
+        self.rows.append({"scenario": scenario, "check": name, "passed": passed, "detail": detail})
+        print(f"  {'PASS' if passed else 'FAIL'}  {name:<36} {detail}")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for row in self.rows if not row["passed"])
+
+
+async def run_checks(state: StubState) -> Checks:
+    # settings는 스텁 서버 주소가 정해진 뒤 import
+    from agents.llm_backends import create_chat_model
+    from utils.outbound import (
+        CircuitBreaker,
+        CircuitOpenError,
+        DeadlineExceeded,
+        OutboundClient,
+        RetryPolicy,
+        request_deadline,
+    )
+
+    checks = Checks()
+    llm = create_chat_model("gpt-4o-mini", 0.0)
+    messages = [("user", "ping")]
+
+    def outbound(threshold: int = 3, reset_timeout: float = 0.3, retries: int = 2) -> OutboundClient:
+        return OutboundClient(
+            CircuitBreaker("stub", failure_threshold=threshold, reset_timeout=reset_timeout),
+            RetryPolicy(max_retries=retries, base_delay=0.02, max_delay=0.2)
+        )
+
+    print("\n[keep-alive]")
+    state.reset(latency=0.01)
+    client = outbound()
+    for _ in range(20):
+        await client.call(lambda: llm.ainvoke(messages))
+    checks.add("keep-alive", "20 calls reuse pooled connections", len(state.client_ports) == 1,
+               f"calls={state.calls}, connections={len(state.client_ports)}")
+
+    print("\n[retry]")
+    state.reset(fail_with=[503, 429])
+    client = outbound()
+    start = time.perf_counter()
+    response = await client.call(lambda: llm.ainvoke(messages))
+    elapsed = time.perf_counter() - start
+    checks.add("retry", "503, 429 then success", response is not None and state.calls == 3,
+               f"server calls={state.calls}, retries={client.retries}, {elapsed * 1000:.0f} ms")
+
+    state.reset(always=400)
+    client = outbound()
+    try:
+        await client.call(lambda: llm.ainvoke(messages))
+        passed = False
+    except Exception:
+        passed = state.calls == 1
+    checks.add("retry", "400 is not retried", passed, f"server calls={state.calls}")
+
+    print("\n[deadline]")
+    state.reset(latency=2.0)
+    client = outbound()
+    start = time.perf_counter()
+    try:
+        with request_deadline(0.3):
+            await client.call(lambda: llm.ainvoke(messages))
+        passed = False
+    except DeadlineExceeded:
+        passed = True
+    elapsed = time.perf_counter() - start
+    checks.add("deadline", "slow provider cut at 0.3s deadline", passed and elapsed < 0.6,
+               f"{elapsed * 1000:.0f} ms")
+
+    state.reset(fail_with=[503, 503, 503], latency=0.0)
+    client = OutboundClient(
+        CircuitBreaker("stub", failure_threshold=10),
+        RetryPolicy(max_retries=5, base_delay=1.0, max_delay=1.0)
+    )
+    start = time.perf_counter()
+    try:
+        with request_deadline(0.5):
+            await client.call(lambda: llm.ainvoke(messages))
+        passed = False
+    except Exception:
+        passed = True
+    elapsed = time.perf_counter() - start
+    checks.add("deadline", "no retry sleep past the deadline", passed and elapsed < 0.5,
+               f"server calls={state.calls}, {elapsed * 1000:.0f} ms")
+
+    print("\n[circuit breaker]")
+    state.reset(always=500)
+    client = outbound(threshold=3, retries=2)
+    try:
+        await client.call(lambda: llm.ainvoke(messages))
+    except Exception:
+        pass
+    checks.add("circuit", "opens after 3 consecutive failures", client.breaker.state == "open",
+               f"state={client.breaker.state}, server calls={state.calls}")
+
+    calls_before = state.calls
+    start = time.perf_counter()
+    try:
+        await client.call(lambda: llm.ainvoke(messages))
+        passed = False
+    except CircuitOpenError:
+        passed = state.calls == calls_before
+    elapsed = time.perf_counter() - start
+    checks.add("circuit", "open circuit fails fast", passed and elapsed < 0.01,
+               f"{elapsed * 1000:.2f} ms, server calls +{state.calls - calls_before}")
+
+    state.reset()
+    await asyncio.sleep(0.35)
+    await client.call(lambda: llm.ainvoke(messages))
+    checks.add("circuit", "half-open probe closes the circuit", client.breaker.state == "closed",
+               f"state={client.breaker.state}")
+
+    print("\n[API]")
+    import main
+    from routers.recommendations import get_destination_agent
+
+    state.reset(always=503)
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as api:
+            statuses, leaked = [], False
+            breaker = get_destination_agent().outbound.breaker
+            for _ in range(4):
+                response = await api.post("/api/recommendations/destinations", json=API_INPUT)
+                statuses.append(response.status_code)
+                leaked = leaked or "Error code" in response.text
+                if breaker.state == "open":
+                    break
+            retry_after = response.headers.get("retry-after")
+            checks.add("api", "provider outage → 503 + Retry-After",
+                       set(statuses) == {503} and retry_after is not None and not leaked,
+                       f"statuses={statuses}, Retry-After={retry_after}, provider body leaked={leaked}")
+
+            start = time.perf_counter()
+            response = await api.post("/api/recommendations/destinations", json=API_INPUT)
+            elapsed = time.perf_counter() - start
+            checks.add("api", "next request rejected without provider call",
+                       response.status_code == 503, f"{elapsed * 1000:.1f} ms")
+
+            state.reset(always=500)
+            breaker.record_success()
+            response = await api.post("/api/recommendations/destinations", json=API_INPUT)
+            checks.add("api", "provider 5xx after retries → 502",
+                       response.status_code == 502 and "retry-after" in response.headers
+                       and "Error code" not in response.text,
+                       f"status={response.status_code}, detail={response.json().get('detail')}")
+
+            state.reset(latency=2.0)
+            breaker.record_success()
+            start = time.perf_counter()
+            response = await api.post(
+                "/api/recommendations/destinations", json=API_INPUT, headers={"X-Request-Timeout": "0.5"}
+            )
+            elapsed = time.perf_counter() - start
+            checks.add("api", "X-Request-Timeout → 504", response.status_code == 504 and elapsed < 1.0,
+                       f"status={response.status_code}, {elapsed * 1000:.0f} ms")
+
+    return checks
+
+
+async def run() -> int:
+    state = StubState()
+    server, task, port = await start_stub(state)
+    os.environ.update({
+        "LLM_BACKEND": "openai",
+        "OPENAI_API_KEY": "sk-stub",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{port}/v1",
+        "MODEL_ROUTING_ENABLED": "False",
+        "CACHE_ENABLED": "False",
+        "AGENT_WARMUP_CONNECT": "False",
+        "AGENT_OUTPUT_REPAIR": "False",
+        "LLM_MAX_RETRIES": "1",
+        "LLM_RETRY_BASE_DELAY": "0.01",
+        "LLM_CIRCUIT_FAILURE_THRESHOLD": "3",
+        "LLM_CIRCUIT_RESET_TIMEOUT": "30",
+    })
+    print("=" * 70)
+    print(f"외부 호출 계층 점검 (스텁 서버 127.0.0.1:{port})")
+    print("=" * 70)
+    try:
+        checks = await run_checks(state)
+    finally:
+        server.should_exit = True
+        await task
+
+    print(f"\n{len(checks.rows) - checks.failed}/{len(checks.rows)} checks passed")
+    return 1 if checks.failed else 0
+
+
+def main():
+    sys.exit(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+LLM 출력 값 변환 점검
+
+LLM이 실제로 내놓는 비용 문자열로 ``to_int``, 압축 형식 펼치기(``expand_items``),
+항목 검증(``validate_destinations``)을 확인합니다.
+
+- 천 단위 구분 기호(쉼표, 세 자리씩 끊은 마침표)와 만/억, K/M 단위는 정확한 원화 금액으로 변환
+- 다른 통화, 범위, 원 단위 소수처럼 정확히 읽을 수 없는 값은 그대로 두어
+  예외 없이 검증 실패 항목(보정 호출 대상)으로 분류
+
+실행:
+    python -m benchmarks.output_coercion
+"""
+
+import sys
+from typing import Any, Dict
+
+from agents.structured_output import to_int, validate_destinations
+from agents.wire_schema import expand_items
+from benchmarks.outbound_resilience import Checks
+
+# (입력, 기대 결과) — 기대 결과가 입력과 같으면 변환하지 않아야 함
+COST_CASES = [
+    ("₩1,800,000", 1800000),
+    ("₩1.800.000", 1800000),
+    ("1.800.000원", 1800000),
+    ("1,800,000.00", 1800000),
+    ("KRW 500,000", 500000),
+    ("약 180만원", 1800000),
+    ("1억 2,000만원", 120000000),
+    ("1.8M", 1800000),
+    ("700K", 700000),
+    (1800000.0, 1800000),
+    (1800000, 1800000),
+    ("$1,200", "$1,200"),
+    ("180-200만원", "180-200만원"),
+    ("1.5", "1.5"),
+    ("1,80,000", "1,80,000"),
+    ("미정", "미정"),
+    (float("nan"), None),
+]
+
+ITEM = {
+    "name": "다낭",
+    "country": "베트남",
+    "estimatedCost": 1800000,
+    "flightCost": 700000,
+    "accommodationCost": 400000,
+    "highlights": ["바나힐"],
+    "reason": "예산 내 최적",
+    "bestSeason": "3월-8월",
+}
+
+
+def item(**costs: Any) -> Dict[str, Any]:
+    return {**ITEM, **costs}
+
+
+def run_checks() -> Checks:
+    checks = Checks()
+
+    print("\n[to_int]")
+    for value, expected in COST_CASES:
+        try:
+            result = to_int(value)
+        except Exception as e:
+            checks.add("to_int", repr(value), False, f"{e.__class__.__name__}: {e}")
+            continue
+        if expected is None:
+            # NaN은 그대로 (같은 객체인지로 비교)
+            passed = result is value
+        else:
+            passed = result == expected and type(result) is type(expected)
+        checks.add("to_int", repr(value), passed, f"→ {result!r}")
+
+    print("\n[validate_destinations]")
+    report = validate_destinations([
+        item(estimatedCost="₩1.800.000"),
+        item(estimatedCost="약 180만원"),
+        item(estimatedCost="$1,200"),
+        item(flightCost="1.5"),
+    ])
+    checks.add("validate", "변환 가능한 항목 통과", [i for i, _ in report.valid] == [0, 1]
+               and all(d["estimatedCost"] == 1800000 for d in report.destinations),
+               f"valid={[i for i, _ in report.valid]}, coerced={report.coerced}")
+    checks.add("validate", "읽을 수 없는 비용은 보정 대상", [i for i, _, _ in report.invalid] == [2, 3],
+               f"invalid={[i for i, _, _ in report.invalid]}")
+
+    print("\n[expand_items]")
+    wire = {"n": "다낭", "c": "베트남", "h": ["바나힐"], "r": "예산 내 최적", "s": "3월-8월"}
+    items = [
+        {**wire, "p": ["₩700.000", "40만원"]},
+        {**wire, "p": ["$500", 400000]},
+        {**wire, "p": ["70-80만원", "40만원"]},
+        {**wire, "p": [700000]},
+    ]
+    try:
+        expanded = expand_items(items, 5, 2)
+    except Exception as e:
+        checks.add("expand", "예외 없이 펼침", False, f"{e.__class__.__name__}: {e}")
+        return checks
+    checks.add("expand", "예외 없이 펼침", True, f"{len(expanded)}건")
+    checks.add("expand", "읽을 수 있는 비용은 총비용 계산", "estimatedCost" in expanded[0],
+               f"estimatedCost={expanded[0].get('estimatedCost')}")
+    checks.add("expand", "읽을 수 없는 비용은 총비용 없음",
+               all("estimatedCost" not in entry for entry in expanded[1:]),
+               f"{[entry.get('estimatedCost') for entry in expanded[1:]]}")
+    report = validate_destinations(expanded)
+    checks.add("expand", "검증 후 보정 대상 분류", [i for i, _ in report.valid] == [0]
+               and [i for i, _, _ in report.invalid] == [1, 2, 3],
+               f"valid={[i for i, _ in report.valid]}, invalid={[i for i, _, _ in report.invalid]}")
+    return checks
+
+
+def main():
+    print("=" * 70)
+    print("LLM 출력 값 변환 점검")
+    print("=" * 70)
+    checks = run_checks()
+    print(f"\n{len(checks.rows) - checks.failed}/{len(checks.rows)} checks passed")
+    sys.exit(1 if checks.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
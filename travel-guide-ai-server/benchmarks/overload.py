@@ -0,0 +1,122 @@
+"""
+과부하 시 수락 제어 비교
+
+LLM 지연이 길어진 상황(synthetic 백엔드)에 처리 용량보다 많은 요청을 한꺼번에 보내고,
+수락 제어를 끈 경우와 켠 경우의 우선순위별 결과를 비교합니다.
+
+- 끈 경우: 모든 요청이 이벤트 루프에 쌓여 함께 느려짐
+- 켠 경우: 슬롯을 받은 요청은 제 속도로 끝나고, 넘친 요청은 429로 빨리 거절됨 (high 우선)
+
+실행:
+    python -m benchmarks.overload --requests 200 --llm-latency 1.0 --max-concurrency 8 --max-queue 32
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List
+
+import httpx
+
+from benchmarks.load_test import ENDPOINT, generate_requests, percentile, rss_bytes
+
+PRIORITY_MIX = {"high": 30, "normal": 50, "low": 20}
+
+
+async def burst(client: httpx.AsyncClient, requests: List[Dict[str, Any]], seed: int) -> Dict[str, Any]:
+    """요청 전체를 동시에 보내고 우선순위별 결과 집계"""
+    rng = random.Random(seed)
+    priorities = rng.choices(list(PRIORITY_MIX), weights=list(PRIORITY_MIX.values()), k=len(requests))
+    results = defaultdict(lambda: {"statuses": Counter(), "ok": [], "rejected": []})
+
+    async def send(payload, priority):
+        start = time.perf_counter()
+        response = await client.post(ENDPOINT, json=payload, headers={"X-Request-Priority": priority})
+        elapsed = time.perf_counter() - start
+        bucket = results[priority]
+        bucket["statuses"][response.status_code] += 1
+        (bucket["ok"] if response.status_code == 200 else bucket["rejected"]).append(elapsed)
+
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+    await asyncio.gather(*(send(payload, priority) for payload, priority in zip(requests, priorities)))
+    elapsed = time.perf_counter() - start
+    rss_after = rss_bytes()
+
+    summary = {}
+    for priority in PRIORITY_MIX:
+        bucket = results[priority]
+        ok = sorted(bucket["ok"])
+        rejected = sorted(bucket["rejected"])
+        summary[priority] = {
+            "statuses": dict(bucket["statuses"]),
+            "okP50Ms": round(percentile(ok, 0.5) * 1000, 1),
+            "okP95Ms": round(percentile(ok, 0.95) * 1000, 1),
+            "rejectP95Ms": round(percentile(rejected, 0.95) * 1000, 1),
+        }
+    return {
+        "elapsedS": round(elapsed, 3),
+        "rssGrowthBytes": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+        "priorities": summary,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    import main
+    from config.settings import settings
+    from routers import recommendations
+    from utils.admission import AdmissionController
+
+    requests = generate_requests(args.requests, args.seed, 0.0, 1)
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://overload", timeout=None) as client:
+            for enabled in (False, True):
+                settings.ADMISSION_ENABLED = enabled
+                recommendations.admission_controller = AdmissionController(
+                    max_concurrency=args.max_concurrency,
+                    max_queue=args.max_queue,
+                    max_queue_time=args.max_queue_time
+                )
+                result = await burst(client, requests, args.seed)
+
+                growth = result["rssGrowthBytes"]
+                print(f"\n수락 제어 {'ON' if enabled else 'OFF'}: 전체 {result['elapsedS']:.2f}s, "
+                      f"RSS +{(growth or 0) / 2**20:.1f} MB")
+                print(f"{'priority':>9} {'200':>6} {'429':>6} {'ok p50 ms':>10} {'ok p95 ms':>10} {'429 p95 ms':>11}")
+                for priority, row in result["priorities"].items():
+                    statuses = row["statuses"]
+                    print(f"{priority:>9} {statuses.get(200, 0):>6} {statuses.get(429, 0):>6} "
+                          f"{row['okP50Ms']:>10.1f} {row['okP95Ms']:>10.1f} {row['rejectP95Ms']:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과부하 시 수락 제어 비교")
+    parser.add_argument("--requests", type=int, default=200, help="동시에 보낼 요청 수")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="synthetic LLM 첫 토큰 지연 (초)")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="ADMISSION_MAX_CONCURRENCY")
+    parser.add_argument("--max-queue", type=int, default=32, help="ADMISSION_MAX_QUEUE")
+    parser.add_argument("--max-queue-time", type=float, default=10.0, help="ADMISSION_MAX_QUEUE_TIME")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    os.environ.setdefault("LLM_BACKEND", "synthetic")
+    os.environ.setdefault("LLM_SYNTHETIC_LATENCY", str(args.llm_latency))
+    os.environ.setdefault("LLM_SYNTHETIC_TOKENS_PER_SECOND", "1000")
+    os.environ.setdefault("AGENT_WARMUP_CONNECT", "False")
+    os.environ["CACHE_ENABLED"] = "False"
+    os.environ["SINGLE_FLIGHT_ENABLED"] = "False"
+    os.environ["REQUEST_TIMEOUT"] = "0"
+
+    print("=" * 64)
+    print(f"과부하 비교: 동시 요청 {args.requests}건, LLM 지연 {args.llm_latency}s, "
+          f"슬롯 {args.max_concurrency}, 대기열 {args.max_queue}")
+    print("=" * 64)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
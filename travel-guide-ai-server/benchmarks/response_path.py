@@ -0,0 +1,134 @@
+"""
+응답 경로 CPU 비용 벤치마크
+
+LLM 출력 텍스트 하나를 HTTP 응답 바이트로 만들기까지의 요청당 CPU 시간을 단계별로 잽니다.
+
+- parse: LLM 출력 JSON 파싱 (``JsonOutputParser``) + 항목 추출
+- validate: 항목별 ``DestinationInfo`` 검증 (``validate_destinations``, Agent에서 한 번)
+- serialize
+    - legacy: ``RecommendationResponse`` 생성(재검증) → FastAPI ``response_model`` 재검증/재직렬화
+      → ``JSONResponse`` (표준 json)
+    - lean: 검증된 딕셔너리로 응답 본문 구성 → ``FastJSONResponse`` (orjson)
+
+두 경로의 응답 본문이 같은지(``generatedAt`` 제외)도 함께 확인합니다.
+
+실행:
+    python -m benchmarks.response_path --sizes 5 50 500 --repeat 200
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from langchain_core.output_parsers import JsonOutputParser
+
+from agents.structured_output import extract_items, validate_destinations
+from models.schemas import RecommendationResponse
+from routers.recommendations import _response_body
+from tools.catalog import get_catalog
+from utils.responses import FastJSONResponse, orjson
+
+METADATA = {"strategy": "graph", "toolCalls": 6, "output": {"mode": "text", "coerced": 0}}
+
+
+def llm_output(count: int) -> str:
+    """카탈로그 여행지를 ``count`` 개까지 돌려 쓴 LLM 출력 텍스트"""
+    catalog = list(get_catalog())
+    items = []
+    for index in range(count):
+        dest = catalog[index % len(catalog)]
+        flight, accommodation = 350_000 * 2, 120_000 * 6
+        items.append({
+            "name": dest.name,
+            "country": dest.country,
+            "estimatedCost": flight + accommodation + 80_000 * 7 * 2,
+            "flightCost": flight,
+            "accommodationCost": accommodation,
+            "highlights": list(dest.highlights) or ["시내 관광"],
+            "reason": f"{dest.name}은(는) 예산 안에서 {dest.style} 여행을 즐기기 좋은 곳입니다. 항공편이 많고 숙소 선택지가 넓습니다.",
+            "bestSeason": dest.bestSeason,
+            "weather": "평균 27°C, 맑음",
+            "tips": ["현지 교통카드를 미리 준비하세요", "인기 식당은 예약을 권장합니다", "환전은 공항보다 시내가 유리합니다"],
+        })
+    return json.dumps({"destinations": items}, ensure_ascii=False)
+
+
+def run_sync(coroutine) -> Any:
+    """기다리는 일이 없는 코루틴을 이벤트 루프 없이 실행 (루프 생성 비용을 측정에서 뺌)"""
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("코루틴이 중간에 대기했습니다.")
+
+
+def legacy_serialize(destinations: List[Dict[str, Any]], field) -> bytes:
+    """이전 경로: 모델 생성(재검증) → response_model 재검증/재직렬화 → 표준 json"""
+    response = RecommendationResponse(
+        destinations=destinations,
+        totalProcessingTime=1.5,
+        cacheStatus="miss",
+        metadata=METADATA
+    )
+    content = run_sync(serialize_response(field=field, response_content=response, is_coroutine=True))
+    return JSONResponse(content).body
+
+
+def lean_serialize(destinations: List[Dict[str, Any]]) -> bytes:
+    """현재 경로: 검증된 딕셔너리 → FastJSONResponse"""
+    return FastJSONResponse(_response_body(destinations, "miss", 1.5, METADATA)).body
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    """평균 호출 시간 (µs)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def same_body(legacy: bytes, lean: bytes) -> bool:
+    """``generatedAt`` 을 뺀 응답 본문 비교"""
+    a, b = json.loads(legacy), json.loads(lean)
+    a.pop("generatedAt"), b.pop("generatedAt")
+    return a == b
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 경로 CPU 비용 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 50, 500], help="응답 여행지 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    output_parser = JsonOutputParser()
+    field = create_response_field(name="response", type_=RecommendationResponse, mode="serialization")
+
+    print("=" * 88)
+    print(f"응답 경로 요청당 CPU 시간 (µs, 직렬화: {'orjson' if orjson is not None else 'json'})")
+    print("=" * 88)
+    print(f"{'items':>6} {'KB':>7} {'parse':>9} {'validate':>9} {'legacy ser':>11} {'lean ser':>9} "
+          f"{'legacy':>9} {'lean':>9} {'speedup':>8} {'same':>6}")
+
+    for count in args.sizes:
+        text = llm_output(count)
+        items = extract_items(output_parser.parse(text))
+        destinations = validate_destinations(items).destinations
+        legacy_body, lean_body = legacy_serialize(destinations, field), lean_serialize(destinations)
+
+        parse_us = measure(lambda: extract_items(output_parser.parse(text)), args.repeat)
+        validate_us = measure(lambda: validate_destinations(items).destinations, args.repeat)
+        legacy_us = measure(lambda: legacy_serialize(destinations, field), args.repeat)
+        lean_us = measure(lambda: lean_serialize(destinations), args.repeat)
+        legacy_total = parse_us + validate_us + legacy_us
+        lean_total = parse_us + validate_us + lean_us
+        print(f"{count:>6} {len(lean_body) / 1024:>7.1f} {parse_us:>9.1f} {validate_us:>9.1f} {legacy_us:>11.1f} "
+              f"{lean_us:>9.1f} {legacy_total:>9.1f} {lean_total:>9.1f} {legacy_total / lean_total:>7.2f}x "
+              f"{str(same_body(legacy_body, lean_body)):>6}")
+
+
+if __name__ == "__main__":
+    main()
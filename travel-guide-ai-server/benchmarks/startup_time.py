@@ -0,0 +1,110 @@
+"""
+서버 콜드 스타트 벤치마크
+
+매 실행마다 새 파이썬 프로세스에서 ``main`` 을 import하고 첫 요청까지 걸린 시간을 측정합니다.
+
+- lazy: lifespan 없이 첫 요청이 Agent를 생성 (기존 동작)
+- lifespan: 시작 시 Agent 생성/워밍업 후 첫 요청
+
+``--tracing`` 을 주면 LANGSMITH_TRACING=True(langchain_teddynote import 포함)인 경우도 측정합니다.
+LLM API 연결 워밍업은 네트워크 영향을 빼기 위해 기본으로 끕니다(``--connect`` 로 켜기).
+
+실행:
+    python -m benchmarks.startup_time --runs 5
+    python -m benchmarks.startup_time --runs 5 --tracing
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SERVER_ROOT = Path(__file__).resolve().parent.parent
+
+# 자식 프로세스에서 실행할 측정 코드
+CHILD_SCRIPT = r"""
+import asyncio, json, sys, time
+start = time.perf_counter()
+import main
+import_s = time.perf_counter() - start
+
+from fastapi.testclient import TestClient
+
+mode = sys.argv[1]
+result = {"importS": import_s}
+
+if mode == "lifespan":
+    client = TestClient(main.app)
+    begin = time.perf_counter()
+    client.__enter__()  # lifespan startup 실행
+    result["startupS"] = time.perf_counter() - begin
+else:
+    main.app.state.ready = True  # lifespan 없이 실행 (첫 요청이 Agent 생성)
+    client = TestClient(main.app)
+    result["startupS"] = 0.0
+
+begin = time.perf_counter()
+response = client.get("/api/recommendations/health")
+result["firstRequestS"] = time.perf_counter() - begin
+result["status"] = response.status_code
+
+begin = time.perf_counter()
+client.get("/api/recommendations/health")
+result["secondRequestS"] = time.perf_counter() - begin
+result["totalS"] = time.perf_counter() - start
+print(json.dumps(result))
+"""
+
+
+def run_once(mode: str, tracing: bool, connect: bool) -> Dict[str, float]:
+    """새 프로세스에서 한 번 측정"""
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    env["LANGSMITH_TRACING"] = str(tracing)
+    env["AGENT_WARMUP_CONNECT"] = str(connect)
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, mode],
+        cwd=SERVER_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, float]:
+    """실행별 측정값의 중앙값"""
+    keys = ("importS", "startupS", "firstRequestS", "secondRequestS", "totalS")
+    return {key: statistics.median(sample[key] for sample in samples) for key in keys}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 콜드 스타트 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="설정별 반복 횟수 (새 프로세스)")
+    parser.add_argument("--tracing", action="store_true", help="LANGSMITH_TRACING=True 도 측정")
+    parser.add_argument("--connect", action="store_true", help="LLM API 연결 워밍업 포함")
+    args = parser.parse_args()
+
+    configs = [("lazy", False), ("lifespan", False)]
+    if args.tracing:
+        configs += [("lazy", True), ("lifespan", True)]
+
+    print("=" * 78)
+    print(f"콜드 스타트 (중앙값, {args.runs}회, 단위 ms)")
+    print("=" * 78)
+    print(f"{'mode':>9} {'tracing':>8} {'import':>9} {'startup':>9} {'1st req':>9} {'2nd req':>9} {'total':>9}")
+
+    for mode, tracing in configs:
+        samples = [run_once(mode, tracing, args.connect) for _ in range(args.runs)]
+        r = summarize(samples)
+        print(f"{mode:>9} {str(tracing):>8} {r['importS'] * 1000:>9.1f} {r['startupS'] * 1000:>9.1f} "
+              f"{r['firstRequestS'] * 1000:>9.1f} {r['secondRequestS'] * 1000:>9.1f} {r['totalS'] * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
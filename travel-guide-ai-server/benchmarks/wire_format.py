@@ -0,0 +1,83 @@
+"""
+LLM 출력 형식/결과 개수별 출력 토큰과 응답 시간 비교
+
+synthetic LLM 백엔드로 추천 전체를 생성하는 경로(graph)를 실행해 다음 조합을 비교합니다.
+
+- 출력 형식: full (``DestinationInfo`` 키 그대로) vs compact (짧은 키 + 비용 배열, 총비용은 서버 계산)
+- 결과 개수: ``topK`` / ``maxTipsPerDestination``
+
+출력 토큰은 synthetic 모델이 돌려준 usage 기준이며, 응답 시간은 출력 토큰 수에 비례합니다.
+
+실행:
+    python -m benchmarks.wire_format --requests 10 --sizes 5:3 3:2 1:1
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.load_test import generate_requests
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    top_k, _, tips = text.partition(":")
+    return int(top_k), int(tips or 3)
+
+
+async def measure(wire_format: str, top_k: int, tips: int, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    from agents.destination_agent import DestinationAgent
+
+    agent = DestinationAgent(strategy="graph", wire_format=wire_format)
+    output_tokens = 0
+    items = 0
+    start = time.perf_counter()
+    for payload in requests:
+        result = await agent.run({**payload, "topK": top_k, "maxTipsPerDestination": tips})
+        routing = (result.get("metadata") or {}).get("routing") or {}
+        output_tokens += sum(attempt.get("outputTokens", 0) for attempt in routing.get("attempts", []))
+        items += len(result.get("destinations") or [])
+    elapsed = time.perf_counter() - start
+    return {
+        "meanMs": elapsed / len(requests) * 1000,
+        "outputTokens": output_tokens / len(requests),
+        "items": items / len(requests),
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    requests = generate_requests(args.requests, args.seed, 0.0, 1)
+    baseline = None
+    for top_k, tips in args.sizes:
+        for wire_format in ("full", "compact"):
+            r = await measure(wire_format, top_k, tips, requests)
+            baseline = baseline or r["meanMs"]
+            print(f"{wire_format:>8} {top_k:>5} {tips:>5} {r['items']:>6.1f} {r['outputTokens']:>9.0f} "
+                  f"{r['meanMs']:>9.0f} {baseline / r['meanMs']:>8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 출력 형식/결과 개수별 비교")
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=[(5, 3), (3, 2), (1, 1)],
+                        help="topK:maxTipsPerDestination 목록")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="synthetic LLM 첫 토큰 지연 (초)")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=80.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    os.environ["LLM_BACKEND"] = "synthetic"
+    os.environ["LLM_SYNTHETIC_LATENCY"] = str(args.llm_latency)
+    os.environ["LLM_SYNTHETIC_TOKENS_PER_SECOND"] = str(args.llm_tokens_per_second)
+    os.environ.setdefault("REQUEST_TIMEOUT", "0")
+
+    print("=" * 64)
+    print(f"출력 형식/결과 개수별 비교 (graph 전략, synthetic {args.llm_tokens_per_second:.0f} tok/s)")
+    print("=" * 64)
+    print(f"{'format':>8} {'topK':>5} {'tips':>5} {'items':>6} {'out tok':>9} {'mean ms':>9} {'speedup':>9}")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+워커 수별 처리량 비교
+
+``uvicorn main:app --workers N`` 을 운영 모드(ENVIRONMENT=production, synthetic LLM)로 띄우고
+같은 부하(load_test 요청 분포)를 보내 워커 1개 대비 처리량이 얼마나 늘어나는지 측정합니다.
+
+LLM 대기 시간은 워커 하나의 이벤트 루프에서도 겹쳐지므로, 워커 수의 효과는 프롬프트 구성/파싱/검증 같은
+CPU 작업이 병목일 때 드러납니다. 기본값은 LLM 지연을 짧게 두어 CPU 비중을 키운 설정입니다.
+(CPU 코어 수보다 많은 워커는 효과가 없습니다.)
+
+실행:
+    python -m benchmarks.worker_scaling --workers 1 2 4 --concurrency 32 --requests 400
+    python -m benchmarks.worker_scaling --workers 1 4 --cache-backend redis --output scaling.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import httpx
+
+from benchmarks.load_test import generate_requests, run_level
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int, args: argparse.Namespace) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "ENVIRONMENT": "production",
+        "LLM_BACKEND": "synthetic",
+        "LLM_SYNTHETIC_LATENCY": str(args.llm_latency),
+        "LLM_SYNTHETIC_TOKENS_PER_SECOND": str(args.llm_tokens_per_second),
+        "AGENT_WARMUP_CONNECT": "False",
+        "CACHE_ENABLED": str(args.cache_backend is not None),
+        "CACHE_BACKEND": args.cache_backend or "memory",
+        "ADMISSION_MAX_QUEUE": "100000",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--no-access-log", "--log-level", "warning"],
+        cwd=SERVER_DIR,
+        env=env,
+        start_new_session=True,
+        stdout=subprocess.DEVNULL
+    )
+
+
+async def wait_ready(url: str, workers: int, timeout: float = 60.0) -> None:
+    """모든 워커가 준비될 때까지 /health 확인 (연속 성공 횟수로 판단)"""
+    deadline = time.monotonic() + timeout
+    streak = 0
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get("/health", timeout=2.0)
+                streak = streak + 1 if response.status_code == 200 else 0
+            except httpx.TransportError:
+                streak = 0
+            if streak >= workers * 4:
+                return
+            await asyncio.sleep(0.1)
+    raise TimeoutError(f"서버가 {timeout:.0f}초 안에 준비되지 않았습니다.")
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=15)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+async def measure(workers: int, args: argparse.Namespace) -> Dict[str, Any]:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    process = start_server(workers, port, args)
+    try:
+        await wait_ready(url, workers)
+        async with httpx.AsyncClient(
+            base_url=url, limits=httpx.Limits(max_connections=args.concurrency)
+        ) as client:
+            warmup = generate_requests(args.concurrency, args.seed + 1, 0.0, 1)
+            await run_level(client, warmup, args.concurrency, args.timeout, None)
+            requests = generate_requests(args.requests, args.seed, args.hot_ratio, args.hot_set)
+            level = await run_level(client, requests, args.concurrency, args.timeout, None)
+    finally:
+        stop_server(process)
+    level["workers"] = workers
+    return level
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    levels = []
+    for workers in args.workers:
+        level = await measure(workers, args)
+        levels.append(level)
+        base = levels[0]["throughputRps"]
+        latency = level["latencyMs"]
+        print(f"{workers:>8} {level['throughputRps']:>9.2f} {level['throughputRps'] / base if base else 0:>8.2f}x "
+              f"{latency['p50']:>9.1f} {latency['p95']:>9.1f} {level['errorRate'] * 100:>7.2f}%")
+    return {
+        "meta": {
+            "cpuCount": os.cpu_count(),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "cacheBackend": args.cache_backend,
+            "llmLatency": args.llm_latency,
+            "llmTokensPerSecond": args.llm_tokens_per_second,
+        },
+        "levels": levels,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 수별 처리량 비교")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--hot-ratio", type=float, default=0.0, help="인기 요청 비율 (캐시 사용 시)")
+    parser.add_argument("--hot-set", type=int, default=20)
+    parser.add_argument("--cache-backend", choices=["memory", "redis", "fakeredis"],
+                        help="지정하면 캐시 사용 (워커 간 공유는 redis만)")
+    parser.add_argument("--llm-latency", type=float, default=0.02, help="synthetic LLM 첫 토큰 지연 (초)")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=20000.0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"워커 수별 처리량 (CPU {os.cpu_count()}개, 동시 {args.concurrency}, {args.requests}건)")
+    print("=" * 60)
+    print(f"{'workers':>8} {'req/s':>9} {'speedup':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>8}")
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@
 """
 
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -13,25 +13,134 @@ class Settings(BaseSettings):
     
     
     # Server Settings
+    ENVIRONMENT: str = "development"  # development, production
     HOST: str = "0.0.0.0"
     PORT: int = 8000
-    DEBUG: bool = True
+    DEBUG: Optional[bool] = None  # 자동 재시작(reload). 비우면 development에서만 켬
+    WORKERS: int = 1  # uvicorn 워커(프로세스) 수 (reload가 켜져 있으면 1)
     
     # CORS Settings
     ALLOWED_ORIGINS: str = "http://localhost:5173,http://localhost:3000,http://127.0.0.1:5173,http://127.0.0.1:3000,http://localhost:5174,http://127.0.0.1:5174"
     
     # API Keys
     OPENAI_API_KEY: str = ""
+    OPENAI_BASE_URL: str = ""  # 비우면 기본 OpenAI 엔드포인트 (프록시/스텁 서버 사용 시 지정)
+    
+    # Agent Settings
+    AGENT_MAX_CONCURRENCY: int = 8  # 워커(프로세스)당 동시에 진행할 수 있는 LLM 호출 수
+    AGENT_MAX_TOOL_ITERATIONS: int = 3  # Tool 호출 라운드 최대 횟수
+    AGENT_STRATEGY: str = "precompute"  # precompute (사전 계산 후 LLM 보강), shortlist (후보별 보강 병렬 호출), graph (Tool 호출 그래프)
+    AGENT_OUTPUT_MODE: str = "structured"  # structured (DestinationList 함수 호출), text (JSON 텍스트 파싱)
+    AGENT_WIRE_FORMAT: str = "compact"  # compact (짧은 키 + 비용 배열, 총비용은 서버 계산), full (DestinationInfo 그대로)
+    AGENT_OUTPUT_REPAIR: bool = True  # 검증에 실패한 항목만 작은 LLM 호출로 보정
+    
+    # Data Settings
+    DESTINATIONS_DATA_PATH: str = ""  # 여행지 카탈로그 파일 (JSON/CSV, 비우면 data/destinations.json)
+    CLIMATE_DATA_PATH: str = ""  # 월별 기후/이벤트 파일 (JSON, 비우면 data/climate.json)
+    PRICE_RANDOM_SEED: Optional[int] = None  # 항공료 변동성 시드 (지정하면 가격 결과 재현 가능)
+    
+    # Cache Settings
+    CACHE_ENABLED: bool = True
+    CACHE_BACKEND: str = "memory"  # memory, redis, fakeredis
+    CACHE_TTL_SECONDS: int = 3600
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_BUDGET_BUCKET: int = 500000  # 예산 구간 크기 (원)
+    REDIS_URL: str = "redis://localhost:6379/0"
+    RATE_LIMIT_PER_MINUTE: int = 0  # 클라이언트별 분당 추천 요청 수 (0이면 제한 없음, 카운터는 CACHE_BACKEND에 저장)
+    TRUSTED_PROXIES: str = ""  # X-Client-Id/X-Forwarded-For를 믿을 프록시 IP 또는 CIDR (쉼표 구분, 비우면 접속 IP만 사용)
+    
+    # LLM Backend
+    LLM_BACKEND: str = "openai"  # openai, replay (기록/재생), synthetic (네트워크 없는 합성 응답)
+    LLM_REPLAY_DIR: str = ".llm_replay"  # 기록 파일 디렉토리 (프롬프트 해시별 JSON)
+    LLM_REPLAY_MODE: str = "auto"  # auto (없으면 호출 후 기록), replay (기록만 사용), record (항상 호출 후 기록)
+    LLM_SYNTHETIC_LATENCY: float = 0.3  # 첫 토큰까지 지연 (초)
+    LLM_SYNTHETIC_TOKENS_PER_SECOND: float = 80.0  # 출력 토큰 생성 속도
+    LLM_SYNTHETIC_ERROR_RATE: float = 0.0  # 형식이 틀린 항목을 섞는 비율 (0.0 ~ 1.0)
+    
+    # Model Routing
+    MODEL_TIERS: str = "gpt-4o-mini,gpt-4o"  # 작은 모델 → 큰 모델 순 (쉼표 구분)
+    MODEL_TEMPERATURE: float = 0.7
+    MODEL_ROUTING_ENABLED: bool = True  # False면 첫 번째 티어만 사용
+    MODEL_ROUTER_COMPLEXITY_THRESHOLD: int = 2  # 복잡도 점수 몇 점마다 한 티어씩 올릴지
+    MODEL_ROUTER_LONG_REQUEST_CHARS: int = 60  # 이 길이 이상의 추가 요청사항은 복잡도 +1
+    MODEL_ROUTER_BUDGET_TOLERANCE: float = 0.1  # 1인 비용이 예산을 이 비율 넘게 초과하면 상향
+    
+    # Admission Control
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_MAX_CONCURRENCY: int = 16  # 워커당 동시에 Agent를 실행하는 추천 요청 수
+    ADMISSION_MAX_QUEUE: int = 64  # 슬롯을 기다릴 수 있는 요청 수 (넘으면 429)
+    ADMISSION_MAX_QUEUE_TIME: float = 10.0  # 최대 대기 시간 (초, 넘으면 429)
+    ADMISSION_DEFAULT_PRIORITY: str = "normal"  # X-Request-Priority 헤더가 없을 때 (high, normal, low)
+    
+    # Outbound (LLM 제공자 호출)
+    REQUEST_TIMEOUT: float = 30.0  # API 요청 하나의 전체 마감 시간 (초, X-Request-Timeout 헤더로 더 짧게 지정 가능, 0이면 제한 없음)
+    CANCEL_ON_DISCONNECT: bool = True  # 응답 전에 클라이언트 연결이 끊기면 Agent 실행과 LLM 호출을 취소
+    LLM_HTTP2: bool = True  # h2 패키지가 있으면 HTTP/2 사용
+    LLM_MAX_CONNECTIONS: int = 100  # 공유 연결 풀 최대 연결 수
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_KEEPALIVE_EXPIRY: float = 30.0  # 유휴 연결 유지 시간 (초)
+    LLM_CONNECT_TIMEOUT: float = 5.0
+    LLM_READ_TIMEOUT: float = 60.0  # LLM 호출 한 번의 제한 시간 (요청 마감 시간이 더 짧으면 그쪽을 따름)
+    LLM_MAX_RETRIES: int = 2  # 429/5xx/연결 오류 재시도 횟수
+    LLM_RETRY_BASE_DELAY: float = 0.5  # 지수 백오프 시작 값 (초, full jitter)
+    LLM_RETRY_MAX_DELAY: float = 8.0
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 몇 번이면 서킷을 열지
+    LLM_CIRCUIT_RESET_TIMEOUT: float = 30.0  # 서킷이 열린 뒤 시험 호출까지 대기 (초)
+    
+    # Startup Settings
+    AGENT_WARMUP_CONNECT: bool = True  # 서버 시작 시 LLM API 연결을 미리 열어 둠
+    AGENT_WARMUP_TIMEOUT: float = 5.0  # 연결 워밍업 제한 시간 (초)
+    
+    # Tracing Settings
+    LANGSMITH_TRACING: bool = False  # True면 시작 시 langchain_teddynote로 LangSmith 추적 활성화
+    LANGSMITH_PROJECT: str = "everywhere-guide"
+    
+    # Request Coalescing
+    SINGLE_FLIGHT_ENABLED: bool = True  # 같은 정규화 키의 동시 요청을 한 번의 Agent 실행으로 병합
+    SINGLE_FLIGHT_LOCK_TTL: float = 60.0  # 워커 간 병합 잠금 유지 시간 (초, CACHE_BACKEND가 memory가 아닐 때)
+    
+    # Async Jobs (POST /api/recommendations/jobs)
+    JOB_WORKERS: int = 4  # 워커(프로세스)당 비동기 추천 작업을 실행하는 백그라운드 작업자 수
+    JOB_MAX_QUEUE: int = 100  # 실행을 기다릴 수 있는 작업 수 (넘으면 429)
+    JOB_TIMEOUT: float = 120.0  # 작업 하나의 마감 시간 (초, 0이면 제한 없음)
+    JOB_RESULT_TTL: int = 3600  # 작업 상태/결과 보관 시간 (초, CACHE_BACKEND에 저장)
+    JOB_MAX_RESULTS: int = 10000  # CACHE_BACKEND=memory일 때 워커당 보관하는 작업 수 (캐시와 별도, 넘으면 오래된 작업부터 삭제)
+    JOB_DRAIN_TIMEOUT: float = 30.0  # 서버 종료 시 남은 작업을 기다리는 최대 시간 (초)
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         extra = "ignore"
     
+    @property
+    def is_production(self) -> bool:
+        """운영 환경 여부"""
+        return self.ENVIRONMENT.lower() == "production"
+    
+    @property
+    def debug(self) -> bool:
+        """자동 재시작(reload) 여부 (DEBUG를 지정하지 않으면 운영 환경에서 끔)"""
+        return self.DEBUG if self.DEBUG is not None else not self.is_production
+    
+    @property
+    def workers(self) -> int:
+        """uvicorn 워커 수 (reload 중에는 1)"""
+        return 1 if self.debug else max(1, self.WORKERS)
+    
     @property
     def origins_list(self) -> List[str]:
         """CORS 허용 오리진 리스트 반환"""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+    
+    @property
+    def trusted_proxies_list(self) -> List[str]:
+        """신뢰 프록시 IP/CIDR 리스트 반환"""
+        return [proxy.strip() for proxy in self.TRUSTED_PROXIES.split(",") if proxy.strip()]
+    
+    @property
+    def model_tiers_list(self) -> List[str]:
+        """모델 티어 리스트 반환 (작은 모델부터)"""
+        return [model.strip() for model in self.MODEL_TIERS.split(",") if model.strip()]
 
 
 # 전역 설정 인스턴스
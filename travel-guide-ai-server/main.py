@@ -7,10 +7,71 @@ LangGraph 기반 여행 추천 AI 서버
 from dotenv import load_dotenv
 load_dotenv()
 
+import os
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from agents.base_agent import configure_tracing
 from config.settings import settings
 from routers import recommendations
+from utils.metrics import metrics
+from utils.outbound import aclose_http_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버 시작/종료 처리
+    
+    첫 요청이 Agent 생성 비용을 떠안지 않도록 시작 시점에 Agent(LLM 클라이언트,
+    그래프, 프롬프트/Parser)를 만들고 워밍업합니다. 워밍업이 끝나야 /health가 준비 완료를 보고합니다.
+    종료 시 먼저 준비 상태를 내려 /health가 503(stopping)을 보고하게 한 뒤, 대기/실행 중인
+    비동기 추천 작업을 ``JOB_DRAIN_TIMEOUT`` 까지 마저 처리하고 LLM 호출용 공유 HTTP 연결 풀을 닫습니다.
+    
+    워커가 여러 개면 이 과정은 워커(프로세스)마다 한 번씩 실행됩니다.
+    """
+    app.state.ready = False
+    start = time.perf_counter()
+    
+    tracing = configure_tracing()
+    agent = recommendations.get_destination_agent()
+    warmup = await agent.warmup()
+    state = recommendations.get_shared_state()
+    if settings.CACHE_ENABLED:
+        recommendations.get_recommendation_cache()
+    if settings.workers > 1 and not state.shared_across_workers:
+        print(f"⚠️ 워커 {settings.workers}개가 CACHE_BACKEND={settings.CACHE_BACKEND} 를 각자 따로 사용합니다. "
+              "캐시/요청 수 제한/요청 병합/작업 조회를 워커 간에 공유하려면 CACHE_BACKEND=redis 를 사용하세요.")
+    
+    elapsed = time.perf_counter() - start
+    app.state.startup = {
+        "startupMs": round(elapsed * 1000, 3),
+        "environment": settings.ENVIRONMENT,
+        "pid": os.getpid(),
+        "tracing": tracing,
+        "warmup": warmup,
+    }
+    metrics.set_gauge("startup_seconds", elapsed)
+    app.state.ready = True
+    print(f"✅ Agent 워밍업 완료 ({elapsed:.2f}초)")
+    
+    yield
+    
+    # 로드 밸런서가 새 요청을 보내지 않도록 준비 상태부터 내림
+    app.state.ready = False
+    app.state.stopping = True
+    
+    # 진행 중인 비동기 작업 마무리 (새 작업은 503으로 거절)
+    drained = await recommendations.drain_jobs(settings.JOB_DRAIN_TIMEOUT)
+    if drained is not None:
+        print(f"🛑 비동기 작업 정리: 완료 {drained['drained']}건, 중단 {drained['abandoned']}건 ({drained['seconds']}초)")
+    
+    # LLM 제공자와의 공유 연결 풀 정리
+    await aclose_http_client()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -18,7 +79,8 @@ app = FastAPI(
     description="LangGraph 기반 지능형 여행 추천 시스템",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -56,21 +118,46 @@ async def health_check():
     """
     헬스 체크 엔드포인트
     
+    Agent 워밍업이 끝나기 전에는 503(starting), 종료 중에는 503(stopping)을 반환합니다.
+    
     Returns:
         서버 상태
     """
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(
+            status_code=503,
+            content={"status": recommendations.readiness_status(app), "service": "Travel Guide AI Server"}
+        )
     return {
         "status": "healthy",
-        "service": "Travel Guide AI Server"
+        "service": "Travel Guide AI Server",
+        "startup": app.state.startup
     }
 
 
+@app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """
+    Prometheus 메트릭 엔드포인트
+    
+    Returns:
+        단계별 지연 시간 히스토그램(p50/p95/p99 포함), LLM 토큰 사용량, 캐시/요청 병합 통계
+    """
+    return PlainTextResponse(
+        metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     
+    # 운영 환경(ENVIRONMENT=production)은 reload 없이 WORKERS개 프로세스로 실행
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.debug,
+        workers=settings.workers,
+        access_log=not settings.is_production
     )
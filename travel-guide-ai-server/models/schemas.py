@@ -5,7 +5,7 @@ API 요청/응답 모델을 정의합니다.
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -20,6 +20,8 @@ class PreferencesRequest(BaseModel):
     travelStyle: str = Field(..., description="여행 스타일 (beach, culture, adventure, city, nature)")
     companion: str = Field(..., description="동행자 (친구, 연인, 가족 등)")
     customRequest: Optional[str] = Field(None, description="추가 요청사항")
+    topK: int = Field(5, description="추천 여행지 수", ge=1, le=10)
+    maxTipsPerDestination: int = Field(3, description="여행지당 여행 팁 수", ge=0, le=5)
     
     class Config:
         json_schema_extra = {
@@ -31,7 +33,9 @@ class PreferencesRequest(BaseModel):
                 "numberOfPeople": 2,
                 "travelStyle": "beach",
                 "companion": "친구",
-                "customRequest": "맛있는 해산물 요리를 먹고 싶어요."
+                "customRequest": "맛있는 해산물 요리를 먹고 싶어요.",
+                "topK": 5,
+                "maxTipsPerDestination": 3
             }
         }
 
@@ -57,6 +61,8 @@ class RecommendationResponse(BaseModel):
     destinations: List[DestinationInfo] = Field(..., description="추천 여행지 목록")
     generatedAt: datetime = Field(default_factory=datetime.now, description="생성 시간")
     totalProcessingTime: Optional[float] = Field(None, description="처리 시간 (초)")
+    cacheStatus: Optional[str] = Field(None, description="캐시 상태 (hit, miss, bypass)")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="실행 정보 (Tool 호출 횟수, Tool별 소요 시간 등)")
     
     class Config:
         json_schema_extra = {
@@ -76,11 +82,49 @@ class RecommendationResponse(BaseModel):
                     }
                 ],
                 "generatedAt": "2024-01-01T00:00:00",
-                "totalProcessingTime": 2.5
+                "totalProcessingTime": 2.5,
+                "cacheStatus": "miss"
             }
         }
 
 
+class BatchRecommendationRequest(BaseModel):
+    """일괄 추천 요청 모델"""
+    
+    items: List[PreferencesRequest] = Field(..., min_length=1, max_length=500, description="선호도 목록")
+    maxConcurrency: Optional[int] = Field(None, ge=1, le=32, description="동시 실행 수 (기본: 서버 설정)")
+
+
+class BatchItemResult(BaseModel):
+    """일괄 추천 항목별 결과"""
+    
+    index: int = Field(..., description="요청 목록에서의 위치")
+    status: str = Field(..., description="처리 결과 (ok, error)")
+    result: Optional[RecommendationResponse] = Field(None, description="추천 결과")
+    error: Optional[str] = Field(None, description="에러 메시지")
+
+
+class BatchRecommendationResponse(BaseModel):
+    """일괄 추천 응답 모델"""
+    
+    results: List[BatchItemResult] = Field(..., description="요청 순서대로 정렬된 항목별 결과")
+    succeeded: int = Field(..., description="성공 항목 수")
+    failed: int = Field(..., description="실패 항목 수")
+    totalProcessingTime: Optional[float] = Field(None, description="전체 처리 시간 (초)")
+
+
+class RecommendationJob(BaseModel):
+    """비동기 추천 작업 상태 모델"""
+
+    jobId: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태 (queued, running, succeeded, failed)")
+    createdAt: datetime = Field(..., description="등록 시간")
+    startedAt: Optional[datetime] = Field(None, description="실행 시작 시간")
+    finishedAt: Optional[datetime] = Field(None, description="완료 시간")
+    result: Optional[RecommendationResponse] = Field(None, description="추천 결과 (succeeded)")
+    error: Optional[str] = Field(None, description="에러 메시지 (failed)")
+
+
 class ErrorResponse(BaseModel):
     """에러 응답 모델"""
     
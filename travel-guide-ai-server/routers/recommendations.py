@@ -4,9 +4,35 @@
 여행지 추천 관련 API 엔드포인트를 정의합니다.
 """
 
-from fastapi import APIRouter, HTTPException
-from models.schemas import PreferencesRequest, RecommendationResponse, ErrorResponse
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from models.schemas import (
+    PreferencesRequest,
+    RecommendationResponse,
+    ErrorResponse,
+    BatchRecommendationRequest,
+    BatchRecommendationResponse,
+    RecommendationJob,
+)
 from agents.destination_agent import DestinationAgent
+from config.settings import settings
+from utils.admission import AdmissionController, AdmissionRejected
+from utils.cache import RecommendationCache
+from utils.helpers import estimate_tokens, fits_budget, preferences_key
+from utils.jobs import JobQueue, JobQueueClosed, JobQueueFull, JobStore
+from utils.metrics import RequestTrace, collect_request_trace, current_trace, metrics, run_tokens, span
+from utils.outbound import CircuitOpenError, DeadlineExceeded, ProviderUnavailable, request_deadline
+from utils.rate_limit import RateLimiter
+from utils.responses import FastJSONResponse, dumps_str
+from utils.shared_state import InMemorySharedState, SharedState, create_shared_state
+from utils.single_flight import SharedSingleFlight, SingleFlight
+from contextlib import AsyncExitStack
+from datetime import datetime
+from typing import Any, Awaitable, Optional
+import asyncio
+import math
+import openai
 import time
 
 router = APIRouter(prefix="/api/recommendations", tags=["recommendations"])
@@ -14,6 +40,50 @@ router = APIRouter(prefix="/api/recommendations", tags=["recommendations"])
 # Agent 인스턴스 (싱글톤)
 destination_agent = None
 
+# 워커 간 공유 상태: 캐시, 요청 수 카운터, 요청 병합 잠금 (싱글톤)
+shared_state = None
+
+# 추천 결과 캐시 (싱글톤)
+recommendation_cache = None
+
+# 동일 요청 병합 (같은 정규화 키의 동시 요청은 Agent를 한 번만 실행, 싱글톤)
+recommendation_flight = None
+
+# 클라이언트별 요청 수 제한 (싱글톤)
+rate_limiter = None
+
+# 요청 수락 제어 (싱글톤)
+admission_controller = None
+
+# 비동기 추천 작업 대기열 + 작업자 (싱글톤)
+job_queue = None
+
+
+def _collect_router_metrics():
+    """캐시/요청 병합 통계를 /metrics로 노출"""
+    if recommendation_cache is not None:
+        stats = recommendation_cache.stats()
+        yield ("cache_hits_total", "counter", {}, stats["hits"])
+        yield ("cache_misses_total", "counter", {}, stats["misses"])
+        yield ("cache_errors_total", "counter", {}, stats["errors"])
+    if recommendation_flight is not None:
+        flight = recommendation_flight.stats()
+        yield ("single_flight_executions_total", "counter", {}, flight["executions"])
+        yield ("single_flight_coalesced_total", "counter", {}, flight["coalesced"])
+        yield ("single_flight_in_flight", "gauge", {}, flight["inFlight"])
+        yield ("single_flight_cancelled_total", "counter", {}, flight["cancelled"])
+        if "remoteCoalesced" in flight:
+            yield ("single_flight_remote_coalesced_total", "counter", {}, flight["remoteCoalesced"])
+    if rate_limiter is not None:
+        yield ("rate_limited_total", "counter", {}, rate_limiter.limited)
+    if admission_controller is not None:
+        yield from admission_controller.collect_metrics()
+    if job_queue is not None:
+        yield from job_queue.collect_metrics()
+
+
+metrics.register_collector(_collect_router_metrics)
+
 
 def get_destination_agent() -> DestinationAgent:
     """
@@ -28,48 +98,844 @@ def get_destination_agent() -> DestinationAgent:
     return destination_agent
 
 
+def get_shared_state() -> SharedState:
+    """
+    SharedState 인스턴스 반환 (싱글톤 패턴)
+    
+    ``CACHE_BACKEND`` 로 고른 저장소를 캐시, 요청 수 제한, 워커 간 요청 병합이 함께 씁니다.
+    
+    Returns:
+        SharedState 인스턴스
+    """
+    global shared_state
+    if shared_state is None:
+        shared_state = create_shared_state(
+            settings.CACHE_BACKEND,
+            max_entries=settings.CACHE_MAX_ENTRIES,
+            redis_url=settings.REDIS_URL
+        )
+    return shared_state
+
+
+def get_recommendation_cache() -> RecommendationCache:
+    """
+    RecommendationCache 인스턴스 반환 (싱글톤 패턴)
+    
+    Returns:
+        RecommendationCache 인스턴스
+    """
+    global recommendation_cache
+    if recommendation_cache is None:
+        recommendation_cache = RecommendationCache(
+            get_shared_state(),
+            ttl=settings.CACHE_TTL_SECONDS,
+            budget_bucket=settings.CACHE_BUDGET_BUCKET
+        )
+    return recommendation_cache
+
+
+def get_recommendation_flight() -> SingleFlight:
+    """
+    요청 병합 인스턴스 반환 (싱글톤 패턴)
+    
+    공유 상태가 프로세스 내부 메모리가 아니면 워커 간 잠금을 쓰는 ``SharedSingleFlight`` 를 사용합니다.
+    
+    Returns:
+        SingleFlight 인스턴스
+    """
+    global recommendation_flight
+    if recommendation_flight is None:
+        if settings.CACHE_BACKEND.lower() == "memory":
+            recommendation_flight = SingleFlight()
+        else:
+            recommendation_flight = SharedSingleFlight(
+                get_shared_state(),
+                lock_ttl=settings.SINGLE_FLIGHT_LOCK_TTL,
+                wait_timeout=settings.REQUEST_TIMEOUT or settings.SINGLE_FLIGHT_LOCK_TTL
+            )
+    return recommendation_flight
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    RateLimiter 인스턴스 반환 (싱글톤 패턴)
+    
+    Returns:
+        RateLimiter 인스턴스
+    """
+    global rate_limiter
+    if rate_limiter is None:
+        rate_limiter = RateLimiter(
+            get_shared_state(),
+            limit=settings.RATE_LIMIT_PER_MINUTE,
+            window=60,
+            trusted_proxies=settings.trusted_proxies_list
+        )
+    return rate_limiter
+
+
+def _client_id(request: Request) -> str:
+    """요청 수 제한에 쓸 클라이언트 식별자 (접속 IP, 신뢰 프록시를 거친 요청만 X-Client-Id/X-Forwarded-For)"""
+    return get_rate_limiter().client_id(request.client.host if request.client else None, request.headers)
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    AdmissionController 인스턴스 반환 (싱글톤 패턴)
+    
+    Returns:
+        AdmissionController 인스턴스
+    """
+    global admission_controller
+    if admission_controller is None:
+        admission_controller = AdmissionController(
+            max_concurrency=settings.ADMISSION_MAX_CONCURRENCY,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            max_queue_time=settings.ADMISSION_MAX_QUEUE_TIME
+        )
+    return admission_controller
+
+
+def get_job_queue() -> JobQueue:
+    """
+    JobQueue 인스턴스 반환 (싱글톤 패턴)
+    
+    작업 상태/결과는 ``CACHE_BACKEND`` 공유 상태에 저장되어 다른 워커에서도 조회할 수 있습니다.
+    ``memory`` 백엔드는 캐시 항목과 한 LRU를 쓰면 캐시 사용량에 밀려 끝난 작업이 ``JOB_RESULT_TTL`` 전에
+    지워지므로, 작업 전용 저장소(최대 ``JOB_MAX_RESULTS`` 개)를 따로 둡니다.
+    
+    Returns:
+        JobQueue 인스턴스
+    """
+    global job_queue
+    if job_queue is None:
+        state = get_shared_state()
+        if isinstance(state, InMemorySharedState):
+            state = InMemorySharedState(max_entries=settings.JOB_MAX_RESULTS)
+        job_queue = JobQueue(
+            JobStore(state, ttl=settings.JOB_RESULT_TTL),
+            _run_job,
+            workers=settings.JOB_WORKERS,
+            max_queue=settings.JOB_MAX_QUEUE
+        )
+    return job_queue
+
+
+def readiness_status(app: Any) -> str:
+    """준비되지 않은 서버의 헬스 체크 상태 (워밍업 중이면 starting, 종료 중이면 stopping)"""
+    return "stopping" if getattr(app.state, "stopping", False) else "starting"
+
+
+async def drain_jobs(timeout: Optional[float]) -> Optional[dict]:
+    """서버 종료 시 남은 비동기 작업 처리 (작업 대기열을 만든 적이 없으면 None)"""
+    if job_queue is None:
+        return None
+    return await job_queue.drain(timeout)
+
+
 @router.post(
     "/destinations",
     response_model=RecommendationResponse,
+    response_class=FastJSONResponse,
     summary="여행지 추천",
     description="사용자의 선호도를 바탕으로 최적의 여행지를 추천합니다.",
     responses={
         200: {"description": "추천 성공"},
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
-        500: {"model": ErrorResponse, "description": "서버 오류"}
+        429: {"model": ErrorResponse, "description": "요청 수 제한 초과 또는 처리 대기열이 가득 참 (Retry-After)"},
+        500: {"model": ErrorResponse, "description": "서버 오류"},
+        502: {"model": ErrorResponse, "description": "LLM 제공자 오류가 재시도 후에도 계속됨 (Retry-After)"},
+        503: {"model": ErrorResponse, "description": "LLM 제공자 장애/과부하로 일시적으로 처리 불가 (Retry-After)"},
+        504: {"model": ErrorResponse, "description": "요청 마감 시간 초과"},
+        499: {"description": "응답 전에 클라이언트 연결이 끊김 (본문 없음, 서버 로그/메트릭용)"}
     }
 )
-async def get_destination_recommendations(preferences: PreferencesRequest):
+async def get_destination_recommendations(
+    request: Request,
+    preferences: PreferencesRequest,
+    includeTimings: bool = Query(False, description="응답 metadata에 단계별 소요 시간과 토큰 사용량 포함"),
+    requestTimeout: Optional[float] = Header(
+        None,
+        alias="X-Request-Timeout",
+        gt=0,
+        description="클라이언트 제한 시간 (초, REQUEST_TIMEOUT보다 길면 REQUEST_TIMEOUT 적용)"
+    ),
+    requestPriority: Optional[str] = Header(
+        None,
+        alias="X-Request-Priority",
+        description="처리 우선순위 (high: 로그인 사용자, normal, low: 익명/백그라운드)"
+    )
+):
     """
     여행지 추천 API
     
+    요청 전체에 마감 시간을 두고, 그 안의 모든 LLM 호출은 남은 시간만큼만 기다립니다.
+    캐시에 없는 요청은 실행 슬롯을 우선순위대로 배정받으며, 대기열이 가득 차면 429로 거절합니다.
+    ``RATE_LIMIT_PER_MINUTE`` 이 설정되어 있으면 클라이언트별 분당 요청 수를 먼저 확인합니다.
+    응답 전에 클라이언트 연결이 끊기면 Agent 실행과 LLM 호출을 취소합니다. (``CANCEL_ON_DISCONNECT``)
+    
     Args:
+        request: 요청 (클라이언트 식별용)
         preferences: 사용자 선호도 (여행 기간, 예산, 인원, 스타일)
+        includeTimings: 단계별 소요 시간 포함 여부
+        requestTimeout: 클라이언트 제한 시간 (X-Request-Timeout 헤더)
+        requestPriority: 처리 우선순위 (X-Request-Priority 헤더)
     
     Returns:
         추천 여행지 목록
     """
+    await _check_rate_limit(request, "destinations")
+    
+    status = "error"
     try:
-        # 시작 시간 기록
-        start_time = time.time()
-        
-        # Agent 실행
-        agent = get_destination_agent()
-        result = await agent.run(preferences.dict())
+        with request_deadline(_request_timeout(requestTimeout)), \
+                collect_request_trace() as trace, span("request"):
+            response = await _cancel_on_disconnect(request, _recommend(
+                preferences,
+                trace if includeTimings else None,
+                AdmissionController.normalize_priority(requestPriority, settings.ADMISSION_DEFAULT_PRIORITY)
+            ))
+        if response is None:
+            # 받을 클라이언트가 없으므로 본문 없이 종료 (499: nginx의 Client Closed Request)
+            status = "cancelled"
+            metrics.inc("client_disconnects_total", endpoint="destinations")
+            return Response(status_code=499)
+        status = "ok"
+        return response
+    
+    except AdmissionRejected as e:
+        status = "rejected"
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except CircuitOpenError as e:
+        status = "unavailable"
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except ProviderUnavailable as e:
+        status = "unavailable"
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except DeadlineExceeded as e:
+        status = "timeout"
+        raise HTTPException(status_code=504, detail=f"추천 생성 시간이 초과되었습니다: {str(e)}")
+    except ValueError as e:
+        status = "invalid"
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"추천 생성 중 오류 발생: {_error_detail(e)}")
+    finally:
+        metrics.inc("requests_total", endpoint="destinations", status=status)
+
+
+async def _check_rate_limit(request: Request, endpoint: str, cost: int = 1) -> None:
+    """
+    ``RATE_LIMIT_PER_MINUTE`` 이 설정되어 있으면 클라이언트별 분당 요청 수 확인 (초과 시 429)
+    
+    일괄 추천은 항목 수(``cost``)만큼 셉니다.
+    """
+    if settings.RATE_LIMIT_PER_MINUTE <= 0:
+        return
+    allowed, retry_after = await get_rate_limiter().hit(_client_id(request), cost)
+    if not allowed:
+        metrics.inc("requests_total", endpoint=endpoint, status="rate_limited")
+        raise HTTPException(
+            status_code=429,
+            detail="요청 수 제한을 초과했습니다.",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+
+
+async def _cancel_on_disconnect(request: Request, work: Awaitable[Any]) -> Optional[Any]:
+    """
+    ``work`` 를 실행하면서 클라이언트 연결 종료를 감시
+    
+    결과가 나오기 전에 연결이 끊기면 ``work`` 를 취소하고 None을 반환합니다.
+    취소는 Agent 실행과 진행 중인 LLM 호출까지 전파되며, 같은 요청을 기다리는 다른 클라이언트가
+    있으면 (요청 병합) 실행은 그 클라이언트를 위해 계속됩니다.
+    """
+    if not settings.CANCEL_ON_DISCONNECT:
+        return await work
+    
+    task = asyncio.ensure_future(work)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # 어느 쪽이 먼저 끝나든(또는 이 코루틴이 취소되든) 남은 Task를 정리해 누수 방지
+        disconnected = not task.done()
+        task.cancel()
+        watcher.cancel()
+        await asyncio.gather(task, watcher, return_exceptions=True)
+    return None if disconnected else task.result()
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """요청 본문을 다 읽은 뒤 ASGI ``http.disconnect`` 메시지가 올 때까지 대기"""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+def _error_detail(error: BaseException) -> str:
+    """클라이언트에 보여 줄 오류 내용 (LLM 제공자 오류는 응답 본문 대신 종류만)"""
+    if isinstance(error, openai.APIStatusError):
+        return f"LLM 제공자 오류 (HTTP {error.status_code})"
+    if isinstance(error, openai.APIError):
+        return f"LLM 제공자 오류 ({error.__class__.__name__})"
+    return str(error)
+
+
+def _request_timeout(client_timeout: Optional[float]) -> Optional[float]:
+    """요청 마감 시간 (클라이언트 제한 시간과 REQUEST_TIMEOUT 중 짧은 쪽)"""
+    limits = [t for t in (client_timeout, settings.REQUEST_TIMEOUT) if t and t > 0]
+    return min(limits) if limits else None
+
+
+async def _recommend(
+    preferences: PreferencesRequest,
+    trace: Optional[RequestTrace],
+    priority: str = "normal"
+) -> FastJSONResponse:
+    """캐시 조회 → (병합된, 수락 제어를 거친) Agent 실행 → 응답 생성"""
+    # 시작 시간 기록
+    start_time = time.time()
+    result, cache_status = await _recommendation(preferences.model_dump(), priority)
+    
+    metadata = result.get("metadata")
+    if trace is not None:
+        metadata = {**(metadata or {}), "timings": trace.to_dict()}
+    
+    # 처리 시간 계산
+    processing_time = time.time() - start_time
+    
+    # 응답 생성 (여행지는 Agent에서 검증을 마쳤으므로 재검증 없이 직렬화)
+    with span("serialize"):
+        return FastJSONResponse(_response_body(
+            result.get("destinations", []),
+            cache_status,
+            processing_time,
+            metadata
+        ))
+
+
+async def _recommendation(payload: dict, priority: Optional[str] = "normal") -> tuple[dict, str]:
+    """
+    캐시 조회 → (병합된, 수락 제어를 거친) Agent 실행
+    
+    ``priority`` 가 None이면 수락 제어를 거치지 않습니다. (비동기 작업은 작업자 수로 동시 실행이 제한됨)
+    
+    Returns:
+        (Agent 결과, 캐시 상태)
+    """
+    # 캐시 조회
+    cache = get_recommendation_cache() if settings.CACHE_ENABLED else None
+    cache_status = "bypass"
+    result = None
+    if cache is not None:
+        with span("cache_lookup"):
+            result = await cache.get(payload)
+        cache_status = "hit" if result is not None else "miss"
+    
+    # Agent 실행 (동시에 들어온 같은 요청은 한 번의 실행 결과를 공유)
+    if result is None:
+        if settings.SINGLE_FLIGHT_ENABLED:
+            key = preferences_key(payload, settings.CACHE_BUDGET_BUCKET)
+            flight = get_recommendation_flight()
+            
+            def run():
+                return _generate_admitted(payload, cache, priority)
+            
+            if isinstance(flight, SharedSingleFlight) and cache is not None:
+                # 다른 워커가 실행 중이면 그 결과를 공유 캐시에서 받음
+                result, coalesced = await flight.do(key, run, lambda: cache.peek(payload))
+            else:
+                result, coalesced = await flight.do(key, run)
+            if coalesced and not fits_budget(result.get("destinations", []), payload):
+                # 같은 예산 구간의 더 높은 예산 요청 결과는 공유하지 않고 따로 생성
+                result, coalesced = await run(), False
+            if coalesced:
+                result = {**result, "metadata": {**(result.get("metadata") or {}), "coalesced": True}}
+        else:
+            result = await _generate_admitted(payload, cache, priority)
+    return result, cache_status
+
+
+def _response_body(
+    destinations: list,
+    cache_status: str,
+    processing_time: Optional[float] = None,
+    metadata: Optional[dict] = None
+) -> dict[str, Any]:
+    """
+    ``RecommendationResponse`` 형식의 응답 본문
+
+    여행지는 Agent가 ``DestinationInfo`` 로 검증한 딕셔너리(캐시 hit은 그 저장본)이므로 다시 검증하지 않습니다.
+    """
+    return {
+        "destinations": destinations,
+        "generatedAt": datetime.now().isoformat(),
+        "totalProcessingTime": processing_time,
+        "cacheStatus": cache_status,
+        "metadata": metadata
+    }
+
+
+async def _generate_admitted(payload: dict, cache: Optional[RecommendationCache], priority: Optional[str]) -> dict:
+    """
+    실행 슬롯을 받은 뒤 추천 생성
+    
+    병합된 요청은 실행하는 쪽 하나만 슬롯을 차지합니다.
+    """
+    if not settings.ADMISSION_ENABLED or priority is None:
+        return await _generate_recommendations(payload, cache)
+    async with get_admission_controller().admit(priority):
+        return await _generate_recommendations(payload, cache)
+
+
+async def _generate_recommendations(payload: dict, cache: Optional[RecommendationCache]) -> dict:
+    """
+    Agent로 추천을 생성하고 정상 결과를 캐시에 저장
+    
+    실행이 취소되면 끝까지 실행했을 때의 평균 출력 토큰 대비 생성하지 않은 토큰을 기록합니다.
+    """
+    agent = get_destination_agent()
+    trace = current_trace()
+    output_before = trace.usage["outputTokens"] if trace is not None else 0
+    try:
+        result = await agent.run(payload)
+    except asyncio.CancelledError:
+        generated = trace.usage["outputTokens"] - output_before if trace is not None else 0
+        run_tokens.record_cancelled(generated)
+        raise
+    
+    if trace is not None and not result.get("error"):
+        run_tokens.observe(trace.usage["outputTokens"] - output_before)
+    # 정상 결과만 캐시에 저장
+    if cache is not None and result.get("destinations") and not result.get("error"):
+        await cache.set(payload, {"destinations": result["destinations"]})
+    return result
+
+
+@router.post(
+    "/destinations:batch",
+    response_model=BatchRecommendationResponse,
+    response_class=FastJSONResponse,
+    summary="여행지 일괄 추천",
+    description=(
+        "여러 선호도 프로필에 대한 추천을 제한된 동시성으로 일괄 생성합니다. "
+        "결과는 요청 순서대로 항목별 성공/실패와 함께 반환되며, 성공한 결과는 캐시에 저장됩니다."
+    ),
+    responses={
+        200: {"description": "항목별 결과 (일부 실패 포함 가능, 실행 슬롯을 못 받은 항목이 있으면 Retry-After)"},
+        429: {"model": ErrorResponse, "description": "요청 수 제한 초과 또는 모든 항목이 처리 대기열에서 거절됨 (Retry-After)"},
+        500: {"model": ErrorResponse, "description": "서버 오류"}
+    }
+)
+async def batch_destination_recommendations(
+    request: Request,
+    batch: BatchRecommendationRequest,
+    requestTimeout: Optional[float] = Header(
+        None,
+        alias="X-Request-Timeout",
+        gt=0,
+        description="클라이언트 제한 시간 (초, REQUEST_TIMEOUT보다 길면 REQUEST_TIMEOUT 적용)"
+    )
+):
+    """
+    여행지 일괄 추천 API
+    
+    요청 수 제한은 항목 수만큼 셉니다. 캐시에 없는 항목은 ``low`` 우선순위로 항목마다 실행 슬롯을 받아
+    실행하므로 (동시에 최대 ``maxConcurrency`` 개) 대화형 요청보다 먼저 슬롯을 차지하지 않습니다.
+    전체에 요청 마감 시간을 두며, 시간이 지나거나 슬롯을 받지 못한 항목은 실패로 반환합니다.
+    
+    Args:
+        request: 요청 (클라이언트 식별용)
+        batch: 선호도 목록과 동시 실행 수
+        requestTimeout: 클라이언트 제한 시간 (X-Request-Timeout 헤더)
+    
+    Returns:
+        요청 순서대로 정렬된 항목별 결과
+    """
+    await _check_rate_limit(request, "batch", cost=len(batch.items))
+    
+    start_time = time.time()
+    cache = get_recommendation_cache() if settings.CACHE_ENABLED else None
+    cache_status = "miss" if cache is not None else "bypass"
+    
+    results: list[Optional[dict[str, Any]]] = [None] * len(batch.items)
+    payloads: dict[str, dict] = {}
+    pending: dict[str, list[int]] = {}  # 정규화 키 + 실제 예산 → 요청 위치 (같은 키는 한 번만 실행)
+    
+    for index, item in enumerate(batch.items):
+        payload = item.model_dump()
+        try:
+            # 같은 예산 구간이라도 예산이 다르면 결과를 나눠 쓰지 않음 (높은 예산 결과가 예산을 넘을 수 있음)
+            key = f"{preferences_key(payload, settings.CACHE_BUDGET_BUCKET)}:{payload.get('budget')}"
+            cached = await cache.get(payload) if cache is not None else None
+        except ValueError as e:
+            results[index] = _batch_error(index, str(e))
+            continue
         
-        # 처리 시간 계산
-        processing_time = time.time() - start_time
+        if cached is not None:
+            results[index] = _batch_item_result(index, cached, "hit")
+            continue
         
-        # 응답 생성
-        return RecommendationResponse(
-            destinations=result.get("destinations", []),
-            totalProcessingTime=processing_time
+        payloads.setdefault(key, payload)
+        pending.setdefault(key, []).append(index)
+    
+    keys = list(pending)
+    semaphore = asyncio.Semaphore(batch.maxConcurrency or get_destination_agent().max_concurrency)
+    
+    async def run(key: str) -> Any:
+        # 성공한 결과는 _generate_recommendations가 캐시에 저장
+        async with semaphore:
+            try:
+                return await _generate_admitted(payloads[key], cache, "low")
+            except Exception as e:
+                return e
+    
+    with request_deadline(_request_timeout(requestTimeout)):
+        outputs = await asyncio.gather(*(run(key) for key in keys))
+    
+    rejected = [output for output in outputs if isinstance(output, AdmissionRejected)]
+    if keys and len(rejected) == len(keys):
+        # 실행할 항목이 모두 대기열에서 거절됨: 부분 결과 대신 429
+        metrics.inc("requests_total", endpoint="batch", status="rejected")
+        raise HTTPException(
+            status_code=429,
+            detail=str(rejected[0]),
+            headers={"Retry-After": str(max(1, math.ceil(max(e.retry_after for e in rejected))))}
         )
     
+    for key, output in zip(keys, outputs):
+        for index in pending[key]:
+            results[index] = _batch_item_result(index, output, cache_status)
+    
+    failed = sum(1 for item in results if item["status"] == "error")
+    metrics.inc("requests_total", endpoint="batch", status="ok")
+    headers = None
+    if rejected:
+        headers = {"Retry-After": str(max(1, math.ceil(max(e.retry_after for e in rejected))))}
+    return FastJSONResponse({
+        "results": results,
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "totalProcessingTime": time.time() - start_time
+    }, headers=headers)
+
+
+def _batch_item_result(index: int, output, cache_status: str) -> dict[str, Any]:
+    """Agent 실행 결과(또는 예외)를 일괄 추천 항목 결과(``BatchItemResult`` 형식)로 변환"""
+    if isinstance(output, (AdmissionRejected, ProviderUnavailable, CircuitOpenError)):
+        return _batch_error(index, str(output))
+    if isinstance(output, DeadlineExceeded):
+        return _batch_error(index, f"추천 생성 시간이 초과되었습니다: {str(output)}")
+    if isinstance(output, Exception):
+        return _batch_error(index, f"추천 생성 중 오류 발생: {_error_detail(output)}")
+    if output.get("error"):
+        return _batch_error(index, output["error"])
+    
+    return {
+        "index": index,
+        "status": "ok",
+        "result": _response_body(output.get("destinations", []), cache_status, metadata=output.get("metadata")),
+        "error": None
+    }
+
+
+def _batch_error(index: int, error: str) -> dict[str, Any]:
+    """실패한 일괄 추천 항목 결과"""
+    return {"index": index, "status": "error", "result": None, "error": error}
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Server-Sent Event 한 건을 문자열로 직렬화"""
+    return f"event: {event}\ndata: {dumps_str(data)}\n\n"
+
+
+@router.post(
+    "/destinations/stream",
+    summary="여행지 추천 (스트리밍)",
+    description=(
+        "추천 여행지를 Server-Sent Events로 스트리밍합니다. "
+        "여행지 하나가 완성될 때마다 `destination` 이벤트를, 마지막에 `summary` 이벤트를 보냅니다."
+    ),
+    responses={
+        200: {"description": "text/event-stream 스트림", "content": {"text/event-stream": {}}},
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        429: {"model": ErrorResponse, "description": "요청 수 제한 초과 또는 처리 대기열이 가득 참 (Retry-After)"},
+        503: {"model": ErrorResponse, "description": "LLM 제공자 장애로 일시적으로 처리 불가 (Retry-After)"},
+        504: {"model": ErrorResponse, "description": "실행 슬롯을 기다리는 중 요청 마감 시간 초과"}
+    }
+)
+async def stream_destination_recommendations(
+    request: Request,
+    preferences: PreferencesRequest,
+    requestTimeout: Optional[float] = Header(
+        None,
+        alias="X-Request-Timeout",
+        gt=0,
+        description="클라이언트 제한 시간 (초, REQUEST_TIMEOUT보다 길면 REQUEST_TIMEOUT 적용)"
+    ),
+    requestPriority: Optional[str] = Header(
+        None,
+        alias="X-Request-Priority",
+        description="처리 우선순위 (high: 로그인 사용자, normal, low: 익명/백그라운드)"
+    )
+):
+    """
+    여행지 추천 스트리밍 API
+    
+    요청 수 제한, 요청 마감 시간, 수락 제어는 ``/destinations`` 와 같습니다. 스트림을 연 뒤에는 상태 코드를
+    바꿀 수 없으므로 실행 슬롯은 응답을 시작하기 전에 받고(못 받으면 429), 스트림이 끝날 때 반납합니다.
+    마감 시간이 지나면 ``error`` 이벤트로 알립니다.
+    
+    Args:
+        request: 요청 (클라이언트 식별용)
+        preferences: 사용자 선호도 (여행 기간, 예산, 인원, 스타일)
+        requestTimeout: 클라이언트 제한 시간 (X-Request-Timeout 헤더)
+        requestPriority: 처리 우선순위 (X-Request-Priority 헤더)
+    
+    Returns:
+        text/event-stream 응답
+    """
+    await _check_rate_limit(request, "stream")
+    
+    start_time = time.time()
+    payload = preferences.model_dump()
+    timeout = _request_timeout(requestTimeout)
+    deadline_at = time.monotonic() + timeout if timeout else None
+    slot = AsyncExitStack()
+    
+    # 캐시 조회 (hit이면 저장된 결과를 바로 흘려보냄)
+    cache = get_recommendation_cache() if settings.CACHE_ENABLED else None
+    cached = None
+    try:
+        if cache is not None:
+            cached = await cache.get(payload)
+        stream = None
+        if cached is None:
+            agent = get_destination_agent()
+            # 스트림을 연 뒤에는 상태 코드를 바꿀 수 없으므로 서킷 상태와 실행 슬롯을 먼저 확인
+            agent.outbound.breaker.check()
+            stream = agent.astream_destinations(payload)
+            if settings.ADMISSION_ENABLED:
+                # 마지막 단계: 슬롯을 받은 뒤에는 실패할 수 있는 작업이 없어야 슬롯이 새지 않음
+                priority = AdmissionController.normalize_priority(
+                    requestPriority, settings.ADMISSION_DEFAULT_PRIORITY
+                )
+                with request_deadline(timeout):
+                    await slot.enter_async_context(get_admission_controller().admit(priority))
+    except AdmissionRejected as e:
+        metrics.inc("requests_total", endpoint="stream", status="rejected")
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except DeadlineExceeded as e:
+        metrics.inc("requests_total", endpoint="stream", status="timeout")
+        raise HTTPException(status_code=504, detail=f"추천 생성 시간이 초과되었습니다: {str(e)}")
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"추천 생성 중 오류 발생: {str(e)}")
+    
+    if cached is not None:
+        cache_status = "hit"
+    else:
+        cache_status = "miss" if cache is not None else "bypass"
+    
+    async def event_stream():
+        destinations = []
+        error = None
+        # 마감 시간은 요청이 들어온 시점부터 (응답 스트림은 엔드포인트 밖의 컨텍스트에서 실행됨)
+        remaining = max(deadline_at - time.monotonic(), 0.001) if deadline_at is not None else None
+        
+        try:
+            with request_deadline(remaining):
+                if cached is not None:
+                    for destination in cached.get("destinations", []):
+                        destinations.append(destination)
+                        yield _sse_event("destination", destination)
+                else:
+                    async for destination in stream:
+                        destinations.append(destination)
+                        yield _sse_event("destination", destination)
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료: Starlette가 스트림을 취소하면 Agent 스트림과 LLM 호출도 함께 중단됨
+            metrics.inc("client_disconnects_total", endpoint="stream")
+            if stream is not None:
+                run_tokens.record_cancelled(estimate_tokens(dumps_str(destinations)))
+            raise
+        except DeadlineExceeded as e:
+            error = f"추천 생성 시간이 초과되었습니다: {str(e)}"
+            yield _sse_event("error", {"error": error})
+        except Exception as e:
+            error = f"추천 생성 중 오류 발생: {_error_detail(e)}"
+            yield _sse_event("error", {"error": error})
+        finally:
+            # 스트림이 끝나거나 끊기면 실행 슬롯 반납
+            await slot.aclose()
+        
+        if cache is not None and cached is None and destinations and error is None:
+            await cache.set(payload, {"destinations": destinations})
+        
+        yield _sse_event("summary", {
+            "totalCount": len(destinations),
+            "totalProcessingTime": time.time() - start_time,
+            "cacheStatus": cache_status
+        })
+    
+    metrics.inc("requests_total", endpoint="stream", status="accepted")
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 스트림을 시작하기 전에 연결이 끊겨 event_stream이 실행되지 않아도 슬롯이 반납되도록
+        background=BackgroundTask(slot.aclose)
+    )
+
+
+@router.post(
+    "/jobs",
+    status_code=202,
+    response_model=RecommendationJob,
+    response_class=FastJSONResponse,
+    summary="여행지 추천 작업 등록 (비동기)",
+    description=(
+        "추천 생성을 백그라운드 작업으로 등록하고 작업 ID를 바로 반환합니다. "
+        "결과는 `GET /api/recommendations/jobs/{jobId}` 로 조회합니다 (Location 헤더)."
+    ),
+    responses={
+        202: {"description": "작업 등록됨 (queued)"},
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        429: {"model": ErrorResponse, "description": "요청 수 제한 초과 또는 작업 대기열이 가득 참 (Retry-After)"},
+        503: {"model": ErrorResponse, "description": "서버 종료 중"}
+    }
+)
+async def create_recommendation_job(
+    request: Request,
+    preferences: PreferencesRequest,
+    requestPriority: Optional[str] = Header(
+        None,
+        alias="X-Request-Priority",
+        description="작업 실행 순서 (high → normal → low, 같은 우선순위는 등록 순)"
+    )
+):
+    """
+    여행지 추천 작업 등록 API
+    
+    연결이 끊겨도 작업은 계속 실행되고, 결과는 ``JOB_RESULT_TTL`` 동안 보관됩니다.
+    작업자(``JOB_WORKERS``)가 모두 바쁘면 대기열에서 기다리며, 대기열(``JOB_MAX_QUEUE``)이 가득 차면 429로 거절합니다.
+    
+    Args:
+        request: 요청 (클라이언트 식별용)
+        preferences: 사용자 선호도 (여행 기간, 예산, 인원, 스타일)
+        requestPriority: 우선순위 (X-Request-Priority 헤더)
+    
+    Returns:
+        작업 상태 (queued)
+    """
+    await _check_rate_limit(request, "jobs")
+    
+    payload = preferences.model_dump()
+    status = "error"
+    try:
+        # 날짜 형식 오류는 작업 실패가 아니라 400으로 바로 알림
+        preferences_key(payload, settings.CACHE_BUDGET_BUCKET)
+        job = await get_job_queue().submit(
+            payload,
+            AdmissionController.normalize_priority(requestPriority, settings.ADMISSION_DEFAULT_PRIORITY)
+        )
+        status = "accepted"
+    except ValueError as e:
+        status = "invalid"
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobQueueFull as e:
+        status = "rejected"
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except JobQueueClosed as e:
+        status = "unavailable"
+        raise HTTPException(status_code=503, detail=str(e))
+    finally:
+        metrics.inc("requests_total", endpoint="jobs", status=status)
+    
+    return FastJSONResponse(
+        job,
+        status_code=202,
+        headers={"Location": f"{router.prefix}/jobs/{job['jobId']}"}
+    )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=RecommendationJob,
+    response_class=FastJSONResponse,
+    summary="여행지 추천 작업 조회",
+    description="작업 상태를 조회합니다. 완료(succeeded)된 작업은 `result` 에 추천 결과가 들어 있습니다.",
+    responses={
+        200: {"description": "작업 상태"},
+        404: {"model": ErrorResponse, "description": "없는 작업이거나 보관 기간(JOB_RESULT_TTL)이 지남"}
+    }
+)
+async def get_recommendation_job(job_id: str):
+    """
+    여행지 추천 작업 조회 API
+    
+    Args:
+        job_id: 작업 ID
+    
+    Returns:
+        작업 상태 (queued, running, succeeded, failed)
+    """
+    job = await get_job_queue().store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return FastJSONResponse(job)
+
+
+async def _run_job(payload: dict) -> dict:
+    """
+    비동기 작업 하나 실행 (동기 API와 같은 캐시/요청 병합 경로, ``JOB_TIMEOUT`` 마감 시간)
+    
+    동시 실행 수는 작업자 수로 제한되므로 수락 제어 대기열은 거치지 않습니다.
+    
+    Returns:
+        ``RecommendationResponse`` 형식의 결과
+    """
+    start_time = time.time()
+    with request_deadline(settings.JOB_TIMEOUT), collect_request_trace(), span("job"):
+        try:
+            result, cache_status = await _recommendation(payload, None)
+        except DeadlineExceeded as e:
+            raise RuntimeError(f"추천 생성 시간이 초과되었습니다: {str(e)}") from e
+    if result.get("error"):
+        raise RuntimeError(result["error"])
+    return _response_body(
+        result.get("destinations", []),
+        cache_status,
+        time.time() - start_time,
+        result.get("metadata")
+    )
 
 
 @router.get(
@@ -77,20 +943,34 @@ async def get_destination_recommendations(preferences: PreferencesRequest):
     summary="헬스 체크",
     description="Agent 상태를 확인합니다."
 )
-async def health_check():
+async def health_check(request: Request):
     """
     Agent 헬스 체크
     
+    서버 시작 워밍업이 끝나기 전에는 503(starting), 종료 중에는 503(stopping)을 반환합니다.
+    
     Returns:
         Agent 상태 정보
     """
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": readiness_status(request.app)})
     try:
         agent = get_destination_agent()
-        return {
+        health = {
             "status": "healthy",
             "agent": "DestinationAgent",
-            "tools_count": len(agent.tools)
+            "tools_count": len(agent.tools),
+            "modelTiers": agent.router.stats(),
+            "outbound": agent.outbound.stats()
         }
+        if settings.CACHE_ENABLED:
+            health["cache"] = get_recommendation_cache().stats()
+        health["singleFlight"] = get_recommendation_flight().stats()
+        if settings.RATE_LIMIT_PER_MINUTE > 0:
+            health["rateLimit"] = get_rate_limiter().stats()
+        if settings.ADMISSION_ENABLED:
+            health["admission"] = get_admission_controller().stats()
+        return health
     except Exception as e:
         return {
             "status": "unhealthy",
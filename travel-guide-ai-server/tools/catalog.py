@@ -0,0 +1,184 @@
+"""
+여행지 카탈로그
+
+여행지 데이터를 파일(JSON/CSV)에서 한 번만 읽어 이름(별칭 포함), 스타일, 국가,
+평균 비용 구간으로 색인합니다. 검색/가격 Tool은 모두 이 카탈로그를 조회합니다.
+"""
+
+import csv
+import json
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config.settings import settings
+
+
+DEFAULT_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "destinations.json"
+
+
+def normalize_name(name: str) -> str:
+    """이름 비교용 정규화 (대소문자, 공백, 하이픈 무시)"""
+    return "".join(name.split()).replace("-", "").casefold()
+
+
+@dataclass(frozen=True)
+class Destination:
+    """카탈로그 항목"""
+
+    name: str
+    country: str
+    style: str
+    avgCost: int
+    aliases: Tuple[str, ...] = ()
+    highlights: Tuple[str, ...] = ()
+    bestSeason: str = "연중"
+    flightPrice: Optional[int] = None  # 서울 출발 1인 항공료
+    accommodationPerNight: Optional[int] = None  # 2인 기준 1박 숙박비
+
+    def summary(self) -> Dict[str, Any]:
+        """검색 결과용 요약 (이름, 국가, 평균 비용)"""
+        return {"name": self.name, "country": self.country, "avgCost": self.avgCost}
+
+
+@dataclass
+class DestinationCatalog:
+    """
+    색인된 여행지 카탈로그
+
+    - 이름/별칭: 정규화된 이름 → 항목 (O(1))
+    - 스타일, 국가: 값 → 항목 리스트
+    - 평균 비용: 정렬된 배열에 대한 이진 탐색으로 구간 조회
+    """
+
+    destinations: List[Destination] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._by_name: Dict[str, Destination] = {}
+        self._by_style: Dict[str, List[Destination]] = {}
+        self._by_country: Dict[str, List[Destination]] = {}
+
+        for dest in self.destinations:
+            for key in (dest.name, *dest.aliases):
+                self._by_name.setdefault(normalize_name(key), dest)
+            self._by_style.setdefault(dest.style.lower(), []).append(dest)
+            self._by_country.setdefault(normalize_name(dest.country), []).append(dest)
+
+        by_cost = sorted(self.destinations, key=lambda d: d.avgCost)
+        self._cost_keys = [dest.avgCost for dest in by_cost]
+        self._by_cost = by_cost
+
+    def __len__(self) -> int:
+        return len(self.destinations)
+
+    def __iter__(self) -> Iterator[Destination]:
+        return iter(self.destinations)
+
+    @property
+    def styles(self) -> List[str]:
+        """등록된 여행 스타일 목록"""
+        return list(self._by_style)
+
+    def get(self, name: str) -> Optional[Destination]:
+        """이름 또는 별칭으로 조회 (한글/영문, 대소문자/공백 무시)"""
+        return self._by_name.get(normalize_name(name))
+
+    def by_style(self, style: str) -> List[Destination]:
+        """여행 스타일별 여행지"""
+        return self._by_style.get(style.lower(), [])
+
+    def by_country(self, country: str) -> List[Destination]:
+        """국가별 여행지"""
+        return self._by_country.get(normalize_name(country), [])
+
+    def in_cost_range(self, min_cost: int = 0, max_cost: Optional[int] = None) -> List[Destination]:
+        """평균 비용이 [min_cost, max_cost] 구간에 있는 여행지 (비용 오름차순)"""
+        lo = bisect_left(self._cost_keys, min_cost)
+        hi = len(self._cost_keys) if max_cost is None else bisect_right(self._cost_keys, max_cost)
+        return self._by_cost[lo:hi]
+
+    def as_style_db(self) -> Dict[str, List[Dict[str, Any]]]:
+        """기존 ``DESTINATIONS_DB`` 형식 (스타일 → 요약 리스트)"""
+        return {
+            style: [dest.summary() for dest in dests]
+            for style, dests in self._by_style.items()
+        }
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "DestinationCatalog":
+        """딕셔너리 레코드 목록으로 카탈로그 생성"""
+        return cls([_record_to_destination(record) for record in records])
+
+    @classmethod
+    def from_json(cls, path: Path) -> "DestinationCatalog":
+        """
+        JSON 파일에서 로드
+
+        ``{"destinations": [...]}`` 또는 레코드 배열 형식을 지원합니다.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        records = data["destinations"] if isinstance(data, dict) else data
+        return cls.from_records(records)
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "DestinationCatalog":
+        """
+        CSV 파일에서 로드
+
+        리스트 컬럼(aliases, highlights)은 ``|`` 로 구분합니다.
+        """
+        with open(path, encoding="utf-8", newline="") as f:
+            records = []
+            for row in csv.DictReader(f):
+                for column in ("aliases", "highlights"):
+                    value = row.get(column) or ""
+                    row[column] = [item.strip() for item in value.split("|") if item.strip()]
+                records.append(row)
+        return cls.from_records(records)
+
+    @classmethod
+    def load(cls, path: Path) -> "DestinationCatalog":
+        """확장자(.json/.csv)에 따라 로드"""
+        path = Path(path)
+        if path.suffix.lower() == ".csv":
+            return cls.from_csv(path)
+        return cls.from_json(path)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _record_to_destination(record: Dict[str, Any]) -> Destination:
+    return Destination(
+        name=record["name"],
+        country=record["country"],
+        style=record["style"].lower(),
+        avgCost=int(record["avgCost"]),
+        aliases=tuple(record.get("aliases") or ()),
+        highlights=tuple(record.get("highlights") or ()),
+        bestSeason=record.get("bestSeason") or "연중",
+        flightPrice=_optional_int(record.get("flightPrice")),
+        accommodationPerNight=_optional_int(record.get("accommodationPerNight")),
+    )
+
+
+# 카탈로그 인스턴스 (싱글톤)
+_catalog: Optional[DestinationCatalog] = None
+
+
+def get_catalog() -> DestinationCatalog:
+    """
+    DestinationCatalog 인스턴스 반환 (최초 호출 시 한 번만 로드)
+
+    ``DESTINATIONS_DATA_PATH`` 가 설정되어 있으면 해당 파일을, 아니면 내장 데이터를 사용합니다.
+    """
+    global _catalog
+    if _catalog is None:
+        path = settings.DESTINATIONS_DATA_PATH or DEFAULT_DATA_PATH
+        _catalog = DestinationCatalog.load(path)
+    return _catalog
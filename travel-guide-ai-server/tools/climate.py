@@ -0,0 +1,245 @@
+"""
+여행지 기후/이벤트 테이블
+
+여행지별 월평균 기온, 강수량, 날씨 설명과 월별 이벤트를 파일에서 한 번만 읽어
+(여행지 인덱스 × 12개월) 배열과 (여행지, 월) 이벤트 색인으로 들고 있습니다.
+날씨 Tool과 추천 경로의 후보 날씨 표시는 모두 이 테이블을 조회합니다.
+
+여행지 인덱스는 카탈로그 순서를 따르고, 기후 데이터가 없는 여행지(와 카탈로그에 없는 이름)는
+마지막 행의 기본값을 사용합니다.
+
+사용 예:
+    store = get_climate_store()
+    store.forecast("다낭", 8)
+    store.bulk(["다낭", "발리"], months=[7, 8])  # {"다낭": {7: {...}, 8: {...}}, ...}
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import settings
+from tools.catalog import DestinationCatalog, get_catalog, normalize_name
+
+
+DEFAULT_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "climate.json"
+
+RAINFALL_LEVELS = ("낮음", "보통", "높음")
+
+SEASONS = {12: "겨울", 1: "겨울", 2: "겨울", 3: "봄", 4: "봄", 5: "봄",
+           6: "여름", 7: "여름", 8: "여름", 9: "가을", 10: "가을", 11: "가을"}
+
+
+def describe(temperature: int, rainfall: int) -> str:
+    """기온과 강수량 등급으로 기본 날씨 설명 생성"""
+    if temperature >= 28:
+        feel = "덥고"
+    elif temperature >= 22:
+        feel = "따뜻하고"
+    elif temperature >= 15:
+        feel = "선선하고"
+    elif temperature >= 5:
+        feel = "쌀쌀하고"
+    else:
+        feel = "춥고"
+    sky = ("맑은 날이 많음", "가끔 비", "비가 잦음")[rainfall]
+    return f"{feel} {sky}"
+
+
+def weather_recommendation(temperature: int, rainfall: str) -> str:
+    """날씨 정보를 바탕으로 추천 사항 생성"""
+    recommendations = []
+
+    if temperature > 28:
+        recommendations.append("선크림과 모자 필수")
+    elif temperature < 10:
+        recommendations.append("따뜻한 옷 준비")
+
+    if rainfall == "높음":
+        recommendations.append("우산 또는 우비 준비")
+        recommendations.append("실내 활동 계획 추천")
+
+    return ", ".join(recommendations) if recommendations else "쾌적한 여행 날씨"
+
+
+class ClimateStore:
+    """
+    월 단위 기후 테이블
+
+    - ``temperature``: (여행지 + 1, 12) int16, 월평균 기온
+    - ``rainfall``: (여행지 + 1, 12) uint8, 강수량 등급 (``RAINFALL_LEVELS`` 인덱스)
+    - ``description``: (여행지 + 1, 12) int16, ``descriptions`` 어휘 인덱스
+    - 이벤트: (여행지 인덱스, 월) → 이벤트 목록
+
+    배열의 마지막 행은 기후 데이터가 없는 여행지용 기본값입니다.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        temperature: np.ndarray,
+        rainfall: np.ndarray,
+        description: np.ndarray,
+        descriptions: Sequence[str],
+        events: Dict[Tuple[int, int], Tuple[str, ...]],
+        aliases: Optional[Dict[str, int]] = None
+    ):
+        self.names = list(names)
+        self.temperature = temperature
+        self.rainfall = rainfall
+        self.description = description
+        self.descriptions = list(descriptions)
+        self.events = events
+        self.default_index = len(self.names)
+        self._index = {normalize_name(name): i for i, name in enumerate(self.names)}
+        for alias, i in (aliases or {}).items():
+            self._index.setdefault(normalize_name(alias), i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index_of(self, name: str) -> int:
+        """이름(별칭 포함)의 행 인덱스 (없으면 기본값 행)"""
+        return self._index.get(normalize_name(name), self.default_index)
+
+    def has(self, name: str) -> bool:
+        """기후 데이터가 있는 여행지인지"""
+        return self.index_of(name) != self.default_index
+
+    def forecast(self, name: str, month: int) -> Dict[str, Any]:
+        """여행지 한 곳, 한 달의 날씨 (``get_weather_forecast`` 형식)"""
+        return self._record(name, self.index_of(name), _month_column(month))
+
+    def events_for(self, name: str, month: int) -> List[str]:
+        """여행지 한 곳, 한 달의 이벤트 목록"""
+        return list(self.events.get((self.index_of(name), _month_column(month) + 1), ()))
+
+    def bulk(self, names: Sequence[str], months: Iterable[int]) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """
+        여러 여행지 × 여러 달의 날씨와 이벤트를 한 번에 조회
+
+        Returns:
+            {여행지 이름: {월: 날씨 정보 + ``events``}}
+        """
+        rows = [self.index_of(name) for name in names]
+        columns = [_month_column(month) for month in months]
+        result: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for name, row in zip(names, rows):
+            by_month = {}
+            for column in columns:
+                record = self._record(name, row, column)
+                record["events"] = list(self.events.get((row, column + 1), ()))
+                by_month[column + 1] = record
+            result[name] = by_month
+        return result
+
+    def temperatures(self, names: Sequence[str], months: Sequence[int]) -> np.ndarray:
+        """(여행지, 월) 월평균 기온 배열"""
+        rows = np.array([self.index_of(name) for name in names], dtype=np.intp)
+        columns = np.array([_month_column(month) for month in months], dtype=np.intp)
+        return self.temperature[np.ix_(rows, columns)]
+
+    def _record(self, name: str, row: int, column: int) -> Dict[str, Any]:
+        temperature = int(self.temperature[row, column])
+        rainfall = RAINFALL_LEVELS[self.rainfall[row, column]]
+        return {
+            "destination": name,
+            "month": column + 1,
+            "season": SEASONS[column + 1],
+            "avgTemperature": temperature,
+            "rainfall": rainfall,
+            "description": self.descriptions[self.description[row, column]],
+            "recommendation": weather_recommendation(temperature, rainfall)
+        }
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        default: Dict[str, Any],
+        catalog: Optional[DestinationCatalog] = None
+    ) -> "ClimateStore":
+        """
+        레코드 목록으로 생성
+
+        ``catalog`` 가 있으면 카탈로그 순서로 행을 만들고 카탈로그 별칭으로도 조회할 수 있습니다.
+        카탈로그에 없는 기후 레코드는 뒤에 이어 붙입니다.
+        """
+        by_name = {normalize_name(record["name"]): record for record in records}
+        names: List[str] = []
+        aliases: Dict[str, int] = {}
+        if catalog is not None:
+            for dest in catalog:
+                for alias in dest.aliases:
+                    aliases[alias] = len(names)
+                names.append(dest.name)
+        known = {normalize_name(name) for name in names}
+        names.extend(record["name"] for key, record in by_name.items() if key not in known)
+
+        count = len(names) + 1
+        temperature = np.empty((count, 12), dtype=np.int16)
+        rainfall = np.empty((count, 12), dtype=np.uint8)
+        description = np.empty((count, 12), dtype=np.int16)
+        vocabulary: Dict[str, int] = {}
+        events: Dict[Tuple[int, int], Tuple[str, ...]] = {}
+
+        rows = [by_name.get(normalize_name(name), default) for name in names] + [default]
+        for i, record in enumerate(rows):
+            temperature[i] = _twelve(record["temperature"], "temperature")
+            rainfall[i] = _twelve(record["rainfall"], "rainfall")
+            notes = record.get("notes") or {}
+            for column in range(12):
+                text = describe(int(temperature[i, column]), int(rainfall[i, column]))
+                note = notes.get(str(column + 1))
+                if note:
+                    text = f"{text}, {note}"
+                description[i, column] = vocabulary.setdefault(text, len(vocabulary))
+            if record is not default:
+                for month, items in (record.get("events") or {}).items():
+                    events[(i, int(month))] = tuple(items)
+
+        return cls(names, temperature, rainfall, description, list(vocabulary), events, aliases)
+
+    @classmethod
+    def load(cls, path: Path, catalog: Optional[DestinationCatalog] = None) -> "ClimateStore":
+        """
+        JSON 파일에서 로드
+
+        ``{"default": {...}, "destinations": [{"name", "temperature", "rainfall", "notes", "events"}]}``
+        형식이며 ``temperature``/``rainfall`` 은 1-12월 순서의 길이 12 리스트, 강수량은
+        ``RAINFALL_LEVELS`` 인덱스(0-2)입니다.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls.from_records(data["destinations"], data["default"], catalog)
+
+
+def _month_column(month: int) -> int:
+    if not 1 <= month <= 12:
+        raise ValueError(f"월은 1-12 사이여야 합니다: {month}")
+    return month - 1
+
+
+def _twelve(values: Sequence[int], field: str) -> List[int]:
+    if len(values) != 12:
+        raise ValueError(f"{field} 는 12개월 값이 필요합니다 (받은 값: {len(values)}개)")
+    return list(values)
+
+
+# ClimateStore 인스턴스 (싱글톤)
+_store: Optional[ClimateStore] = None
+
+
+def get_climate_store() -> ClimateStore:
+    """
+    ClimateStore 인스턴스 반환 (최초 호출 시 한 번만 로드)
+
+    ``CLIMATE_DATA_PATH`` 가 설정되어 있으면 해당 파일을, 아니면 내장 데이터를 사용합니다.
+    """
+    global _store
+    if _store is None:
+        path = settings.CLIMATE_DATA_PATH or DEFAULT_DATA_PATH
+        _store = ClimateStore.load(path, get_catalog())
+    return _store
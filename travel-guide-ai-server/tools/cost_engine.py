@@ -0,0 +1,215 @@
+"""
+벡터화된 여행 비용 계산
+
+여행지 × 여행 일수 × 인원 조합 전체의 비용 breakdown(항공, 숙박, 식비, 교통, 액티비티, 기타)을
+NumPy 배열로 한 번에 계산합니다. 계산식은 ``tools.price_tool`` 의 Tool 함수와 같으며
+(정수 절사 포함), 항공료 변동성은 시드를 고정할 수 있는 난수 생성기로 적용합니다.
+
+사용 예:
+    engine = CostEngine.from_catalog(seed=42)
+    matrix = engine.cost_matrix(days=range(3, 15), people=[1, 2, 3, 4])
+    top = matrix.rank(budget=2_000_000, top_n=5)  # (5, 일수, 인원) 여행지 인덱스
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from config.settings import settings
+from tools.catalog import Destination, DestinationCatalog, get_catalog
+from tools.price_tool import (
+    ACTIVITY_COST_PER_DAY,
+    DEFAULT_ACCOMMODATION_PRICE,
+    DEFAULT_FLIGHT_PRICE,
+    FLIGHT_JITTER,
+    LARGE_PARTY_SIZE,
+    LARGE_PARTY_SURCHARGE,
+    MEAL_COST_PER_DAY,
+    MISC_COST_PER_DAY,
+    TRANSPORT_COST_PER_DAY,
+)
+
+
+@dataclass
+class CostMatrix:
+    """
+    비용 계산 결과
+
+    모든 배열은 (여행지, 일수, 인원) 형태의 int64 배열입니다.
+    """
+
+    names: List[str]
+    days: np.ndarray
+    people: np.ndarray
+    components: Dict[str, np.ndarray]
+    total: np.ndarray
+    per_person: np.ndarray
+
+    @property
+    def shape(self) -> tuple:
+        return self.total.shape
+
+    def within_budget(self, budget) -> np.ndarray:
+        """
+        1인 비용이 예산 이하인 조합 (bool 배열)
+
+        Args:
+            budget: 1인 예산 (스칼라 또는 (일수, 인원)에 브로드캐스트되는 배열)
+        """
+        return self.per_person <= np.asarray(budget)
+
+    def rank(self, budget=None, top_n: int = 5) -> np.ndarray:
+        """
+        조합(일수, 인원)별 상위 여행지 인덱스
+
+        - 예산이 있으면 예산 이하인 여행지만, 예산에 가까운(남는 금액이 적은) 순
+        - 예산이 없으면 1인 비용 오름차순
+
+        같은 점수는 카탈로그 순서를 유지합니다(stable). 조건에 맞는 여행지가 ``top_n`` 보다 적으면
+        나머지 자리는 -1입니다.
+
+        Returns:
+            (top_n, 일수, 인원) 형태의 여행지 인덱스 배열
+        """
+        if budget is None:
+            score = self.per_person.astype(np.float64)
+        else:
+            remaining = np.asarray(budget) - self.per_person
+            score = np.where(remaining >= 0, remaining, np.inf).astype(np.float64)
+
+        order = np.argsort(score, axis=0, kind="stable")[:top_n]
+        valid = np.isfinite(np.take_along_axis(score, order, axis=0))
+        return np.where(valid, order, -1)
+
+    def breakdown(self, dest: int, day: int = 0, party: int = 0) -> Dict:
+        """
+        조합 하나의 breakdown (``calculate_total_budget`` 과 같은 형식)
+
+        Args:
+            dest: 여행지 인덱스
+            day: 일수 인덱스
+            party: 인원 인덱스
+        """
+        index = (dest, day, party)
+        return {
+            "breakdown": {name: int(values[index]) for name, values in self.components.items()},
+            "total": int(self.total[index]),
+            "perPerson": int(self.per_person[index]),
+            "currency": "KRW"
+        }
+
+
+class CostEngine:
+    """
+    여행지별 기본 가격을 배열로 들고 있는 비용 계산기
+
+    카탈로그가 바뀌지 않는 한 한 번 만들어 재사용합니다.
+    """
+
+    def __init__(self, destinations: Sequence[Destination], seed: Optional[int] = None):
+        self.destinations = list(destinations)
+        self.names = [dest.name for dest in self.destinations]
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self.flight_base = np.array(
+            [dest.flightPrice or DEFAULT_FLIGHT_PRICE for dest in self.destinations], dtype=np.int64
+        )
+        self.accommodation_base = np.array(
+            [dest.accommodationPerNight or DEFAULT_ACCOMMODATION_PRICE for dest in self.destinations], dtype=np.int64
+        )
+        self.styles = np.array([dest.style for dest in self.destinations])
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_catalog(cls, catalog: Optional[DestinationCatalog] = None, seed: Optional[int] = None) -> "CostEngine":
+        """카탈로그 전체로 생성 (기본: get_catalog())"""
+        return cls(list(catalog or get_catalog()), seed=seed)
+
+    def indices(self, names: Optional[Sequence[str]] = None, style: Optional[str] = None) -> np.ndarray:
+        """이름 목록 또는 스타일로 여행지 인덱스 선택 (둘 다 없으면 전체)"""
+        if names is not None:
+            return np.array([self._index[name] for name in names], dtype=np.intp)
+        if style is not None:
+            return np.flatnonzero(self.styles == style.lower())
+        return np.arange(len(self.names))
+
+    def flight_prices(self, indices: Optional[np.ndarray] = None, jitter: bool = False) -> np.ndarray:
+        """
+        1인 항공료
+
+        ``jitter`` 면 여행지마다 ±10% 변동을 한 번씩 뽑습니다. (같은 시드면 같은 결과)
+        """
+        base = self.flight_base if indices is None else self.flight_base[indices]
+        if not jitter:
+            return base
+        factor = self.rng.uniform(1 - FLIGHT_JITTER, 1 + FLIGHT_JITTER, size=base.shape)
+        return np.floor(base * factor).astype(np.int64)
+
+    def cost_matrix(
+        self,
+        days: Sequence[int],
+        people: Sequence[int],
+        indices: Optional[np.ndarray] = None,
+        jitter: bool = False
+    ) -> CostMatrix:
+        """
+        여행지 × 일수 × 인원 전체 비용을 한 번에 계산
+
+        Args:
+            days: 여행 일수 목록 (숙박 일수와 같게 계산)
+            people: 인원 목록
+            indices: 계산할 여행지 인덱스 (기본: 전체)
+            jitter: 항공료 변동성 적용 여부
+
+        Returns:
+            CostMatrix
+        """
+        indices = np.arange(len(self.names)) if indices is None else np.asarray(indices, dtype=np.intp)
+        days_arr = np.asarray(list(days), dtype=np.int64)
+        people_arr = np.asarray(list(people), dtype=np.int64)
+
+        d = days_arr[None, :, None]  # (1, T, 1)
+        p = people_arr[None, None, :]  # (1, 1, P)
+
+        flight = self.flight_prices(indices, jitter)[:, None, None] * p  # (D, 1, P)
+        base_night = self.accommodation_base[indices][:, None, None]
+        surcharged = np.floor(base_night * LARGE_PARTY_SURCHARGE).astype(np.int64)
+        per_night = np.where(p > LARGE_PARTY_SIZE, surcharged, base_night)
+        accommodation = per_night * d  # (D, T, P)
+
+        shape = (len(indices), len(days_arr), len(people_arr))
+        person_days = d * p  # (1, T, P)
+        components = {
+            "flight": np.broadcast_to(flight, shape),
+            "accommodation": np.broadcast_to(accommodation, shape),
+            "meals": np.broadcast_to(MEAL_COST_PER_DAY * person_days, shape),
+            "transport": np.broadcast_to(TRANSPORT_COST_PER_DAY * person_days, shape),
+            "activities": np.broadcast_to(ACTIVITY_COST_PER_DAY * person_days, shape),
+            "miscellaneous": np.broadcast_to(MISC_COST_PER_DAY * person_days, shape),
+        }
+        total = sum(components.values())
+
+        return CostMatrix(
+            names=[self.names[i] for i in indices],
+            days=days_arr,
+            people=people_arr,
+            components=components,
+            total=total,
+            per_person=total // p
+        )
+
+
+# CostEngine 인스턴스 (싱글톤)
+_engine: Optional[CostEngine] = None
+
+
+def get_cost_engine() -> CostEngine:
+    """
+    카탈로그 전체에 대한 CostEngine 반환 (최초 호출 시 한 번만 생성)
+
+    항공료 변동성 시드는 ``PRICE_RANDOM_SEED`` 를 따릅니다.
+    """
+    global _engine
+    if _engine is None:
+        _engine = CostEngine.from_catalog(seed=settings.PRICE_RANDOM_SEED)
+    return _engine
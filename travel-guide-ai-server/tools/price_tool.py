@@ -5,11 +5,108 @@
 """
 
 from langchain.tools import tool
-from typing import Dict
+from typing import Dict, Optional
 import random
 
+from config.settings import settings
+from tools.catalog import get_catalog
+from utils.metrics import timed
+
+
+# 카탈로그에 가격 정보가 없는 여행지의 기본값 (Mock, 실제로는 API 호출)
+DEFAULT_FLIGHT_PRICE = 500000
+DEFAULT_ACCOMMODATION_PRICE = 100000
+
+# 1인 1일 평균 현지 비용
+MEAL_COST_PER_DAY = 50000
+TRANSPORT_COST_PER_DAY = 30000
+ACTIVITY_COST_PER_DAY = 100000
+MISC_COST_PER_DAY = 50000
+
+# 항공료 변동 폭 (기본가의 ±10%)
+FLIGHT_JITTER = 0.1
+
+# 숙박 할증 (LARGE_PARTY_SIZE명을 넘으면 1박 요금에 곱함)
+LARGE_PARTY_SIZE = 2
+LARGE_PARTY_SURCHARGE = 1.3
+
+# 항공료 변동성 난수 생성기 (PRICE_RANDOM_SEED를 지정하면 결과 재현 가능)
+_rng = random.Random(settings.PRICE_RANDOM_SEED)
+
+
+def seed_prices(seed: Optional[int]) -> None:
+    """항공료 변동성 난수 생성기 시드 재설정"""
+    _rng.seed(seed)
+
+
+def flight_price_per_person(destination: str, jitter: bool = True) -> int:
+    """
+    1인 항공료 (기본가에 ±10% 변동성 적용)
+    
+    Args:
+        destination: 목적지
+        jitter: False면 변동성 없이 기본가를 반환
+    """
+    dest = get_catalog().get(destination)
+    price = dest.flightPrice if dest and dest.flightPrice else DEFAULT_FLIGHT_PRICE
+    if jitter:
+        price = int(price * _rng.uniform(1 - FLIGHT_JITTER, 1 + FLIGHT_JITTER))
+    return price
+
+
+def accommodation_price_per_night(destination: str, people: int) -> int:
+    """1박 숙박비 (2인 기준, 3인 이상은 30% 할증)"""
+    dest = get_catalog().get(destination)
+    if dest and dest.accommodationPerNight:
+        price_per_night = dest.accommodationPerNight
+    else:
+        price_per_night = DEFAULT_ACCOMMODATION_PRICE
+    if people > LARGE_PARTY_SIZE:
+        price_per_night = int(price_per_night * LARGE_PARTY_SURCHARGE)
+    return price_per_night
+
+
+def budget_breakdown(flight_cost: int, accommodation_cost: int, days: int, people: int) -> Dict:
+    """
+    총 여행 예산 breakdown 계산 (calculate_total_budget Tool과 같은 결과)
+    
+    Args:
+        flight_cost: 항공료
+        accommodation_cost: 숙박비
+        days: 여행 일수
+        people: 인원
+    """
+    # 식비 (1인 1일 평균)
+    total_meal_cost = MEAL_COST_PER_DAY * days * people
+    
+    # 교통비 (현지)
+    transport_cost = TRANSPORT_COST_PER_DAY * days * people
+    
+    # 관광/액티비티
+    activity_cost = ACTIVITY_COST_PER_DAY * days * people
+    
+    # 기타 (쇼핑, 팁 등)
+    misc_cost = MISC_COST_PER_DAY * days * people
+    
+    total = flight_cost + accommodation_cost + total_meal_cost + transport_cost + activity_cost + misc_cost
+    
+    return {
+        "breakdown": {
+            "flight": flight_cost,
+            "accommodation": accommodation_cost,
+            "meals": total_meal_cost,
+            "transport": transport_cost,
+            "activities": activity_cost,
+            "miscellaneous": misc_cost
+        },
+        "total": total,
+        "perPerson": total // people,
+        "currency": "KRW"
+    }
+
 
 @tool
+@timed("tool.get_flight_price")
 def get_flight_price(destination: str, departure: str = "서울", people: int = 2) -> Dict:
     """
     항공료를 조회합니다.
@@ -22,19 +119,7 @@ def get_flight_price(destination: str, departure: str = "서울", people: int =
     Returns:
         항공료 정보 (1인당 가격, 총 가격)
     """
-    # Mock 데이터 (실제로는 API 호출)
-    base_prices = {
-        "다낭": 350000,
-        "발리": 450000,
-        "교토": 400000,
-        "제주도": 150000,
-        "파리": 1200000,
-        "뉴욕": 1500000,
-    }
-    
-    price_per_person = base_prices.get(destination, 500000)
-    # 약간의 변동성 추가
-    price_per_person = int(price_per_person * random.uniform(0.9, 1.1))
+    price_per_person = flight_price_per_person(destination)
     
     return {
         "destination": destination,
@@ -47,6 +132,7 @@ def get_flight_price(destination: str, departure: str = "서울", people: int =
 
 
 @tool
+@timed("tool.get_accommodation_price")
 def get_accommodation_price(destination: str, nights: int, people: int = 2) -> Dict:
     """
     숙박비를 조회합니다.
@@ -59,20 +145,7 @@ def get_accommodation_price(destination: str, nights: int, people: int = 2) -> D
     Returns:
         숙박비 정보 (1박당 가격, 총 가격)
     """
-    # Mock 데이터
-    base_prices_per_night = {
-        "다낭": 100000,
-        "발리": 120000,
-        "교토": 150000,
-        "제주도": 80000,
-        "파리": 200000,
-        "뉴욕": 250000,
-    }
-    
-    price_per_night = base_prices_per_night.get(destination, 100000)
-    # 인원에 따른 가격 조정 (2인 기준)
-    if people > 2:
-        price_per_night = int(price_per_night * 1.3)
+    price_per_night = accommodation_price_per_night(destination, people)
     
     return {
         "destination": destination,
@@ -85,6 +158,7 @@ def get_accommodation_price(destination: str, nights: int, people: int = 2) -> D
 
 
 @tool
+@timed("tool.calculate_total_budget")
 def calculate_total_budget(flight_cost: int, accommodation_cost: int, days: int, people: int) -> Dict:
     """
     총 여행 예산을 계산합니다.
@@ -98,31 +172,4 @@ def calculate_total_budget(flight_cost: int, accommodation_cost: int, days: int,
     Returns:
         총 예산 breakdown
     """
-    # 식비 (1인 1일 평균)
-    meal_cost_per_day = 50000
-    total_meal_cost = meal_cost_per_day * days * people
-    
-    # 교통비 (현지)
-    transport_cost = 30000 * days * people
-    
-    # 관광/액티비티
-    activity_cost = 100000 * days * people
-    
-    # 기타 (쇼핑, 팁 등)
-    misc_cost = 50000 * days * people
-    
-    total = flight_cost + accommodation_cost + total_meal_cost + transport_cost + activity_cost + misc_cost
-    
-    return {
-        "breakdown": {
-            "flight": flight_cost,
-            "accommodation": accommodation_cost,
-            "meals": total_meal_cost,
-            "transport": transport_cost,
-            "activities": activity_cost,
-            "miscellaneous": misc_cost
-        },
-        "total": total,
-        "perPerson": total // people,
-        "currency": "KRW"
-    }
+    return budget_breakdown(flight_cost, accommodation_cost, days, people)
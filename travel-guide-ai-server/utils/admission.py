@@ -0,0 +1,203 @@
+"""
+요청 수락 제어 (admission control)
+
+Agent를 동시에 실행하는 요청 수를 제한하고, 나머지는 우선순위별 대기열에서 기다리게 합니다.
+대기열이 가득 차거나 최대 대기 시간을 넘기면 바로 거절(``AdmissionRejected``, API는 429 + Retry-After)해서
+LLM 지연이 길어져도 요청이 이벤트 루프에 무한정 쌓이지 않게 합니다.
+
+- 우선순위: high → normal → low 순서로 슬롯을 배정 (같은 우선순위는 도착 순)
+- 대기열이 가득 찼을 때 더 높은 우선순위 요청이 오면 가장 낮은 우선순위의 마지막 대기자를 밀어냄
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from utils.metrics import metrics, span
+from utils.outbound import DeadlineExceeded, deadline_remaining
+
+PRIORITIES = ("high", "normal", "low")
+
+# 처리 시간 이동 평균 가중치 (Retry-After 추정용)
+SERVICE_TIME_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """수락 거절 (대기열 가득 참, 대기 시간 초과, 더 높은 우선순위에 밀려남)"""
+
+    def __init__(self, reason: str, retry_after: float):
+        messages = {
+            "queue_full": "요청이 많아 대기열이 가득 찼습니다.",
+            "queue_timeout": "대기 시간이 초과되었습니다.",
+            "evicted": "우선순위가 높은 요청에 밀려 대기열에서 제외되었습니다.",
+        }
+        super().__init__(f"{messages.get(reason, reason)} {retry_after:.0f}초 후 다시 시도해주세요.")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    동시 실행 슬롯 + 우선순위 대기열
+
+    사용 예:
+        async with admission.admit("high"):
+            result = await agent.run(payload)
+    """
+
+    def __init__(self, max_concurrency: int = 16, max_queue: int = 64, max_queue_time: float = 10.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.max_queue_time = max_queue_time
+        self._active = 0
+        self._queues: Dict[str, Deque[asyncio.Future]] = {priority: deque() for priority in PRIORITIES}
+        self._service_time = 1.0  # 슬롯 점유 시간 이동 평균 (초)
+        self.admitted = {priority: 0 for priority in PRIORITIES}
+        self.rejected = {priority: 0 for priority in PRIORITIES}
+
+    @staticmethod
+    def normalize_priority(priority: Optional[str], default: str = "normal") -> str:
+        """알 수 없는 값은 ``default`` 로"""
+        priority = (priority or "").strip().lower()
+        return priority if priority in PRIORITIES else default
+
+    @property
+    def in_flight(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def retry_after(self) -> float:
+        """대기열이 비워질 때까지의 추정 시간 (초, 최소 1초)"""
+        backlog = self.queued + 1
+        return float(max(1, math.ceil(self._service_time * backlog / self.max_concurrency)))
+
+    @asynccontextmanager
+    async def admit(self, priority: str = "normal") -> AsyncIterator[None]:
+        """
+        슬롯을 얻을 때까지 (최대 ``max_queue_time``) 기다린 뒤 구간을 실행
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 대기 시간 초과
+            DeadlineExceeded: 대기 중 요청 마감 시간 초과
+        """
+        priority = self.normalize_priority(priority)
+        with span("admission_wait"):
+            await self._acquire(priority)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._service_time += SERVICE_TIME_ALPHA * (elapsed - self._service_time)
+            self._release()
+
+    async def _acquire(self, priority: str) -> None:
+        if self._active < self.max_concurrency and not self.queued:
+            self._active += 1
+            self._admit(priority, 0.0)
+            return
+
+        if self.queued >= self.max_queue and not self._evict_lower(priority):
+            self._reject(priority, "queue_full")
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues[priority]
+        queue.append(future)
+
+        timeout, deadline_bound = self.max_queue_time, False
+        remaining = deadline_remaining()
+        if remaining is not None and remaining < timeout:
+            timeout, deadline_bound = max(0.0, remaining), True
+
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # 시간 초과와 동시에 슬롯을 받은 경우
+                self._admit(priority, time.perf_counter() - start)
+                return
+            self._discard(queue, future)
+            if deadline_bound:
+                raise DeadlineExceeded("대기열에서 요청 마감 시간이 지났습니다.") from None
+            self._reject(priority, "queue_timeout")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # 슬롯을 받은 직후 취소됨: 다음 대기자에게 넘김
+                self._release()
+            else:
+                self._discard(queue, future)
+            raise
+        except AdmissionRejected as e:
+            self.rejected[priority] += 1
+            metrics.inc("admission_rejected_total", priority=priority, reason=e.reason)
+            raise
+        self._admit(priority, time.perf_counter() - start)
+
+    def _admit(self, priority: str, waited: float) -> None:
+        self.admitted[priority] += 1
+        metrics.inc("admission_admitted_total", priority=priority)
+        metrics.observe("admission_wait_seconds", waited, priority=priority)
+
+    def _reject(self, priority: str, reason: str) -> None:
+        self.rejected[priority] += 1
+        metrics.inc("admission_rejected_total", priority=priority, reason=reason)
+        raise AdmissionRejected(reason, self.retry_after())
+
+    def _evict_lower(self, priority: str) -> bool:
+        """``priority`` 보다 낮은 우선순위의 마지막 대기자 하나를 대기열에서 제외"""
+        rank = PRIORITIES.index(priority)
+        for lower in reversed(PRIORITIES[rank + 1:]):
+            queue = self._queues[lower]
+            if queue:
+                future = queue.pop()
+                if not future.done():
+                    future.set_exception(AdmissionRejected("evicted", self.retry_after()))
+                return True
+        return False
+
+    def _release(self) -> None:
+        """슬롯 반납 (대기자가 있으면 가장 높은 우선순위에게 바로 넘김)"""
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self._active -= 1
+
+    @staticmethod
+    def _discard(queue: Deque[asyncio.Future], future: asyncio.Future) -> None:
+        try:
+            queue.remove(future)
+        except ValueError:
+            pass
+        if not future.done():
+            future.cancel()
+
+    def queue_depths(self) -> Dict[str, int]:
+        return {priority: len(queue) for priority, queue in self._queues.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "inFlight": self._active,
+            "maxConcurrency": self.max_concurrency,
+            "queued": self.queue_depths(),
+            "maxQueue": self.max_queue,
+            "admitted": dict(self.admitted),
+            "rejected": dict(self.rejected),
+            "avgServiceSeconds": round(self._service_time, 3),
+        }
+
+    def collect_metrics(self) -> Any:
+        """/metrics 수집기 (현재 실행/대기 수)"""
+        yield ("admission_in_flight", "gauge", {}, self._active)
+        for priority, depth in self.queue_depths().items():
+            yield ("admission_queue_depth", "gauge", {"priority": priority}, depth)
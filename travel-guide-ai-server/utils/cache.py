@@ -0,0 +1,248 @@
+"""
+추천 결과 캐시
+
+정규화된 여행 선호도를 키로 추천 결과를 저장합니다.
+백엔드는 프로세스 내부 메모리(TTL + LRU) 또는 Redis 호환 클라이언트 중에서 선택합니다.
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.helpers import fits_budget, preferences_key
+
+
+class CacheBackend(ABC):
+    """캐시 저장소 인터페이스"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """키에 해당하는 값을 반환합니다. 없거나 만료되었으면 None."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """값을 ``ttl`` 초 동안 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """키를 삭제합니다."""
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    프로세스 내부 메모리 캐시
+
+    항목마다 만료 시각을 두고(TTL), 최대 개수를 넘으면
+    가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    """
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 호환 클라이언트 기반 캐시
+
+    ``get``/``set(ex=)``/``delete`` 를 지원하는 비동기 클라이언트면 무엇이든 사용할 수 있습니다.
+    (redis.asyncio.Redis, FakeRedis 등) LRU 제거는 Redis의
+    ``maxmemory-policy allkeys-lru`` 설정에 맡깁니다.
+    """
+
+    def __init__(self, client: Any, namespace: str = "travel-guide"):
+        self.client = client
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(self._key(key))
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self.client.set(self._key(key), value, ex=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self._key(key))
+
+
+class FakeRedis:
+    """
+    로컬 개발/테스트용 Redis 대체 클라이언트
+
+    redis.asyncio 클라이언트의 일부 명령(get, set, delete, incrby, expire)만 흉내 냅니다.
+    프로세스 안에만 있으므로 여러 워커가 상태를 공유하지는 않습니다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._data: Dict[str, Tuple[Optional[float], str]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        if nx and await self.get(key) is not None:
+            return None
+        expires_at = self._clock() + ex if ex else None
+        self._data[key] = (expires_at, value)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    async def incrby(self, key: str, amount: int = 1) -> int:
+        current = await self.get(key)
+        expires_at = self._data[key][0] if current is not None else None
+        value = int(current or 0) + amount
+        self._data[key] = (expires_at, str(value))
+        return value
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        if await self.get(key) is None:
+            return False
+        self._data[key] = (self._clock() + seconds, self._data[key][1])
+        return True
+
+
+class RecommendationCache:
+    """
+    여행지 추천 결과 캐시
+
+    예산은 구간으로, 날짜는 출발 월과 여행 일수로 줄인 정규화 키를 사용하므로
+    거의 같은 요청끼리 결과를 공유합니다. 같은 구간이라도 요청한 예산을 넘는 여행지가 있는
+    결과는 돌려주지 않습니다(miss).
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int = 3600, budget_bucket: int = 500000):
+        self.backend = backend
+        self.ttl = ttl
+        self.budget_bucket = budget_bucket
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def key_for(self, preferences: Dict[str, Any]) -> str:
+        """선호도에 대한 캐시 키"""
+        return preferences_key(preferences, self.budget_bucket)
+
+    async def get(self, preferences: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 추천 결과 조회
+
+        Args:
+            preferences: PreferencesRequest 딕셔너리
+
+        Returns:
+            캐시된 결과 (없거나 요청 예산을 넘는 여행지가 있으면 None)
+        """
+        key = self.key_for(preferences)
+        try:
+            raw = await self.backend.get(key)
+        except Exception as e:
+            # 캐시 장애가 추천 자체를 막지 않도록 miss로 처리합니다.
+            print(f"캐시 조회 오류: {e}")
+            self.errors += 1
+            raw = None
+
+        result = self._load(raw, preferences)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return result
+
+    async def peek(self, preferences: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """hit/miss 통계에 넣지 않는 조회 (워커 간 요청 병합의 결과 확인용)"""
+        try:
+            raw = await self.backend.get(self.key_for(preferences))
+        except Exception:
+            return None
+        return self._load(raw, preferences)
+
+    @staticmethod
+    def _load(raw: Optional[str], preferences: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """저장본을 읽되, 같은 예산 구간의 더 높은 예산으로 만든 결과면 None"""
+        if raw is None:
+            return None
+        result = json.loads(raw)
+        if not fits_budget(result.get("destinations", []), preferences):
+            return None
+        return result
+
+    async def set(self, preferences: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """
+        추천 결과 저장
+
+        Args:
+            preferences: PreferencesRequest 딕셔너리
+            result: 저장할 결과 (JSON 직렬화 가능해야 함)
+        """
+        key = self.key_for(preferences)
+        try:
+            await self.backend.set(key, json.dumps(result, ensure_ascii=False), self.ttl)
+        except Exception as e:
+            print(f"캐시 저장 오류: {e}")
+            self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """hit/miss 통계"""
+        lookups = self.hits + self.misses
+        stats = {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hitRate": self.hits / lookups if lookups else 0.0,
+        }
+        if isinstance(self.backend, InMemoryCacheBackend):
+            stats["size"] = len(self.backend)
+            stats["evictions"] = self.backend.evictions
+        return stats
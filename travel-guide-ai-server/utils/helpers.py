@@ -0,0 +1,113 @@
+"""
+유틸리티 함수
+
+요청 정규화 등 여러 모듈에서 함께 쓰는 헬퍼를 모아둡니다.
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+def normalize_custom_request(text: Optional[str]) -> str:
+    """
+    추가 요청사항 정규화
+    
+    공백을 하나로 합치고 대소문자를 통일(casefold)합니다.
+    """
+    if not text:
+        return ""
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+def normalize_preferences(preferences: Dict[str, Any], budget_bucket: int) -> Dict[str, Any]:
+    """
+    여행 선호도를 캐시/중복 제거용 정규형으로 변환합니다.
+    
+    - 예산: ``budget_bucket`` 단위 구간 번호 (미정이면 "undecided")
+    - 날짜: 출발 월과 여행 일수
+    - 추가 요청사항: 공백/대소문자 정규화
+    - 결과 개수: 추천 여행지 수, 여행지당 팁 수 (기본값 5, 3)
+    
+    Args:
+        preferences: PreferencesRequest 딕셔너리
+        budget_bucket: 예산 구간 크기 (원)
+    
+    Returns:
+        정규화된 딕셔너리
+    
+    Raises:
+        ValueError: 날짜 형식이 잘못된 경우
+    """
+    start_date = datetime.strptime(preferences["startDate"], "%Y-%m-%d")
+    end_date = datetime.strptime(preferences["endDate"], "%Y-%m-%d")
+    
+    budget = preferences.get("budget")
+    if preferences.get("isBudgetUndecided") or budget is None:
+        budget_key: Any = "undecided"
+    else:
+        budget_key = budget // max(budget_bucket, 1)
+    
+    return {
+        "month": start_date.month,
+        "days": (end_date - start_date).days,
+        "budget": budget_key,
+        "people": preferences["numberOfPeople"],
+        "style": preferences["travelStyle"].strip().lower(),
+        "companion": preferences["companion"].strip().casefold(),
+        "custom": normalize_custom_request(preferences.get("customRequest")),
+        "topK": preferences.get("topK") or 5,
+        "tips": 3 if preferences.get("maxTipsPerDestination") is None else preferences["maxTipsPerDestination"],
+    }
+
+
+def fits_budget(destinations: List[Dict[str, Any]], preferences: Dict[str, Any]) -> bool:
+    """
+    여행지가 모두 요청한 1인 예산 안에 드는지 확인합니다.
+    
+    캐시 키와 요청 병합 키는 예산을 구간으로 줄이므로, 같은 구간의 더 높은 예산으로 만든 결과가
+    낮은 예산의 요청에 돌아갈 수 있습니다. 그런 결과는 공유하지 않고 새로 생성해야 합니다.
+    
+    Args:
+        destinations: 검증된 여행지 딕셔너리 리스트
+        preferences: PreferencesRequest 딕셔너리
+    
+    Returns:
+        예산 미정이거나 모든 여행지의 1인 비용(estimatedCost / numberOfPeople)이 예산 이하이면 True
+    """
+    budget = preferences.get("budget")
+    if preferences.get("isBudgetUndecided") or budget is None:
+        return True
+    people = max(preferences.get("numberOfPeople") or 1, 1)
+    return all(destination.get("estimatedCost", 0) / people <= budget for destination in destinations)
+
+
+def preferences_key(preferences: Dict[str, Any], budget_bucket: int, prefix: str = "rec") -> str:
+    """
+    정규화된 선호도로부터 안정적인 키를 생성합니다.
+    
+    Args:
+        preferences: PreferencesRequest 딕셔너리
+        budget_bucket: 예산 구간 크기 (원)
+        prefix: 키 접두사
+    
+    Returns:
+        ``{prefix}:{sha256}`` 형식의 키
+    """
+    normalized = normalize_preferences(preferences, budget_bucket)
+    payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수를 대략 추정합니다.
+    
+    토크나이저 없이 쓰기 위한 근사치로, 영문/기호는 4자당 1토큰,
+    한글 등 비 ASCII 문자는 1자당 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars)
@@ -0,0 +1,260 @@
+"""
+비동기 추천 작업 (job)
+
+연결이 불안정한 클라이언트를 위해 추천 생성을 요청/응답에서 분리합니다.
+``submit`` 은 작업 ID만 바로 돌려주고, 고정 개수의 백그라운드 작업자가 제한된 대기열에서 작업을 꺼내 실행합니다.
+작업 상태와 결과는 공유 상태에 TTL로 저장되므로 Redis 백엔드를 쓰면 어느 워커에서든 조회할 수 있습니다.
+
+- 상태: queued → running → succeeded | failed
+- 대기열은 우선순위(high → normal → low, 같은 우선순위는 등록 순) 순서로 실행
+- 대기열이 가득 차면 ``JobQueueFull`` (API는 429 + Retry-After)
+- 종료 시 ``drain``: 새 작업은 받지 않고(``JobQueueClosed``), 대기/실행 중인 작업을 제한 시간까지 마저 처리
+"""
+
+import asyncio
+import contextvars
+import json
+import math
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.admission import PRIORITIES
+from utils.metrics import metrics
+from utils.responses import dumps_str
+from utils.shared_state import SharedState
+
+# 처리 시간 이동 평균 가중치 (Retry-After 추정용)
+SERVICE_TIME_ALPHA = 0.2
+
+Runner = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class JobQueueFull(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"처리 대기 중인 작업이 많습니다. {retry_after:.0f}초 후 다시 시도해주세요.")
+        self.retry_after = retry_after
+
+
+class JobQueueClosed(Exception):
+    """서버 종료 중이라 새 작업을 받지 않음"""
+
+    def __init__(self):
+        super().__init__("서버가 종료 중이라 새 작업을 받을 수 없습니다.")
+
+
+class JobStore:
+    """
+    작업 상태/결과 저장소 (공유 상태 위의 ``job:{id}`` 키, TTL 만료)
+
+    프로세스 내부 저장소를 쓸 때는 캐시와 다른 인스턴스를 넘겨야 캐시 항목에 밀려 지워지지 않습니다.
+    """
+
+    def __init__(self, state: SharedState, ttl: int = 3600):
+        self.state = state
+        self.ttl = ttl
+        self.errors = 0
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    async def save(self, job: Dict[str, Any]) -> None:
+        try:
+            await self.state.set(self._key(job["jobId"]), dumps_str(job), self.ttl)
+        except Exception as e:
+            # 저장 실패는 작업 실행을 막지 않음 (조회 시 이전 상태 또는 404)
+            print(f"작업 상태 저장 오류: {e}")
+            self.errors += 1
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.state.get(self._key(job_id))
+        return json.loads(raw) if raw is not None else None
+
+
+class JobQueue:
+    """
+    고정 개수 작업자 + 제한된 대기열
+
+    사용 예:
+        jobs = JobQueue(store, runner, workers=4, max_queue=100)
+        job = await jobs.submit(payload, "normal")   # {"jobId": ..., "status": "queued", ...}
+        ...
+        await jobs.drain(timeout=30)                 # 종료 시
+    """
+
+    def __init__(self, store: JobStore, runner: Runner, workers: int = 4, max_queue: int = 100):
+        self.store = store
+        self.runner = runner
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._sequence = 0  # 같은 우선순위 안에서 등록 순서 유지
+        self._tasks: List[asyncio.Task] = []
+        self._running: Dict[str, Dict[str, Any]] = {}
+        self._closed = False
+        self._service_time = 1.0  # 작업 하나의 처리 시간 이동 평균 (초)
+        self.submitted = 0
+        self.rejected = 0
+        self.finished = {"succeeded": 0, "failed": 0}
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    def start(self) -> None:
+        """작업자 시작 (이미 시작했으면 무시)"""
+        if self._tasks:
+            return
+        self._queue = asyncio.PriorityQueue(maxsize=self.max_queue)
+        for index in range(self.workers):
+            # 요청 처리 중에 시작되더라도 그 요청의 마감 시간/계측 컨텍스트를 물려받지 않도록 빈 컨텍스트에서 생성
+            task = contextvars.Context().run(asyncio.create_task, self._worker())
+            task.set_name(f"job-worker-{index}")
+            self._tasks.append(task)
+
+    def retry_after(self) -> float:
+        """대기열이 비워질 때까지의 추정 시간 (초, 최소 1초)"""
+        backlog = self.queued + self.running + 1
+        return float(max(1, math.ceil(self._service_time * backlog / self.workers)))
+
+    async def submit(self, payload: Dict[str, Any], priority: str = "normal") -> Dict[str, Any]:
+        """
+        작업 등록
+
+        Returns:
+            작업 상태 (queued)
+
+        Raises:
+            JobQueueClosed: 종료 중
+            JobQueueFull: 대기열이 가득 참
+        """
+        if self._closed:
+            raise JobQueueClosed()
+        self.start()
+        if self._queue.full():
+            self.rejected += 1
+            metrics.inc("jobs_rejected_total")
+            raise JobQueueFull(self.retry_after())
+
+        job = {
+            "jobId": uuid.uuid4().hex,
+            "status": "queued",
+            "createdAt": _now(),
+            "startedAt": None,
+            "finishedAt": None,
+            "result": None,
+            "error": None,
+        }
+        await self.store.save(job)
+        self._sequence += 1
+        rank = PRIORITIES.index(priority) if priority in PRIORITIES else PRIORITIES.index("normal")
+        self._queue.put_nowait((rank, self._sequence, job, payload))
+        self.submitted += 1
+        metrics.inc("jobs_submitted_total", priority=priority)
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, job, payload = await self._queue.get()
+            try:
+                await self._run(job, payload)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        job = {**job, "status": "running", "startedAt": _now()}
+        self._running[job["jobId"]] = job
+        await self.store.save(job)
+        start = time.perf_counter()
+        try:
+            job["result"] = await self.runner(payload)
+            job["status"] = "succeeded"
+        except asyncio.CancelledError:
+            # drain 제한 시간이 지나 중단됨: 결과를 기다리는 클라이언트가 알 수 있게 실패로 기록
+            await self._finish(job, "failed", "서버 종료로 작업이 중단되었습니다.")
+            raise
+        except Exception as e:
+            job["status"], job["error"] = "failed", str(e) or e.__class__.__name__
+        finally:
+            self._running.pop(job["jobId"], None)
+            elapsed = time.perf_counter() - start
+            self._service_time += SERVICE_TIME_ALPHA * (elapsed - self._service_time)
+            metrics.observe("job_run_seconds", elapsed)
+        await self._finish(job, job["status"], job["error"])
+
+    async def _finish(self, job: Dict[str, Any], status: str, error: Optional[str]) -> None:
+        job.update(status=status, error=error, finishedAt=_now())
+        self.finished[status] += 1
+        metrics.inc("jobs_finished_total", status=status)
+        await self.store.save(job)
+
+    async def drain(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        새 작업을 막고 대기/실행 중인 작업을 ``timeout`` 초까지 마저 처리
+
+        시간 안에 끝나지 않은 작업은 실패(서버 종료)로 기록합니다.
+
+        Returns:
+            {"drained": 처리 완료 수, "abandoned": 중단된 수, "seconds": 소요 시간}
+        """
+        self._closed = True
+        start = time.perf_counter()
+        if not self._tasks:
+            return {"drained": 0, "abandoned": 0, "seconds": 0.0}
+
+        pending = self.queued + self.running
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        # 아직 시작하지 못한 작업은 꺼내서 실패로 기록
+        abandoned: List[Tuple[int, int, Dict[str, Any], Dict[str, Any]]] = []
+        while not self._queue.empty():
+            abandoned.append(self._queue.get_nowait())
+            self._queue.task_done()
+        abandoned_count = len(abandoned) + self.running
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for _, _, job, _ in abandoned:
+            await self._finish(dict(job), "failed", "서버 종료로 작업이 중단되었습니다.")
+
+        return {
+            "drained": pending - abandoned_count,
+            "abandoned": abandoned_count,
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "queued": self.queued,
+            "maxQueue": self.max_queue,
+            "running": self.running,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "finished": dict(self.finished),
+            "avgServiceSeconds": round(self._service_time, 3),
+            "closed": self._closed,
+        }
+
+    def collect_metrics(self) -> Any:
+        """/metrics 수집기 (현재 대기/실행 작업 수)"""
+        yield ("jobs_queued", "gauge", {}, self.queued)
+        yield ("jobs_running", "gauge", {}, self.running)
+        yield ("job_store_errors_total", "counter", {}, self.store.errors)
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
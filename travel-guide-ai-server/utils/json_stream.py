@@ -0,0 +1,99 @@
+"""
+증분 JSON 파서
+
+LLM이 토큰 단위로 내보내는 텍스트에서 배열 원소(객체)가 완성되는 즉시 꺼냅니다.
+``{"destinations": [ {...}, {...} ]}`` 형태와 최상위 배열 ``[ {...} ]`` 형태를 모두 지원하며,
+```json 코드 블록으로 감싼 응답도 처리합니다.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+
+class IncrementalArrayParser:
+    """
+    지정한 키의 배열에서 완성된 객체를 순서대로 반환하는 파서
+
+    사용 예:
+        parser = IncrementalArrayParser("destinations")
+        for chunk in chunks:
+            for obj in parser.feed(chunk):
+                ...
+    """
+
+    def __init__(self, array_key: str = "destinations"):
+        self.array_key = array_key
+        self._key_pattern = re.compile(r'"%s"\s*:\s*$' % re.escape(array_key))
+        self._text = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._array_depth: Optional[int] = None
+        self._object_start: Optional[int] = None
+        self.done = False
+        self.errors: List[str] = []
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        텍스트 조각을 추가하고 새로 완성된 객체 목록을 반환합니다.
+
+        Args:
+            chunk: LLM이 내보낸 텍스트 조각
+
+        Returns:
+            이번 조각으로 완성된 객체 리스트
+        """
+        self._text += chunk
+        completed = []
+
+        while self._pos < len(self._text) and not self.done:
+            i = self._pos
+            ch = self._text[i]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"' and self._stack:
+                self._in_string = True
+            elif ch in "{[":
+                if ch == "[" and self._array_depth is None and self._is_target_array(i):
+                    self._array_depth = len(self._stack) + 1
+                elif ch == "{" and self._array_depth is not None and len(self._stack) == self._array_depth:
+                    self._object_start = i
+                self._stack.append(ch)
+            elif ch in "}]" and self._stack:
+                self._stack.pop()
+                depth = len(self._stack)
+
+                if ch == "}" and self._object_start is not None and depth == self._array_depth:
+                    obj = self._load(self._text[self._object_start:i + 1])
+                    if obj is not None:
+                        completed.append(obj)
+                    self._object_start = None
+                elif ch == "]" and self._array_depth is not None and depth == self._array_depth - 1:
+                    self.done = True
+
+        return completed
+
+    def _is_target_array(self, index: int) -> bool:
+        """``index`` 위치의 '['가 대상 배열의 시작인지 판단"""
+        if not self._stack:
+            return True
+        return bool(self._key_pattern.search(self._text[:index]))
+
+    def _load(self, text: str) -> Optional[Dict[str, Any]]:
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError as e:
+            self.errors.append(str(e))
+            return None
+        return obj if isinstance(obj, dict) else None
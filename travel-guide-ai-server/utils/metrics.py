@@ -0,0 +1,406 @@
+"""
+지연 시간 계측 및 메트릭
+
+- ``span(stage)``: 코드 구간의 소요 시간을 측정해 전역 히스토그램에 기록
+- ``collect_request_trace()``: 요청 하나 동안의 단계별 시간과 LLM 토큰 사용량 수집
+- ``metrics.render_prometheus()``: Prometheus 텍스트 형식으로 내보내기
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+METRIC_PREFIX = "travel_guide"
+
+# 초 단위 히스토그램 버킷
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 백분위 계산에 사용할 최근 샘플 수
+RESERVOIR_SIZE = 2048
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class LatencyHistogram:
+    """
+    고정 버킷 히스토그램
+
+    누적 버킷 카운트와 함께 최근 샘플을 보관해 p50/p95/p99를 계산합니다.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, reservoir_size: int = RESERVOIR_SIZE):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._recent: deque = deque(maxlen=reservoir_size)
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self._recent.append(value)
+
+    def percentile(self, q: float) -> float:
+        """최근 샘플 기준 백분위 (0.0 ~ 1.0)"""
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        index = min(int(q * len(ordered)), len(ordered) - 1)
+        return ordered[index]
+
+
+class MetricsRegistry:
+    """프로세스 전역 메트릭 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, Labels], LatencyHistogram] = {}
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._gauges: Dict[Tuple[str, Labels], float] = {}
+        self._help: Dict[str, str] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, Dict[str, str], float]]]] = []
+
+    def describe(self, name: str, help_text: str) -> None:
+        """메트릭 설명 등록 (# HELP)"""
+        self._help[name] = help_text
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """히스토그램에 관측값 기록"""
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """카운터 증가"""
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """게이지 값 설정"""
+        with self._lock:
+            self._gauges[(name, _labels(labels))] = value
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, str, Dict[str, str], float]]]) -> None:
+        """
+        내보내기 시점에 값을 계산하는 수집기 등록
+
+        수집기는 ``(이름, 타입(counter/gauge), 라벨, 값)`` 튜플을 반환합니다.
+        캐시 hit/miss처럼 다른 객체가 이미 세고 있는 값을 노출할 때 사용합니다.
+        """
+        self._collectors.append(collector)
+
+    def percentiles(self, name: str, **labels: str) -> Dict[str, float]:
+        """히스토그램의 p50/p95/p99"""
+        histogram = self._histograms.get((name, _labels(labels)))
+        if histogram is None:
+            return {}
+        return {f"p{int(q * 100)}": histogram.percentile(q) for q in QUANTILES}
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        lines: List[str] = []
+        typed: set = set()
+
+        def header(name: str, metric_type: str):
+            if name in typed:
+                return
+            typed.add(name)
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+
+            for (name, labels), value in counters:
+                full = _full_name(name)
+                header(full, "counter")
+                lines.append(f"{full}{_format_labels(labels)} {_format_value(value)}")
+
+            for (name, labels), value in gauges:
+                full = _full_name(name)
+                header(full, "gauge")
+                lines.append(f"{full}{_format_labels(labels)} {_format_value(value)}")
+
+            for (name, labels), histogram in histograms:
+                full = _full_name(name)
+                header(full, "histogram")
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                    cumulative += count
+                    lines.append(f"{full}_bucket{_format_labels(labels + (('le', repr(bound)),))} {cumulative}")
+                lines.append(f"{full}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                lines.append(f"{full}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                lines.append(f"{full}_count{_format_labels(labels)} {histogram.count}")
+
+            # 백분위는 별도 summary로 노출
+            for (name, labels), histogram in histograms:
+                full = _full_name(f"{name}_quantiles")
+                header(full, "summary")
+                for q in QUANTILES:
+                    quantile_labels = labels + (("quantile", str(q)),)
+                    lines.append(f"{full}{_format_labels(quantile_labels)} {_format_value(histogram.percentile(q))}")
+                lines.append(f"{full}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                lines.append(f"{full}_count{_format_labels(labels)} {histogram.count}")
+
+        for collector in self._collectors:
+            for name, metric_type, labels, value in collector():
+                full = _full_name(name)
+                header(full, metric_type)
+                lines.append(f"{full}{_format_labels(_labels(labels))} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """모든 측정값 초기화 (수집기는 유지)"""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _full_name(name: str) -> str:
+    return f"{METRIC_PREFIX}_{name}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# 전역 메트릭 저장소
+metrics = MetricsRegistry()
+metrics.describe(f"{METRIC_PREFIX}_stage_duration_seconds", "단계별 소요 시간")
+metrics.describe(f"{METRIC_PREFIX}_llm_tokens_total", "LLM 토큰 사용량")
+metrics.describe(f"{METRIC_PREFIX}_requests_total", "API 요청 수")
+metrics.describe(f"{METRIC_PREFIX}_output_parse_total", "출력 모드별 응답 파싱 결과 (ok, coerced, repaired, partial, failed)")
+metrics.describe(f"{METRIC_PREFIX}_output_repair_calls_total", "출력 보정 LLM 호출 수")
+metrics.describe(f"{METRIC_PREFIX}_output_repair_tokens_total", "출력 보정 호출에 쓴 토큰 수")
+metrics.describe(f"{METRIC_PREFIX}_model_tier_duration_seconds", "모델 티어별 실행(시도) 소요 시간")
+metrics.describe(f"{METRIC_PREFIX}_model_tier_escalations_total", "모델 티어 상향 횟수 (사유별)")
+metrics.describe(f"{METRIC_PREFIX}_model_tier_cost_usd_total", "모델 티어별 추정 LLM 비용 (USD)")
+metrics.describe(f"{METRIC_PREFIX}_startup_seconds", "서버 시작(Agent 생성 및 워밍업) 소요 시간")
+metrics.describe(f"{METRIC_PREFIX}_outbound_attempts_total", "외부(LLM 제공자) 호출 시도 결과 (ok, retryable_error, error, deadline, cancelled, rejected)")
+metrics.describe(f"{METRIC_PREFIX}_outbound_retries_total", "외부 호출 재시도 횟수")
+metrics.describe(f"{METRIC_PREFIX}_outbound_circuit_state", "서킷 브레이커 상태 (0: closed, 1: half_open, 2: open)")
+metrics.describe(f"{METRIC_PREFIX}_admission_wait_seconds", "우선순위별 실행 슬롯 대기 시간")
+metrics.describe(f"{METRIC_PREFIX}_admission_rejected_total", "수락 거절 수 (queue_full, queue_timeout, evicted)")
+metrics.describe(f"{METRIC_PREFIX}_admission_queue_depth", "우선순위별 대기 중인 요청 수")
+metrics.describe(f"{METRIC_PREFIX}_admission_in_flight", "Agent를 실행 중인 추천 요청 수")
+metrics.describe(f"{METRIC_PREFIX}_jobs_submitted_total", "우선순위별 등록된 비동기 추천 작업 수")
+metrics.describe(f"{METRIC_PREFIX}_jobs_rejected_total", "대기열이 가득 차 거절된 비동기 추천 작업 수")
+metrics.describe(f"{METRIC_PREFIX}_jobs_finished_total", "완료된 비동기 추천 작업 수 (succeeded, failed)")
+metrics.describe(f"{METRIC_PREFIX}_job_run_seconds", "비동기 추천 작업 실행 시간")
+metrics.describe(f"{METRIC_PREFIX}_jobs_queued", "실행을 기다리는 비동기 추천 작업 수")
+metrics.describe(f"{METRIC_PREFIX}_jobs_running", "실행 중인 비동기 추천 작업 수")
+metrics.describe(f"{METRIC_PREFIX}_client_disconnects_total", "응답 전에 클라이언트 연결이 끊긴 요청 수")
+metrics.describe(f"{METRIC_PREFIX}_cancelled_runs_total", "클라이언트 연결 종료 등으로 중간에 취소한 Agent 실행 수")
+metrics.describe(f"{METRIC_PREFIX}_cancelled_tokens_saved_total", "취소로 생성하지 않은 출력 토큰 수 (완료된 실행의 평균 출력 토큰 기준 추정)")
+
+
+@dataclass
+class RequestTrace:
+    """요청 하나 동안 수집한 단계별 시간과 토큰 사용량"""
+
+    stages: List[Dict[str, Any]] = field(default_factory=list)
+    usage: Dict[str, int] = field(default_factory=lambda: {
+        "llmCalls": 0,
+        "inputTokens": 0,
+        "cachedInputTokens": 0,
+        "outputTokens": 0,
+        "totalTokens": 0,
+    })
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"stages": list(self.stages), "usage": dict(self.usage)}
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+
+@contextmanager
+def collect_request_trace() -> Iterator[RequestTrace]:
+    """
+    현재 컨텍스트(요청)의 단계 시간/토큰 사용량 수집을 시작합니다.
+
+    asyncio Task와 Tool 실행 스레드는 생성 시점의 컨텍스트를 복사하므로
+    같은 RequestTrace 객체에 기록됩니다.
+    """
+    trace = RequestTrace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """
+    코드 구간 소요 시간 측정
+
+    사용 예:
+        with span("llm_call"):
+            response = await llm.ainvoke(messages)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        metrics.observe("stage_duration_seconds", elapsed, stage=stage)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.stages.append({"stage": stage, "elapsedMs": round(elapsed * 1000, 3)})
+
+
+def timed(stage: str) -> Callable:
+    """
+    함수 전체를 ``span`` 으로 감싸는 데코레이터 (동기/비동기 함수 모두 지원)
+
+    ``@tool`` 아래에 두면 Tool 스키마는 원래 함수 시그니처로 만들어집니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def cached_input_tokens(message: Any) -> int:
+    """
+    입력 토큰 중 provider 측 prompt cache에서 읽은 토큰 수
+
+    ``usage_metadata.input_token_details.cache_read`` (langchain-core 0.2.4x 이후)를 우선 사용하고,
+    없으면 OpenAI 원본 응답의 ``token_usage.prompt_tokens_details.cached_tokens`` 를 읽습니다.
+    """
+    usage = getattr(message, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    if details.get("cache_read") is not None:
+        return details["cache_read"]
+
+    response_metadata = getattr(message, "response_metadata", None) or {}
+    token_usage = response_metadata.get("token_usage") or {}
+    prompt_details = token_usage.get("prompt_tokens_details") or {}
+    return prompt_details.get("cached_tokens") or 0
+
+
+def record_token_usage(message: Any) -> Dict[str, int]:
+    """
+    LLM 응답 메시지의 토큰 사용량을 전역 카운터와 현재 요청 trace에 기록합니다.
+
+    Returns:
+        이번 응답의 사용량 (정보가 없으면 빈 dict)
+    """
+    usage = getattr(message, "usage_metadata", None) or {}
+    input_tokens = usage.get("input_tokens", 0)
+    output_tokens = usage.get("output_tokens", 0)
+    cached_tokens = cached_input_tokens(message)
+
+    metrics.inc("llm_calls_total")
+    if input_tokens:
+        metrics.inc("llm_tokens_total", input_tokens, type="input")
+    if cached_tokens:
+        metrics.inc("llm_tokens_total", cached_tokens, type="cached_input")
+    if output_tokens:
+        metrics.inc("llm_tokens_total", output_tokens, type="output")
+
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.usage["llmCalls"] += 1
+        trace.usage["inputTokens"] += input_tokens
+        trace.usage["cachedInputTokens"] += cached_tokens
+        trace.usage["outputTokens"] += output_tokens
+        trace.usage["totalTokens"] += input_tokens + output_tokens
+
+    if not usage:
+        return {}
+    return {"inputTokens": input_tokens, "cachedInputTokens": cached_tokens, "outputTokens": output_tokens}
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """현재 컨텍스트(요청)의 RequestTrace (수집 중이 아니면 None)"""
+    return _current_trace.get()
+
+
+class RunTokenEstimate:
+    """
+    Agent 실행 한 번의 출력 토큰 수 (이동 평균)
+
+    실행이 중간에 취소되면(클라이언트 연결 종료 등) 평균과 그때까지 생성한 출력 토큰의 차이를
+    생성하지 않아 절약한 토큰으로 추정합니다.
+    """
+
+    def __init__(self, alpha: float = 0.1):
+        self.alpha = alpha
+        self.average: Optional[float] = None
+
+    def observe(self, output_tokens: int) -> None:
+        """끝까지 실행된 Agent 실행의 출력 토큰 수 기록"""
+        if self.average is None:
+            self.average = float(output_tokens)
+        else:
+            self.average += self.alpha * (output_tokens - self.average)
+
+    def record_cancelled(self, output_tokens: int) -> int:
+        """
+        취소된 실행 기록
+
+        Args:
+            output_tokens: 취소 전까지 생성한 출력 토큰 수
+
+        Returns:
+            절약한 출력 토큰 추정치
+        """
+        saved = max(0, round((self.average or 0.0) - output_tokens))
+        metrics.inc("cancelled_runs_total")
+        if saved:
+            metrics.inc("cancelled_tokens_saved_total", saved)
+        return saved
+
+
+# 전역 실행당 출력 토큰 추정치
+run_tokens = RunTokenEstimate()
@@ -0,0 +1,431 @@
+"""
+외부 API(LLM 제공자) 호출 계층
+
+- 공유 연결 풀: keep-alive 연결을 재사용하는 ``httpx.AsyncClient`` 하나를 모든 모델이 함께 사용
+  (``h2`` 패키지가 있으면 HTTP/2)
+- 요청 마감 시간(deadline): 라우터가 정한 전체 제한 시간을 ContextVar로 전달하고,
+  LLM 호출마다 남은 시간만큼만 기다림
+- 재시도: 429/5xx/연결 오류만 지수 백오프 + full jitter로 제한 횟수만큼 (``Retry-After`` 우선)
+- 서킷 브레이커: 연속 실패가 임계값에 닿으면 일정 시간 호출 없이 바로 실패 (API는 503)
+- 재시도를 다 써도 429/5xx/연결 오류가 계속되면 ``ProviderUnavailable`` (API는 502/503, 제공자 응답 본문은 노출하지 않음)
+"""
+
+import asyncio
+import importlib.util
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+import httpx
+import openai
+
+from config.settings import settings
+from utils.metrics import metrics
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = (408, 409, 429)
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """요청 마감 시간 초과"""
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 호출하지 않고 실패"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 호출이 일시적으로 차단되었습니다. ({retry_after:.1f}초 후 재시도)")
+        self.retry_after = retry_after
+
+
+class ProviderUnavailable(Exception):
+    """
+    재시도 대상 오류(429/5xx/연결 오류)가 재시도 후에도 계속됨
+
+    ``status_code`` 는 API가 돌려줄 상태 코드입니다. 제공자가 과부하(429/503)를 알렸으면 503,
+    그 밖의 5xx와 연결/타임아웃 오류는 502입니다. 원래 오류는 ``__cause__`` 에 남습니다.
+    """
+
+    def __init__(self, name: str, retry_after: float, status_code: int = 503):
+        super().__init__(f"{name} 제공자가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해주세요.")
+        self.retry_after = retry_after
+        self.status_code = status_code
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    이 구간의 모든 외부 호출에 적용할 마감 시간 설정
+
+    이미 더 이른 마감 시간이 있으면 그것을 유지합니다. ``seconds`` 가 None이거나 0 이하면 제한하지 않습니다.
+    """
+    if seconds is None or seconds <= 0:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_remaining() -> Optional[float]:
+    """남은 시간 (초, 마감 시간이 없으면 None)"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+async def with_deadline(awaitable: Awaitable[T]) -> T:
+    """
+    남은 시간 안에 끝나지 않으면 ``DeadlineExceeded``
+
+    Raises:
+        DeadlineExceeded: 마감 시간 초과
+    """
+    remaining = deadline_remaining()
+    if remaining is None:
+        return await awaitable
+    if remaining <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded("요청 마감 시간이 지났습니다.")
+    try:
+        return await asyncio.wait_for(awaitable, timeout=remaining)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded(f"요청 마감 시간을 초과했습니다. (남은 시간 {remaining:.2f}초)") from None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """재시도할 오류인지 (429, 5xx, 연결/타임아웃 오류)"""
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS or error.status_code >= 500
+    return isinstance(error, (openai.APIConnectionError, httpx.TransportError))
+
+
+def _unavailable_status(error: BaseException) -> int:
+    """재시도를 다 쓴 오류의 API 상태 코드 (제공자 과부하 503, 그 밖의 5xx/연결 오류 502)"""
+    if isinstance(error, openai.APIStatusError) and error.status_code in (429, 503):
+        return 503
+    return 502
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """응답의 ``Retry-After`` 헤더 (초)"""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책"""
+
+    max_retries: int = 2
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def backoff(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """``attempt`` 번째(0부터) 재시도 전 대기 시간"""
+        hinted = retry_after(error) if error is not None else None
+        if hinted is not None:
+            return min(hinted, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+
+    - closed: 정상 호출. 재시도 대상 오류가 ``failure_threshold`` 번 연속되면 open
+    - open: ``reset_timeout`` 동안 호출 없이 ``CircuitOpenError``
+    - half_open: 시험 호출 하나만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    _STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0  # 열린 상태에서 바로 실패시킨 호출 수
+        self.opened = 0  # open으로 바뀐 횟수
+        metrics.set_gauge("outbound_circuit_state", 0, provider=name)
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._transition(self.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """다시 호출할 수 있을 때까지 남은 시간 (초)"""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def check(self) -> None:
+        """
+        호출 가능 여부만 확인 (시험 호출 슬롯은 쓰지 않음)
+
+        Raises:
+            CircuitOpenError: 열려 있거나 시험 호출이 진행 중
+        """
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._probe_in_flight):
+            self.rejected += 1
+            metrics.inc("outbound_attempts_total", provider=self.name, outcome="rejected")
+            raise CircuitOpenError(self.name, self.retry_after() or self.reset_timeout)
+
+    def allow(self) -> None:
+        """
+        호출 시작 (half_open이면 시험 호출 슬롯을 차지)
+
+        Raises:
+            CircuitOpenError: 호출할 수 없음
+        """
+        self.check()
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        if self._state != self.CLOSED:
+            self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            if self._state != self.OPEN:
+                self.opened += 1
+            self._transition(self.OPEN)
+
+    def release(self) -> None:
+        """결과를 판단할 수 없는 호출 종료 (마감 시간 초과, 취소)"""
+        self._probe_in_flight = False
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        metrics.set_gauge("outbound_circuit_state", self._STATE_VALUES[state], provider=self.name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutiveFailures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "retryAfter": round(self.retry_after(), 3),
+        }
+
+
+class OutboundClient:
+    """
+    외부 호출 하나를 마감 시간, 재시도, 서킷 브레이커로 감쌉니다.
+
+    사용 예:
+        response = await outbound.call(lambda: llm.ainvoke(messages))
+        async for chunk in outbound.stream(lambda: llm.astream(messages)):
+            ...
+    """
+
+    def __init__(self, breaker: CircuitBreaker, retry: Optional[RetryPolicy] = None):
+        self.breaker = breaker
+        self.retry = retry or RetryPolicy()
+        self.retries = 0
+
+    @classmethod
+    def from_settings(cls, name: str = "llm") -> "OutboundClient":
+        """settings.LLM_* 값으로 생성"""
+        return cls(
+            CircuitBreaker(
+                name,
+                failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=settings.LLM_CIRCUIT_RESET_TIMEOUT
+            ),
+            RetryPolicy(
+                max_retries=settings.LLM_MAX_RETRIES,
+                base_delay=settings.LLM_RETRY_BASE_DELAY,
+                max_delay=settings.LLM_RETRY_MAX_DELAY
+            )
+        )
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        ``fn()`` 을 실행하고 재시도 대상 오류면 백오프 후 다시 실행
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있음
+            DeadlineExceeded: 요청 마감 시간 초과
+            ProviderUnavailable: 재시도 후에도 429/5xx/연결 오류
+        """
+        attempt = 0
+        while True:
+            self.breaker.allow()
+            try:
+                result = await with_deadline(fn())
+            except BaseException as e:
+                await self._on_error(e, attempt)
+                attempt += 1
+                continue
+            self._on_success()
+            return result
+
+    async def stream(self, fn: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """
+        스트리밍 호출
+
+        첫 청크를 받기 전의 실패만 재시도합니다. 이미 내보낸 청크는 되돌릴 수 없으므로
+        스트림 도중의 오류는 그대로 전달합니다.
+        """
+        attempt = 0
+        while True:
+            self.breaker.allow()
+            iterator = fn().__aiter__()
+            try:
+                first = await with_deadline(iterator.__anext__())
+            except StopAsyncIteration:
+                self._on_success()
+                return
+            except BaseException as e:
+                await _aclose(iterator)
+                await self._on_error(e, attempt)
+                attempt += 1
+                continue
+            break
+
+        self._on_success()
+        try:
+            yield first
+            while True:
+                try:
+                    chunk = await with_deadline(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            await _aclose(iterator)
+
+    def _on_success(self) -> None:
+        self.breaker.record_success()
+        metrics.inc("outbound_attempts_total", provider=self.breaker.name, outcome="ok")
+
+    async def _on_error(self, error: BaseException, attempt: int) -> None:
+        """
+        실패한 시도 처리: 재시도할 수 있으면 백오프만큼 기다리고, 아니면 오류를 다시 발생
+
+        재시도 대상 오류인데 더 재시도할 수 없으면 ``ProviderUnavailable`` 로 바꿔 발생시킵니다.
+        """
+        name = self.breaker.name
+        if isinstance(error, (DeadlineExceeded, asyncio.CancelledError)):
+            self.breaker.release()
+            outcome = "deadline" if isinstance(error, DeadlineExceeded) else "cancelled"
+            metrics.inc("outbound_attempts_total", provider=name, outcome=outcome)
+            raise error
+        if not is_retryable(error):
+            # 4xx 같은 응답은 제공자가 정상 동작한 것이므로 서킷 상태에는 성공으로 기록
+            self.breaker.record_success()
+            metrics.inc("outbound_attempts_total", provider=name, outcome="error")
+            raise error
+
+        self.breaker.record_failure()
+        metrics.inc("outbound_attempts_total", provider=name, outcome="retryable_error")
+        delay = self.retry.backoff(attempt, error)
+        remaining = deadline_remaining()
+        if (
+            attempt >= self.retry.max_retries
+            or self.breaker.state == CircuitBreaker.OPEN
+            or (remaining is not None and remaining <= delay)
+        ):
+            hinted = retry_after(error)
+            if hinted is None:
+                hinted = self.breaker.retry_after() if self.breaker.state == CircuitBreaker.OPEN else delay
+            raise ProviderUnavailable(name, hinted, _unavailable_status(error)) from error
+
+        self.retries += 1
+        metrics.inc("outbound_retries_total", provider=name)
+        print(f"⚠️ {name} 호출 실패, {delay:.2f}초 후 재시도 ({attempt + 1}/{self.retry.max_retries}): {error!r}")
+        await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"retries": self.retries, "circuit": self.breaker.stats()}
+
+
+async def _aclose(iterator: Any) -> None:
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
+
+
+# 공유 HTTP 클라이언트 (프로세스당 하나)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def outbound_timeout() -> httpx.Timeout:
+    """LLM 호출 한 번의 제한 시간 (요청 마감 시간이 더 짧으면 그쪽이 먼저 적용)"""
+    return httpx.Timeout(settings.LLM_READ_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    LLM 제공자 호출용 공유 ``httpx.AsyncClient`` 반환 (싱글톤 패턴)
+
+    모든 모델 티어가 같은 연결 풀을 쓰므로 TCP/TLS 연결이 요청 사이에 재사용됩니다.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        http2 = settings.LLM_HTTP2 and http2_available()
+        if settings.LLM_HTTP2 and not http2:
+            print("⚠️ LLM_HTTP2=True 이지만 h2 패키지가 없어 HTTP/1.1 keep-alive 연결을 사용합니다.")
+        _http_client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY
+            ),
+            timeout=outbound_timeout()
+        )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (서버 종료 시)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -0,0 +1,97 @@
+"""
+요청 수 제한 (rate limit)
+
+클라이언트별로 고정 창(fixed window) 안의 요청 수를 공유 상태 카운터로 셉니다.
+카운터가 공유 상태에 있으므로 Redis 백엔드를 쓰면 모든 워커가 같은 한도를 나눠 씁니다.
+
+클라이언트는 접속 IP로 식별합니다. 요청 헤더는 누구나 바꿔 보낼 수 있으므로 ``X-Client-Id`` /
+``X-Forwarded-For`` 는 신뢰 프록시(``trusted_proxies``)를 거쳐 들어온 요청에서만 사용합니다.
+"""
+
+import ipaddress
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+from utils.shared_state import SharedState
+
+
+class RateLimiter:
+    """
+    클라이언트별 고정 창 요청 수 제한
+
+    사용 예:
+        allowed, retry_after = await limiter.hit(client_id)
+        allowed, retry_after = await limiter.hit(client_id, cost=len(items))   # 일괄 요청
+    """
+
+    def __init__(self, state: SharedState, limit: int, window: int = 60, trusted_proxies: Iterable[str] = ()):
+        self.state = state
+        self.limit = limit
+        self.window = max(1, window)
+        self.trusted_proxies: List[Network] = [
+            ipaddress.ip_network(proxy, strict=False) for proxy in trusted_proxies
+        ]
+        self.limited = 0
+        self.errors = 0
+
+    def client_id(self, peer: Optional[str], headers: Mapping[str, str]) -> str:
+        """
+        요청 수 제한에 쓸 클라이언트 식별자
+
+        - 접속 IP(``peer``)가 신뢰 프록시가 아니면 접속 IP
+        - 신뢰 프록시면 프록시가 설정한 ``X-Client-Id`` (인증된 사용자 등), 없으면 ``X-Forwarded-For`` 를
+          오른쪽부터 읽어 처음 나오는 신뢰 프록시가 아닌 IP (왼쪽 값은 클라이언트가 꾸밀 수 있음)
+        """
+        if peer is None:
+            return "unknown"
+        if not self._is_trusted(peer):
+            return peer
+        if headers.get("x-client-id"):
+            return f"id:{headers['x-client-id']}"
+        hops = [hop.strip() for hop in headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not self._is_trusted(hop):
+                return hop
+        return peer
+
+    def _is_trusted(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+    async def hit(self, client: str, cost: int = 1) -> Tuple[bool, float]:
+        """
+        요청 하나를 ``cost`` 건으로 세고 허용 여부 반환
+
+        공유 상태 장애 시에는 요청을 막지 않습니다.
+
+        Returns:
+            (허용 여부, 다음 창까지 남은 시간(초))
+        """
+        now = time.time()
+        window_index = int(now // self.window)
+        retry_after = self.window - (now % self.window)
+        try:
+            count = await self.state.incr(f"ratelimit:{client}:{window_index}", max(1, cost), ttl=self.window)
+        except Exception as e:
+            print(f"요청 수 제한 카운터 오류: {e}")
+            self.errors += 1
+            return True, 0.0
+
+        if count > self.limit:
+            self.limited += 1
+            return False, retry_after
+        return True, retry_after
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "windowSeconds": self.window,
+            "trustedProxies": [str(network) for network in self.trusted_proxies],
+            "limited": self.limited,
+            "errors": self.errors,
+        }
@@ -0,0 +1,44 @@
+"""
+응답 직렬화
+
+Agent가 돌려주는 여행지는 생성 단계에서 ``DestinationInfo`` 로 한 번 검증된 딕셔너리입니다.
+라우터는 이를 다시 Pydantic 모델로 만들지 않고 ``FastJSONResponse`` 로 바로 직렬화하며,
+Response 객체를 반환하므로 FastAPI의 ``response_model`` 재검증/재직렬화도 건너뜁니다.
+(``response_model`` 은 OpenAPI 문서용으로만 남겨 둡니다.)
+
+orjson이 있으면 orjson으로, 없으면 표준 json으로 직렬화합니다.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 requirements에 있지만 없어도 동작
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 바이트로 직렬화 (한글은 이스케이프하지 않음)"""
+    if orjson is not None:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def dumps_str(content: Any) -> str:
+    """JSON 문자열로 직렬화 (SSE 이벤트, 캐시 저장용)"""
+    return dumps(content).decode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    ``dumps`` 로 직렬화하는 JSON 응답
+
+    ``jsonable_encoder`` 를 거치지 않으므로 content는 JSON으로 바로 직렬화할 수 있는
+    dict/list여야 합니다. (datetime은 ``isoformat()`` 문자열로 넣으세요)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,147 @@
+"""
+워커 간 공유 상태
+
+여러 uvicorn 워커(프로세스)가 함께 보는 상태를 하나의 인터페이스로 다룹니다.
+
+- 키/값 + TTL: 추천 결과 캐시
+- 카운터: 요청 수 제한(rate limit) 창별 카운트
+- 잠금: 워커 간 요청 병합(single-flight)
+
+``memory`` 는 프로세스 안에서만 공유되고, ``redis`` 는 모든 워커가 같은 Redis를 봅니다.
+``fakeredis`` 는 Redis 경로를 네트워크 없이 시험하기 위한 프로세스 내부 대체품입니다.
+"""
+
+import time
+from abc import abstractmethod
+from typing import Any, Callable, Dict, Optional
+
+from utils.cache import CacheBackend, FakeRedis, InMemoryCacheBackend, RedisCacheBackend
+
+BACKENDS = ("memory", "redis", "fakeredis")
+
+
+class SharedState(CacheBackend):
+    """캐시(get/set/delete)에 카운터와 잠금을 더한 공유 상태 인터페이스"""
+
+    # 여러 워커가 실제로 상태를 공유하는지 (memory/fakeredis는 False)
+    shared_across_workers = False
+
+    @abstractmethod
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[int] = None) -> int:
+        """
+        카운터 증가 후 값 반환
+
+        키가 새로 만들어질 때만 ``ttl`` 초 뒤 만료되도록 설정합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        """``key`` 가 비어 있으면 ``token`` 으로 ``ttl`` 초 동안 잠그고 True"""
+        pass
+
+    @abstractmethod
+    async def release_lock(self, key: str, token: str) -> bool:
+        """``token`` 으로 잡은 잠금이면 해제하고 True"""
+        pass
+
+
+class InMemorySharedState(InMemoryCacheBackend, SharedState):
+    """프로세스 내부 공유 상태 (워커 하나 또는 개발용)"""
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_entries=max_entries, clock=clock)
+        self._counters: Dict[str, tuple] = {}
+        self._locks: Dict[str, tuple] = {}
+
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[int] = None) -> int:
+        now = self._clock()
+        expires_at, value = self._counters.get(key, (None, 0))
+        if expires_at is not None and expires_at <= now:
+            expires_at, value = None, 0
+        if value == 0 and ttl:
+            expires_at = now + ttl
+        value += amount
+        self._counters[key] = (expires_at, value)
+        # 만료된 카운터 정리 (창이 바뀔 때마다 키가 새로 생기므로)
+        if len(self._counters) > self.max_entries:
+            self._counters = {
+                k: entry for k, entry in self._counters.items() if entry[0] is None or entry[0] > now
+            }
+        return value
+
+    async def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        now = self._clock()
+        current = self._locks.get(key)
+        if current is not None and current[0] > now:
+            return False
+        self._locks[key] = (now + ttl, token)
+        return True
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        current = self._locks.get(key)
+        if current is None or current[1] != token:
+            return False
+        del self._locks[key]
+        return True
+
+
+class RedisSharedState(RedisCacheBackend, SharedState):
+    """
+    Redis 호환 클라이언트 기반 공유 상태
+
+    카운터는 ``INCRBY`` + ``EXPIRE``, 잠금은 ``SET NX EX`` 를 사용합니다.
+    """
+
+    shared_across_workers = True
+
+    def __init__(self, client: Any, namespace: str = "travel-guide"):
+        super().__init__(client, namespace)
+        if isinstance(client, FakeRedis):
+            self.shared_across_workers = False
+
+    async def incr(self, key: str, amount: int = 1, ttl: Optional[int] = None) -> int:
+        value = int(await self.client.incrby(self._key(key), amount))
+        if ttl and value == amount:
+            await self.client.expire(self._key(key), ttl)
+        return value
+
+    async def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        return bool(await self.client.set(self._key(key), token, ex=max(1, int(ttl)), nx=True))
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        # 확인과 삭제 사이에 잠금이 만료되어 다른 워커가 잡을 수 있지만,
+        # 그 경우에도 잠금은 TTL로 다시 풀리고 결과는 캐시로 공유되므로 중복 실행 한 번에 그칩니다.
+        current = await self.client.get(self._key(key))
+        if isinstance(current, bytes):
+            current = current.decode("utf-8")
+        if current != token:
+            return False
+        await self.client.delete(self._key(key))
+        return True
+
+
+def create_shared_state(backend: str, max_entries: int = 1024, redis_url: str = "") -> SharedState:
+    """
+    설정 값으로 공유 상태 생성
+
+    Args:
+        backend: "memory", "redis" 또는 "fakeredis"
+        max_entries: 메모리 백엔드 최대 항목 수
+        redis_url: Redis 접속 URL ("redis" 백엔드)
+
+    Returns:
+        SharedState 인스턴스
+    """
+    backend = backend.lower()
+
+    if backend == "memory":
+        return InMemorySharedState(max_entries=max_entries)
+    if backend == "fakeredis":
+        return RedisSharedState(FakeRedis())
+    if backend == "redis":
+        # redis 패키지는 Redis 백엔드를 사용할 때만 필요합니다.
+        import redis.asyncio as redis
+        return RedisSharedState(redis.from_url(redis_url, decode_responses=True))
+
+    raise ValueError(f"지원하지 않는 공유 상태 백엔드입니다: {backend} (지원: {', '.join(BACKENDS)})")
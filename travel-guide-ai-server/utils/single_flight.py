@@ -0,0 +1,197 @@
+"""
+요청 병합 (single-flight)
+
+같은 키로 동시에 들어온 작업은 하나만 실행하고, 나머지는 그 결과를 함께 기다립니다.
+실행 중 발생한 예외는 기다리던 모든 호출자에게 그대로 전달됩니다.
+
+실행은 별도 Task에서 진행되고 기다리는 호출자 수를 셉니다. 호출자 하나가 취소되어도
+(클라이언트 연결 종료 등) 다른 호출자가 남아 있으면 실행은 계속되고, 마지막 호출자까지 취소되면
+실행도 취소합니다.
+
+``SharedSingleFlight`` 는 여기에 공유 상태 잠금을 더해 여러 워커(프로세스) 사이에서도
+같은 키를 한 번만 실행하고, 다른 워커의 결과는 공유 캐시에서 받아 옵니다.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """진행 중인 실행 하나와 그 결과를 기다리는 호출자 수"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    키 단위 in-flight 중복 제거
+
+    사용 예:
+        result, shared = await flight.do(key, lambda: agent.run(payload))
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self.executions = 0  # 실제로 실행된 작업 수
+        self.coalesced = 0  # 다른 실행 결과를 공유받은 호출 수
+        self.errors = 0  # 실패한 실행 수
+        self.cancelled = 0  # 기다리는 호출자가 모두 취소되어 중단한 실행 수
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        ``key`` 에 대한 작업을 실행하거나 진행 중인 실행에 합류합니다.
+
+        Args:
+            key: 작업 식별 키
+            fn: 실행할 코루틴을 만드는 함수
+
+        Returns:
+            (결과, 다른 실행 결과를 공유받았는지 여부)
+        """
+        call = self._calls.get(key)
+        shared = call is not None
+        if shared:
+            self.coalesced += 1
+        else:
+            # 실행 Task는 처음 호출한 쪽의 컨텍스트(마감 시간, 계측)를 물려받음
+            call = _Call(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda task: self._finished(key, call))
+            self._calls[key] = call
+            self.executions += 1
+
+        call.waiters += 1
+        try:
+            # shield: 호출자 하나가 취소되어도 실행 Task는 취소되지 않음
+            return await asyncio.shield(call.task), shared
+        except asyncio.CancelledError:
+            # 이 호출자만 취소됨: 마지막으로 기다리던 호출자면 실행도 취소
+            if not call.task.done():
+                call.waiters -= 1
+                if call.waiters == 0:
+                    call.task.cancel()
+            raise
+
+    def _finished(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if call.task.cancelled():
+            self.cancelled += 1
+        elif call.task.exception() is not None:
+            # 조회해 두어 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            self.errors += 1
+
+    @property
+    def in_flight(self) -> int:
+        """현재 실행 중인 키 수"""
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 통계"""
+        return {
+            "inFlight": self.in_flight,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "cancelled": self.cancelled,
+        }
+
+
+class SharedSingleFlight(SingleFlight):
+    """
+    워커 간 요청 병합
+
+    프로세스 안에서는 ``SingleFlight`` 로 먼저 합치고, 실행을 맡은 요청만 공유 상태 잠금
+    ``flight:{key}`` 를 잡습니다. 잠금을 못 잡으면 다른 워커가 실행 중이므로 그 결과가
+    공유 캐시에 들어올 때까지 ``poll_interval`` 간격으로 확인하고, ``wait_timeout`` 이 지나도
+    없으면 직접 실행합니다.
+
+    사용 예:
+        result, shared = await flight.do(key, lambda: agent.run(payload), lambda: cache.peek(payload))
+    """
+
+    def __init__(self, state: Any, lock_ttl: float = 60.0, poll_interval: float = 0.1, wait_timeout: float = 30.0):
+        super().__init__()
+        self.state = state
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self.wait_timeout = wait_timeout
+        self.remote_coalesced = 0  # 다른 워커의 실행 결과를 받은 호출 수
+        self.lock_errors = 0
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        fetch: Optional[Callable[[], Awaitable[Optional[T]]]] = None
+    ) -> Tuple[T, bool]:
+        """
+        ``key`` 에 대한 작업을 실행하거나 (다른 워커 포함) 진행 중인 실행에 합류합니다.
+
+        Args:
+            key: 작업 식별 키
+            fn: 실행할 코루틴을 만드는 함수
+            fetch: 다른 워커가 저장한 결과를 조회하는 함수 (없으면 프로세스 안에서만 병합)
+
+        Returns:
+            (결과, 다른 실행 결과를 공유받았는지 여부)
+        """
+        if fetch is None:
+            return await super().do(key, fn)
+        (result, remote), coalesced = await super().do(key, lambda: self._run_locked(key, fn, fetch))
+        return result, remote or coalesced
+
+    async def _run_locked(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        fetch: Callable[[], Awaitable[Optional[T]]]
+    ) -> Tuple[T, bool]:
+        lock_key = f"flight:{key}"
+        token = uuid.uuid4().hex
+        give_up_at = time.monotonic() + self.wait_timeout
+
+        while True:
+            try:
+                acquired = await self.state.acquire_lock(lock_key, token, self.lock_ttl)
+            except Exception as e:
+                # 공유 상태 장애 시에는 병합 없이 실행
+                print(f"요청 병합 잠금 오류: {e}")
+                self.lock_errors += 1
+                return await fn(), False
+
+            if acquired:
+                try:
+                    # 잠금을 잡기 직전에 다른 워커가 끝냈을 수 있음
+                    cached = await fetch()
+                    if cached is not None:
+                        self.remote_coalesced += 1
+                        return cached, True
+                    return await fn(), False
+                finally:
+                    try:
+                        await self.state.release_lock(lock_key, token)
+                    except Exception as e:
+                        print(f"요청 병합 잠금 해제 오류: {e}")
+                        self.lock_errors += 1
+
+            cached = await fetch()
+            if cached is not None:
+                self.remote_coalesced += 1
+                return cached, True
+            if time.monotonic() >= give_up_at:
+                return await fn(), False
+            await asyncio.sleep(self.poll_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["remoteCoalesced"] = self.remote_coalesced
+        stats["lockErrors"] = self.lock_errors
+        return stats